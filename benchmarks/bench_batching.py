@@ -0,0 +1,122 @@
+"""
+Tune the micro-batching inference server (libiq.classifier.batching).
+
+Several producer threads, each standing in for one cell, submit preprocessed windows to one
+BatchingInferenceServer at a fixed rate. Every (max_batch_size, max_wait) pair of the grid is
+reported with its throughput, mean batch size and p50/p99 latency:
+
+    python benchmarks/bench_batching.py --producers 16 --rate 50 --max-waits 0,0.001,0.005
+
+The model is an untrained Classifier.make_model network unless --model-path is given.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+FFT_ROW = 1536
+
+
+def run_grid_point(
+    classifier: Any, features: np.ndarray, producers: int, rate: float, duration: float, max_batch_size: int, max_wait: float
+) -> Dict[str, Any]:
+    """
+    Drive one server configuration with producers threads for duration seconds.
+
+    Returns:
+        The server statistics together with the configuration.
+    """
+    from libiq.classifier.batching import BatchingInferenceServer
+
+    with BatchingInferenceServer(classifier, max_batch_size=max_batch_size, max_wait=max_wait) as server:
+        # Warm-up: one full batch traces the model for the batch shapes
+        for future in [server.submit(features[i % len(features)]) for i in range(max_batch_size)]:
+            future.result()
+        server.reset_stats()
+
+        def produce(index: int) -> None:
+            period = 1.0 / rate if rate > 0 else 0.0
+            deadline = time.perf_counter() + duration
+            next_submit = time.perf_counter()
+            while next_submit < deadline:
+                server.submit(features[index % len(features)]).result()
+                if period:
+                    next_submit += period
+                    time.sleep(max(0.0, next_submit - time.perf_counter()))
+                else:
+                    next_submit = time.perf_counter()
+
+        threads = [threading.Thread(target=produce, args=(i,)) for i in range(producers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = server.stats()
+    return {"max_batch_size": max_batch_size, "max_wait": max_wait, "producers": producers, "rate": rate, **stats}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    def int_list(value):
+        return [int(v) for v in value.split(",")]
+
+    def float_list(value):
+        return [float(v) for v in value.split(",")]
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-path", help="Keras, .tflite or .onnx model (default: untrained network).")
+    parser.add_argument("--producers", type=int, default=8, help="Number of producer threads (cells).")
+    parser.add_argument("--rate", type=float, default=0.0, help="Windows per second per producer (0: closed loop).")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per grid point.")
+    parser.add_argument("--max-batch-sizes", type=int_list, default=[8, 32], help="Server batch sizes.")
+    parser.add_argument("--max-waits", type=float_list, default=[0.0, 0.002, 0.01], help="Server deadlines in seconds.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "3")
+    from libiq.classifier.cnn import Classifier
+    from libiq.utils.constants import STATIC_LABELS
+    from libiq.utils.logger import logger
+
+    logger.setLevel("WARNING")
+    classifier = Classifier(model_path=args.model_path)
+    if classifier.model is None:
+        classifier.model = classifier.make_model(len(STATIC_LABELS), (classifier.extraction_window, 4))
+    rng = np.random.default_rng(0)
+    features = np.stack(
+        [
+            classifier.preprocessing(classifier.apply_energy_detector_to_data(rng.standard_normal((FFT_ROW, 2)) * 4000))
+            for _ in range(16)
+        ]
+    )
+
+    results = []
+    for max_batch_size, max_wait in itertools.product(args.max_batch_sizes, args.max_waits):
+        result = run_grid_point(
+            classifier, features, args.producers, args.rate, args.duration, max_batch_size, max_wait
+        )
+        results.append(result)
+        print(
+            f"batch {max_batch_size:4d}  wait {max_wait * 1e3:7.2f}ms  "
+            f"{result['throughput']:9.1f} req/s  mean batch {result['mean_batch_size']:6.2f}  "
+            f"p50 {result['latency_p50_ms']:8.2f}ms  p99 {result['latency_p99_ms']:8.2f}ms",
+            flush=True,
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Import-time benchmark for libiq.
+
+Every module is imported in a fresh interpreter, --repeat times, and the median wall time
+is compared against its start-up budget (BUDGETS, in seconds). The script also lists the
+heavy dependencies an import pulls in, which should stay empty until a model is built,
+loaded or plotted:
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 10 --output imports.json
+
+The exit status is 1 when a median exceeds its budget.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Median import time allowed per module, in seconds
+BUDGETS = {
+    "libiq": 0.5,
+    "libiq.classifier.cnn": 0.5,
+    "libiq.classifier.batching": 0.5,
+    "libiq.aio": 0.5,
+}
+
+# Dependencies that must only be imported on first use
+HEAVY_MODULES = ("tensorflow", "keras", "sklearn", "matplotlib", "seaborn", "scipy.signal", "pandas")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def time_import(module: str, repeat: int) -> Dict[str, Any]:
+    """
+    Import module in repeat fresh interpreters.
+
+    Returns:
+        The result record: median/min/max import time in seconds, the budget and the heavy
+        modules loaded by the import.
+    """
+    env = dict(os.environ, TF_CPP_MIN_LOG_LEVEL="3")
+    seconds, heavy = [], []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+        record = json.loads(output.strip().splitlines()[-1])
+        seconds.append(record["seconds"])
+        heavy = record["heavy"]
+    return {
+        "module": module,
+        "median_s": float(np.median(seconds)),
+        "min_s": float(np.min(seconds)),
+        "max_s": float(np.max(seconds)),
+        "budget_s": BUDGETS.get(module),
+        "heavy_modules": heavy,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", default=",".join(BUDGETS), help="Comma-separated modules (default: all budgeted).")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results, over_budget = [], []
+    for module in args.modules.split(","):
+        result = time_import(module, args.repeat)
+        results.append(result)
+        budget = result["budget_s"]
+        exceeded = budget is not None and result["median_s"] > budget
+        if exceeded:
+            over_budget.append(module)
+        print(
+            f"{module:<32} median {result['median_s'] * 1e3:8.1f}ms  "
+            f"budget {budget * 1e3 if budget is not None else float('nan'):8.1f}ms  "
+            f"heavy: {', '.join(result['heavy_modules']) or '-'}{'  !' if exceeded else ''}",
+            flush=True,
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results}, f, indent=2)
+    if over_budget:
+        print(f"\n{len(over_budget)} module(s) over their start-up budget.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""
+Benchmark suite for the libiq hot paths.
+
+Every case runs offline on synthetic captures written to a temporary directory and is
+timed in a fresh process, so the reported peak RSS belongs to that case alone. Results
+are written as JSON and can be compared against a saved baseline:
+
+    python benchmarks/bench_libiq.py --output baseline.json
+    python benchmarks/bench_libiq.py --output current.json --baseline baseline.json
+
+The comparison exits with status 1 when the median latency of a case grew by more than
+--tolerance (default 10%) over the baseline.
+"""
+
+import argparse
+import datetime
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+SAMPLE_RATE = 1e6
+FFT_ROW = 1536
+DTYPES = {"int16": np.int16, "float32": np.float32, "float64": np.float64}
+
+# name -> parameters the case depends on (the others are left out of its key)
+CASES = {
+    "read_file": ("size", "dtype"),
+    "fft": ("size", "dtype"),
+    "psd": ("size", "dtype"),
+    "welch_psd": ("size", "dtype", "window_size", "overlap"),
+    "spectrogram": ("size", "dtype", "window_size", "overlap"),
+    "energy_detector": ("size",),
+    "preprocessing": ("size",),
+    "predict": ("time_window",),
+    "create_dataset_from_bin": ("size", "dtype"),
+}
+
+
+def write_capture(directory: str, num_samples: int, dtype: str) -> str:
+    """
+    Write a synthetic capture (a few tones over Gaussian noise) of num_samples IQ samples.
+
+    Args:
+        directory (str): Output directory.
+        num_samples (int): Number of complex samples.
+        dtype (str): Value type of the capture ("int16", "float32" or "float64").
+
+    Returns:
+        str: Path of the .bin capture.
+    """
+    path = os.path.join(directory, f"capture_{num_samples}_{dtype}.bin")
+    if os.path.exists(path):
+        return path
+    rng = np.random.default_rng(num_samples)
+    t = np.arange(num_samples) / SAMPLE_RATE
+    signal = sum(np.exp(2j * np.pi * f * t) for f in (50e3, 120e3, -230e3)) + 0.5 * (
+        rng.standard_normal(num_samples) + 1j * rng.standard_normal(num_samples)
+    )
+    values = np.empty((num_samples, 2))
+    values[:, 0] = signal.real
+    values[:, 1] = signal.imag
+    if dtype == "int16":
+        values *= 4000
+    values.astype(DTYPES[dtype]).tofile(path)
+    return path
+
+
+def case_key(name: str, params: Dict[str, Any]) -> str:
+    """Stable identifier of a case, used to match results against a baseline."""
+    return name + "[" + ",".join(f"{p}={params[p]}" for p in CASES[name]) + "]"
+
+
+def prepare_case(name: str, params: Dict[str, Any], directory: str) -> Tuple[Callable[[], Any], int]:
+    """
+    Build the callable timed for a case.
+
+    Returns:
+        A tuple of the callable and the number of IQ samples it processes per call.
+    """
+    import libiq
+
+    size = params["size"]
+    dtype = params["dtype"]
+    data_type = getattr(libiq.IQDataType, dtype.upper()).value
+
+    if name in ("read_file", "fft", "psd", "welch_psd", "spectrogram", "create_dataset_from_bin"):
+        path = write_capture(directory, size, dtype)
+
+    analyzer = libiq.Analyzer()
+    if name == "read_file":
+        return lambda: analyzer.getIQSamplesArray(path, data_type), size
+    if name == "fft":
+        return lambda: analyzer.fastFourierTransformArray(path, data_type), size
+    if name == "psd":
+        return lambda: analyzer.calculatePSDArray(path, SAMPLE_RATE, data_type), size
+    if name == "welch_psd":
+        window = libiq.WindowFunction.HANN.value
+        return lambda: analyzer.calculateWelchPSDArray(
+            path, params["window_size"], params["overlap"], window, SAMPLE_RATE, data_type
+        ), size
+    if name == "spectrogram":
+        return lambda: analyzer.generateIQSpectrogramArray(
+            path, params["overlap"], params["window_size"], SAMPLE_RATE, data_type
+        ), size
+
+    rows = max(size // FFT_ROW, 1)
+    rng = np.random.default_rng(rows)
+    iq_data = rng.standard_normal((rows * FFT_ROW, 2)) * 4000
+
+    if name == "energy_detector":
+        from libiq.classifier.energy_detector import energy_detector
+
+        data_matrix = (iq_data[:, 0] + 1j * iq_data[:, 1]).reshape(rows, FFT_ROW)
+        return lambda: energy_detector(data_matrix, extraction_window=600, moving_avg_window=30), rows * FFT_ROW
+
+    if name in ("preprocessing", "predict"):
+        from libiq.classifier.cnn import Classifier
+        from libiq.utils.constants import STATIC_LABELS
+
+        if name == "preprocessing":
+            classifier = Classifier()
+            complex_data = iq_data[:, 0] + 1j * iq_data[:, 1]
+            return lambda: classifier.preprocessing(complex_data), rows * FFT_ROW
+
+        time_window = params["time_window"]
+        classifier = Classifier(time_window=time_window)
+        classifier.model = classifier.make_model(len(STATIC_LABELS), (None, 4))
+        samples = np.random.default_rng(time_window).standard_normal((time_window * FFT_ROW, 2)) * 4000
+        return lambda: classifier.predict(samples), time_window * FFT_ROW
+
+    if name == "create_dataset_from_bin":
+        from libiq.utils.create_dataset import create_dataset_from_bin
+
+        output_path = tempfile.mkdtemp(dir=directory)
+
+        def run():
+            create_dataset_from_bin(
+                {path: 0}, 1, output_path, os.path.join(output_path, "combined.csv"), rows, 600, 5, DTYPES[dtype]
+            )
+
+        return run, rows * FFT_ROW
+
+    raise ValueError(f"Unknown benchmark case: {name}")
+
+
+def _reset_peak_rss() -> bool:
+    # Linux resets VmHWM (the peak RSS) when "5" is written to clear_refs
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(name: str, params: Dict[str, Any], directory: str, repeat: int, warmup: int) -> Dict[str, Any]:
+    """
+    Time one case (runs in its own process).
+
+    Returns:
+        The result record: latency percentiles in seconds, throughput in samples/s and peak RSS in MiB.
+    """
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "3")
+    function, num_samples = prepare_case(name, params, directory)
+    from libiq.utils.logger import logger
+
+    logger.setLevel("WARNING")
+    for _ in range(warmup):
+        function()
+    peak_reset = _reset_peak_rss()
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - start)
+    latencies = np.array(latencies)
+    median = float(np.median(latencies))
+    return {
+        "key": case_key(name, params),
+        "name": name,
+        "params": {p: params[p] for p in CASES[name]},
+        "samples_per_call": num_samples,
+        "repeat": repeat,
+        "latency_s": {
+            "min": float(latencies.min()),
+            "mean": float(latencies.mean()),
+            "p50": median,
+            "p90": float(np.percentile(latencies, 90)),
+            "p99": float(np.percentile(latencies, 99)),
+            "max": float(latencies.max()),
+        },
+        "throughput_sps": num_samples / median if median > 0 else float("inf"),
+        "peak_rss_mb": _peak_rss_mb(),
+        "peak_rss_scope": "measured calls" if peak_reset else "process",
+    }
+
+
+def expand_cases(args: argparse.Namespace) -> List[Tuple[str, Dict[str, Any]]]:
+    """Cartesian product of the parameter grid, deduplicated per case on the parameters it uses."""
+    cases, seen = [], set()
+    grid = itertools.product(args.sizes, args.dtypes, args.window_sizes, args.overlaps, args.time_windows)
+    for size, dtype, window_size, overlap, time_window in grid:
+        if overlap >= window_size:
+            continue
+        params = {"size": size, "dtype": dtype, "window_size": window_size, "overlap": overlap, "time_window": time_window}
+        for name in args.cases:
+            key = case_key(name, params)
+            if key not in seen:
+                seen.add(key)
+                cases.append((name, params))
+    return cases
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Print the median latency of every case against the baseline.
+
+    Returns:
+        The keys of the cases slower than the baseline by more than tolerance.
+    """
+    reference = {r["key"]: r for r in baseline.get("results", [])}
+    regressions = []
+    print(f"\n{'case':<70} {'baseline p50':>14} {'current p50':>14} {'change':>9}")
+    for result in results:
+        base = reference.get(result["key"])
+        if base is None:
+            print(f"{result['key']:<70} {'-':>14} {result['latency_s']['p50'] * 1e3:>12.3f}ms {'new':>9}")
+            continue
+        change = result["latency_s"]["p50"] / base["latency_s"]["p50"] - 1
+        flag = " !" if change > tolerance else ""
+        print(
+            f"{result['key']:<70} {base['latency_s']['p50'] * 1e3:>12.3f}ms "
+            f"{result['latency_s']['p50'] * 1e3:>12.3f}ms {change:>+8.1%}{flag}"
+        )
+        if change > tolerance:
+            regressions.append(result["key"])
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    def int_list(value):
+        return [int(v) for v in value.split(",")]
+
+    def str_list(choices):
+        def parse(value):
+            items = value.split(",")
+            for item in items:
+                if item not in choices:
+                    raise argparse.ArgumentTypeError(f"'{item}' is not one of {', '.join(choices)}")
+            return items
+
+        return parse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", type=str_list(CASES), default=list(CASES), help="Comma-separated cases (default: all).")
+    parser.add_argument("--sizes", type=int_list, default=[FFT_ROW * 256], help="Capture sizes in IQ samples.")
+    parser.add_argument("--dtypes", type=str_list(DTYPES), default=["int16"], help="Capture value types.")
+    parser.add_argument("--window-sizes", type=int_list, default=[1024], help="Spectrogram/Welch window sizes.")
+    parser.add_argument("--overlaps", type=int_list, default=[512], help="Spectrogram/Welch overlaps.")
+    parser.add_argument("--time-windows", type=int_list, default=[1], help="Classifier time windows for predict.")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per case.")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed calls per case (plan creation, page cache).")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare against a JSON file written by --output.")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed median slowdown (default: 0.10).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    import libiq
+
+    metadata = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "libiq_num_threads": libiq.Analyzer().getNumThreads(),
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+    }
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory(prefix="libiq-bench-") as directory:
+        for name, params in expand_cases(args):
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_case, name, params, directory, args.repeat, args.warmup).result()
+            results.append(result)
+            print(
+                f"{result['key']:<70} p50 {result['latency_s']['p50'] * 1e3:10.3f}ms  "
+                f"p99 {result['latency_s']['p99'] * 1e3:10.3f}ms  "
+                f"{result['throughput_sps'] / 1e6:9.2f} MS/s  {result['peak_rss_mb']:8.1f} MiB",
+                flush=True,
+            )
+
+    report = {"metadata": metadata, "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than the baseline by more than {args.tolerance:.0%}.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
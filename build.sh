@@ -32,6 +32,11 @@ cd "$path/libs/fftw-3.3.10"
 ./configure --enable-shared --with-pic --enable-threads
 make -j"$(nproc)"
 $SUDO make install
+# Single-precision build (libfftw3f) for the float32 path
+make clean
+./configure --enable-shared --with-pic --enable-threads --enable-float
+make -j"$(nproc)"
+$SUDO make install
 $SUDO ldconfig
 
 cd "$path"
@@ -1,6 +1,10 @@
 import json
 import os
 import shutil
+import subprocess
+import sys
+import threading
+import types
 
 import numpy as np
 import pytest
@@ -9,11 +13,14 @@ import libiq
 import libiq.plotter.scatterplot as scplt
 import libiq.plotter.spectrogram as sp
 import libiq.plotter.waterfall as wf
+from libiq._batch import STATS_STAGES
 from libiq.classifier.cnn import Classifier
 from libiq.classifier.preprocessing import preprocess_data
 from libiq.converter.mat import MATConverter
 from libiq.converter.sigmf import SigMFConverter
+from libiq.utils.create_dataset import read_binary_data
 from libiq.utils.logger import logger
+from libiq.utils.ring_buffer import IQRingBuffer
 
 report_path = "sample_data/test_results/reports/"
 plots_path = "sample_data/test_results/plots/"
@@ -306,3 +313,849 @@ def test_spectrogram():
     )
 
     assert os.path.isfile(f"{plots_path}spectrogram.pdf")
+
+
+def test_numpy_interface():
+    input_file_path = "sample_data/combined_output.csv"
+
+    analyzer = libiq.Analyzer()
+
+    data_type = libiq.IQDataType.INT16.value
+
+    sample_rate = 1000000
+    start = 0
+    end = 1000
+
+    iq = analyzer.getIQSamples(input_file_path, start, end, data_type)
+    iq_array = analyzer.getIQSamplesArray(input_file_path, start, end, data_type)
+    assert isinstance(iq_array, np.ndarray)
+    assert iq_array.shape == (1000, 2)
+    assert np.allclose(iq_array, np.array(iq))
+
+    iq_complex = iq_array.view(np.complex128).ravel()
+
+    fft = analyzer.fastFourierTransform(iq_complex)
+    assert isinstance(fft, np.ndarray)
+    assert np.allclose(fft, np.array(analyzer.fastFourierTransform(iq)))
+
+    fft = analyzer.fastFourierTransform(iq_complex.astype(np.complex64))
+    assert fft.shape == (1000, 2)
+
+    psd = analyzer.calculatePSD(iq_array, sample_rate)
+    assert np.allclose(psd, np.array(analyzer.calculatePSD(iq, sample_rate)))
+
+    spectrogram = analyzer.generateIQSpectrogram(iq_array.astype(np.int16), 4, 32, sample_rate)
+    assert spectrogram.shape == (35, 32)
+    assert np.allclose(spectrogram, np.array(analyzer.generateIQSpectrogram(iq, 4, 32, sample_rate)))
+
+    assert np.allclose(analyzer.realPartIQSamples(iq_complex, 0, end), iq_array[:, 0])
+    assert np.allclose(analyzer.imaginaryPartIQSamples(iq_complex, 0, end), iq_array[:, 1])
+
+    with pytest.raises(ValueError):
+        analyzer.fastFourierTransform(np.zeros(10))
+
+
+def test_fft_planning():
+    analyzer = libiq.Analyzer()
+    iq_samples = np.exp(2j * np.pi * 0.1 * np.arange(1024))
+
+    fft_estimate = analyzer.fastFourierTransform(iq_samples)
+
+    analyzer.setFFTPlanRigor(libiq.FFTPlanRigor.MEASURE.value)
+    assert analyzer.getFFTPlanRigor() == libiq.FFTPlanRigor.MEASURE.value
+    fft_measure = analyzer.fastFourierTransform(iq_samples)
+    assert np.allclose(fft_estimate, fft_measure)
+
+    wisdom_path = "sample_data/test_results/fftw.wisdom"
+    create_directories(["sample_data/test_results"])
+    assert analyzer.exportFFTWisdom(wisdom_path)
+    assert libiq.Analyzer().importFFTWisdom(wisdom_path)
+    assert not libiq.Analyzer().importFFTWisdom("sample_data/test_results/missing.wisdom")
+
+
+def test_spectrogram_matches_numpy():
+    analyzer = libiq.Analyzer()
+
+    sample_rate = 1000000
+    window_size = 64
+    overlap = 16
+    hop_size = window_size - overlap
+
+    rng = np.random.default_rng(0)
+    iq_samples = rng.standard_normal(10000) + 1j * rng.standard_normal(10000)
+
+    spectrogram = analyzer.generateIQSpectrogram(iq_samples, overlap, window_size, sample_rate)
+
+    num_windows = 1 + (len(iq_samples) - window_size) // hop_size
+    windows = np.arange(num_windows)[:, None] * hop_size + np.arange(window_size)
+    power = np.abs(np.fft.fft(iq_samples[windows], axis=1)) ** 2 / len(iq_samples)
+    expected = 10 * np.log10(power) - 10 * np.log10(2 * np.pi / sample_rate)
+
+    assert spectrogram.shape == (num_windows, window_size)
+    assert np.allclose(spectrogram, expected)
+
+
+def test_ranged_binary_read():
+    create_directories(["sample_data/test_results"])
+    input_file_path = "sample_data/test_results/ranged.bin"
+    raw = (np.arange(20000) - 10000).astype(np.int16)
+    raw.tofile(input_file_path)
+    expected = raw.reshape(-1, 2).astype(np.float64)
+
+    analyzer = libiq.Analyzer()
+
+    data_type = libiq.IQDataType.INT16.value
+
+    iq_samples = analyzer.getIQSamples(input_file_path, 2500, 3500, data_type)
+    assert np.array_equal(np.array(iq_samples), expected[2500:3500])
+
+    iq_array = analyzer.getIQSamplesArray(input_file_path, 9900, 20000, data_type)
+    assert np.array_equal(iq_array, expected[9900:])
+
+    fft = analyzer.fastFourierTransform(input_file_path, 100, 164, data_type)
+    expected_fft = np.fft.fft(expected[100:164, 0] + 1j * expected[100:164, 1])
+    assert np.allclose(np.array(fft), np.stack((expected_fft.real, expected_fft.imag), axis=1))
+
+    assert len(analyzer.getIQSamples(input_file_path, 10000, 10010, data_type)) == 0
+
+
+def test_memory_mapped_capture():
+    create_directories(["sample_data/test_results"])
+    input_file_path = "sample_data/test_results/mapped.bin"
+    raw = np.random.default_rng(0).standard_normal(4096).astype(np.float32)
+    raw.tofile(input_file_path)
+    expected = raw.reshape(-1, 2)
+
+    capture = libiq.IQCapture(input_file_path, libiq.IQDataType.FLOAT32.value)
+    assert capture.numSamples() == 2048
+    iq_array = capture.array()
+    assert iq_array.dtype == np.float32 and not iq_array.flags.writeable
+    assert np.array_equal(iq_array, expected)
+    del capture
+    assert np.array_equal(iq_array, expected)
+
+    analyzer = libiq.Analyzer()
+    spectrogram = analyzer.generateIQSpectrogram(iq_array, 128, 256, 1e6)
+    expected_spectrogram = analyzer.generateIQSpectrogram(
+        input_file_path, 128, 256, 1e6, libiq.IQDataType.FLOAT32.value
+    )
+    assert np.allclose(spectrogram, np.array(expected_spectrogram))
+
+    complex_data = read_binary_data(input_file_path, np.float32, max_rows=1)
+    assert np.array_equal(complex_data, expected[:1536, 0] + 1j * expected[:1536, 1])
+
+    with pytest.raises(ValueError):
+        libiq.IQCapture("sample_data/test_results/missing.bin", libiq.IQDataType.FLOAT32.value)
+
+
+def test_num_threads():
+    analyzer = libiq.Analyzer()
+    assert analyzer.getNumThreads() >= 1
+    with pytest.raises(ValueError):
+        analyzer.setNumThreads(0)
+
+    rng = np.random.default_rng(1)
+    iq_samples = (rng.standard_normal(1 << 16) + 1j * rng.standard_normal(1 << 16)).astype(np.complex128)
+
+    analyzer.setNumThreads(1)
+    spectrogram = analyzer.generateIQSpectrogram(iq_samples, 64, 256, 1e6)
+    psd = analyzer.calculatePSD(iq_samples, 1e6)
+
+    analyzer.setNumThreads(4)
+    assert analyzer.getNumThreads() == 4
+    assert np.allclose(analyzer.generateIQSpectrogram(iq_samples, 64, 256, 1e6), spectrogram)
+    assert np.allclose(analyzer.calculatePSD(iq_samples, 1e6), psd)
+    assert np.allclose(analyzer.fastFourierTransform(iq_samples).view(np.complex128).ravel(), np.fft.fft(iq_samples))
+
+
+def test_float32_precision():
+    rng = np.random.default_rng(2)
+    iq_samples = (rng.standard_normal(4096) + 1j * rng.standard_normal(4096)).astype(np.complex64)
+
+    analyzer = libiq.Analyzer()
+    spectrogram = analyzer.generateIQSpectrogram(iq_samples, 128, 256, 1e6)
+    psd = analyzer.calculatePSD(iq_samples, 1e6)
+
+    spectrogram_f32 = analyzer.generateIQSpectrogramFloat32(
+        iq_samples, libiq.IQDataType.FLOAT32.value, 128, 256, 1e6
+    )
+    assert spectrogram_f32.dtype == np.float32
+    assert np.allclose(spectrogram_f32, spectrogram, atol=1e-3)
+
+    analyzer.setPrecision(libiq.IQPrecision.FLOAT32.value)
+    psd_f32 = analyzer.calculatePSD(iq_samples, 1e6)
+    assert psd_f32.dtype == np.float32
+    assert np.allclose(psd_f32, psd, rtol=1e-4)
+
+    fft_f32 = analyzer.fastFourierTransform(iq_samples)
+    assert fft_f32.dtype == np.float32
+    assert np.allclose(fft_f32.view(np.complex64).ravel(), np.fft.fft(iq_samples), rtol=1e-4, atol=1e-3)
+
+    create_directories(["sample_data/test_results"])
+    input_file_path = "sample_data/test_results/float32.bin"
+    iq_samples.tofile(input_file_path)
+    from_file = analyzer.generateIQSpectrogramArray(input_file_path, 128, 256, 1e6, libiq.IQDataType.FLOAT32.value)
+    assert from_file.dtype == np.float32
+    assert np.array_equal(from_file, spectrogram_f32)
+
+
+def test_csv_reader():
+    create_directories(["sample_data/test_results"])
+    input_file_path = "sample_data/test_results/reader.csv"
+    with open(input_file_path, "w", newline="") as f:
+        f.write("Index, Imaginary ,Real,Extra\r\n")
+        f.write("0, 1.5 ,-2,x\r\n")
+        f.write("\n")
+        f.write("1,+3e-2,4.25\n")
+        f.write("2,7\n")
+        f.write("3,-0.5,1e3,")
+    analyzer = libiq.Analyzer()
+    iq_samples = analyzer.getIQSamplesArray(
+        input_file_path, libiq.IQDataType.FLOAT64.value, ["Real", "Imaginary"]
+    )
+    assert np.array_equal(iq_samples, [[-2.0, 1.5], [4.25, 0.03], [1000.0, -0.5]])
+
+    rng = np.random.default_rng(3)
+    values = rng.standard_normal((300000, 2))
+    np.savetxt(
+        input_file_path, values, delimiter=",", header="Real,Imaginary", comments=""
+    )
+    analyzer.setNumThreads(4)
+    iq_samples = analyzer.getIQSamplesArray(input_file_path, libiq.IQDataType.FLOAT64.value)
+    assert np.array_equal(iq_samples, values)
+
+    with open(input_file_path, "a") as f:
+        f.write("1.0,abc\n")
+    with pytest.raises(RuntimeError):
+        analyzer.getIQSamplesArray(input_file_path, libiq.IQDataType.FLOAT64.value)
+
+
+def test_concurrent_analyzer():
+    from concurrent.futures import ThreadPoolExecutor
+
+    rng = np.random.default_rng(4)
+    captures = [
+        (rng.standard_normal(1 << 14) + 1j * rng.standard_normal(1 << 14)).astype(np.complex128)
+        for _ in range(8)
+    ]
+    window_sizes = [64, 128, 256, 512] * 2
+
+    analyzer = libiq.Analyzer()
+    expected = [
+        analyzer.generateIQSpectrogram(capture, 0, window_size, 1e6)
+        for capture, window_size in zip(captures, window_sizes)
+    ]
+
+    def work(index):
+        if index % 3 == 0:
+            analyzer.clearFFTPlanCache()
+        return analyzer.generateIQSpectrogram(captures[index], 0, window_sizes[index], 1e6)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(5):
+            results = list(executor.map(work, range(len(captures))))
+            for result, reference in zip(results, expected):
+                assert np.array_equal(result, reference)
+
+
+def test_streaming_spectrogram():
+    rng = np.random.default_rng(5)
+    iq_samples = (rng.standard_normal(10000) + 1j * rng.standard_normal(10000)).astype(np.complex64)
+
+    analyzer = libiq.Analyzer()
+    expected = analyzer.generateIQSpectrogram(iq_samples.astype(np.complex128), 96, 256, 1e6)
+
+    stream = libiq.StreamingSpectrogram(256, 96, 1e6, len(iq_samples))
+    rows = []
+    for chunk in np.array_split(iq_samples, 37):
+        stream.push(chunk)
+        rows.append(stream.pop_rows())
+    assert stream.bufferedSamples() < 256
+    rows = np.concatenate(rows)
+    assert rows.shape == expected.shape
+    assert np.allclose(rows, expected)
+
+    stream.reset()
+    stream.push([[1.0, 0.0]] * 255)
+    assert stream.pendingRows() == 0 and stream.popRows().shape == (0, 256)
+    stream.push([[1.0, 0.0]])
+    assert stream.pendingRows() == 1
+
+    with pytest.raises(ValueError):
+        libiq.StreamingSpectrogram(256, 256, 1e6)
+
+
+def test_welch_psd():
+    signal = pytest.importorskip("scipy.signal")
+
+    rng = np.random.default_rng(6)
+    raw = (rng.standard_normal(40000) * 1000).astype(np.int16)
+    iq_samples = raw[0::2] + 1j * raw[1::2].astype(np.float64)
+
+    create_directories(["sample_data/test_results"])
+    input_file_path = "sample_data/test_results/welch.bin"
+    raw.tofile(input_file_path)
+
+    analyzer = libiq.Analyzer()
+    for window, name in [
+        (libiq.WindowFunction.HANN, "hann"),
+        (libiq.WindowFunction.HAMMING, "hamming"),
+        (libiq.WindowFunction.BLACKMAN, "blackman"),
+        (libiq.WindowFunction.RECTANGULAR, "boxcar"),
+    ]:
+        _, expected = signal.welch(
+            iq_samples, fs=1e6, window=name, nperseg=512, noverlap=128,
+            detrend=False, return_onesided=False, scaling="density",
+        )
+        from_file = analyzer.calculateWelchPSDArray(
+            input_file_path, 512, 128, window.value, 1e6, libiq.IQDataType.INT16.value
+        )
+        assert np.allclose(from_file, expected)
+        from_array = analyzer.calculateWelchPSD(raw.reshape(-1, 2), 512, 128, window.value, 1e6)
+        assert np.allclose(from_array, expected)
+
+    assert len(analyzer.calculateWelchPSD(input_file_path, 512, 512, libiq.WindowFunction.HANN.value, 1e6, libiq.IQDataType.INT16.value)) == 0
+
+
+def test_feature_extraction():
+    from libiq.utils.create_dataset import process_samples_vectorized
+
+    rng = np.random.default_rng(7)
+    raw = (rng.standard_normal(100000) * 1000).astype(np.int16)
+    raw[:4] = 0
+    iq_samples = raw[0::2] + 1j * raw[1::2].astype(np.float64)
+
+    magnitude = np.abs(iq_samples)
+    eps = np.finfo(float).eps
+    magnitude_dB = 20 * np.log10(np.maximum(magnitude, eps))
+    magnitude_dB[magnitude == 0] = 0
+    expected = np.stack(
+        (iq_samples.real, iq_samples.imag, np.arctan2(iq_samples.imag, iq_samples.real), magnitude_dB), axis=1
+    )
+
+    classifier = Classifier()
+    features = classifier.preprocessing(iq_samples)
+    assert features.dtype == np.float32 and features.shape == (50000, 4)
+    assert np.allclose(features, expected, rtol=1e-6, atol=1e-6)
+    assert np.all(features[:2] == 0)
+
+    create_directories(["sample_data/test_results"])
+    input_file_path = "sample_data/test_results/features.bin"
+    raw.tofile(input_file_path)
+    analyzer = libiq.Analyzer()
+    analyzer.setNumThreads(4)
+    from_file = analyzer.extractFeaturesArray(input_file_path, libiq.IQDataType.INT16.value, eps)
+    assert np.array_equal(from_file, analyzer.extractFeaturesArray(raw.reshape(-1, 2), eps))
+    assert np.allclose(from_file, expected, rtol=1e-6, atol=1e-6)
+
+    df = process_samples_vectorized(iq_samples, 3)
+    assert list(df.columns) == ["Real", "Imaginary", "Phase", "Magnitude", "Labels"]
+    assert (df.dtypes[["Real", "Imaginary", "Phase", "Magnitude"]] == np.float64).all()
+    assert np.allclose(df["Magnitude"], expected[:, 3], rtol=1e-6, atol=1e-6)
+    assert (df["Labels"] == 3).all()
+
+    with pytest.raises(ValueError):
+        analyzer.extractFeaturesArray(raw.reshape(-1, 2), -1.0)
+
+
+def test_process_files():
+    rng = np.random.default_rng(8)
+    create_directories(["sample_data/test_results"])
+    paths = []
+    for i in range(6):
+        path = f"sample_data/test_results/batch_{i}.bin"
+        (rng.standard_normal(2 * (4096 + 512 * i)) * 1000).astype(np.int16).tofile(path)
+        paths.append(path)
+
+    analyzer = libiq.Analyzer()
+    params = (1e6, libiq.IQDataType.INT16)
+    expected = [analyzer.calculatePSDArray(path, 1e6, libiq.IQDataType.INT16.value) for path in paths]
+
+    results = analyzer.process_files(paths, "psd", params, num_workers=3)
+    assert len(results) == len(paths)
+    for result, reference in zip(results, expected):
+        assert np.array_equal(result, reference)
+
+    completed = list(analyzer.process_files(paths, "psd", params, num_workers=3, ordered=False))
+    assert sorted(index for index, _ in completed) == list(range(len(paths)))
+    for index, result in completed:
+        assert np.array_equal(result, expected[index])
+
+    spectrograms = analyzer.process_files(paths, "generateIQSpectrogramArray", (0, 256, 1e6, libiq.IQDataType.INT16), num_workers=2)
+    assert [s.shape[0] for s in spectrograms] == [16 + 2 * i for i in range(6)]
+
+    with pytest.raises(ValueError):
+        analyzer.process_files(paths, "unknown")
+
+
+def test_asyncio_facade():
+    import asyncio
+    import threading
+    import time
+
+    from libiq.aio import AsyncAnalyzer, AsyncClassifier
+
+    rng = np.random.default_rng(9)
+    raw = (rng.standard_normal(2 * 65536) * 1000).astype(np.int16)
+    iq_samples = raw.reshape(-1, 2)
+    create_directories(["sample_data/test_results"])
+    input_file_path = "sample_data/test_results/aio.bin"
+    raw.tofile(input_file_path)
+    analyzer = libiq.Analyzer()
+    data_type = libiq.IQDataType.INT16.value
+
+    class SlowClassifier:
+        def __init__(self):
+            self.calls = []
+            self.release = threading.Event()
+
+        def predict(self, iq_data):
+            self.release.wait(5)
+            self.calls.append(len(iq_data))
+            return len(iq_data)
+
+    async def main():
+        async with AsyncAnalyzer(max_workers=2, max_pending=3) as aio:
+            psd = await aio.psd(input_file_path, 1e6, data_type)
+            assert np.array_equal(psd, analyzer.calculatePSDArray(input_file_path, 1e6, data_type))
+            spectrograms = await asyncio.gather(
+                aio.spectrogram(iq_samples, 0, 256, 1e6),
+                aio.spectrogram(input_file_path, 0, 256, 1e6, data_type),
+                aio.call("generateIQSpectrogramArray", input_file_path, 0, 256, 1e6, data_type),
+            )
+            for spectrogram in spectrograms:
+                assert np.array_equal(spectrogram, spectrograms[0])
+            features = await aio.features(iq_samples, 1e-3)
+            assert features.shape == (65536, 4)
+            assert aio.pending == 0
+
+        classifier = SlowClassifier()
+        async with AsyncClassifier(classifier, max_pending=2) as aio:
+            tasks = [asyncio.ensure_future(aio.predict(iq_samples[: 10 + i])) for i in range(4)]
+            ticks = 0
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+            # The event loop keeps running while predictions are blocked, and only
+            # max_pending of them are admitted to the executor
+            assert ticks == 5 and aio.pending == 2
+            tasks[3].cancel()
+            classifier.release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            assert results[:3] == [10, 11, 12]
+            assert isinstance(results[3], asyncio.CancelledError)
+            assert classifier.calls == [10, 11, 12]
+            assert aio.pending == 0
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    assert time.perf_counter() - start < 5
+
+
+def test_sigmf_recording():
+    from libiq.converter.sigmf import SigMFRecording
+
+    rng = np.random.default_rng(10)
+    raw = (rng.standard_normal(2 * 8192) * 1000).astype(np.int16)
+    create_directories(["sample_data/test_results"])
+    base = "sample_data/test_results/recording"
+    raw.tofile(base + ".sigmf-data")
+    with open(base + ".sigmf-meta", "w") as f:
+        json.dump(
+            {
+                "global": {"core:datatype": "ci16_le", "core:sample_rate": 1e6, "core:version": "1.0.0"},
+                "captures": [
+                    {"core:sample_start": 0, "core:frequency": 3.6e9},
+                    {"core:sample_start": 4096, "core:frequency": 3.7e9},
+                ],
+                "annotations": [
+                    {"core:sample_start": 5000, "core:sample_count": 1024, "core:label": "lte"},
+                    {"core:sample_start": 1000, "core:sample_count": 2048, "core:label": "5g"},
+                ],
+            },
+            f,
+        )
+
+    recording = SigMFRecording(base + ".sigmf-meta")
+    assert recording.sample_rate == 1e6 and recording.data_type == libiq.IQDataType.INT16
+    assert len(recording) == 8192 and recording.array.shape == (8192, 2)
+    assert np.array_equal(recording.array, raw.reshape(-1, 2))
+    assert [a["core:label"] for a in recording.annotations] == ["5g", "lte"]
+    assert recording.annotation_range(0) == (1000, 3048)
+    assert recording.capture_at(5000)["core:frequency"] == 3.7e9
+
+    segment = recording.read_annotation(1)
+    assert isinstance(segment, np.memmap) and np.array_equal(segment, raw.reshape(-1, 2)[5000:6024])
+
+    analyzer = libiq.Analyzer()
+    psd = analyzer.calculatePSD(recording.array, recording.sample_rate)
+    assert np.allclose(psd, analyzer.calculatePSD(raw.reshape(-1, 2), recording.sample_rate))
+    assert analyzer.extractFeaturesArray(segment, 0.0).shape == (1024, 4)
+
+    # The dataset offset comes from the first capture's header_bytes
+    with open(base + "_header.sigmf-data", "wb") as f:
+        f.write(b"\xff" * 16)
+        raw.tofile(f)
+    with open(base + "_header.sigmf-meta", "w") as f:
+        json.dump({"global": {"core:datatype": "ci16_le"}, "captures": [{"core:sample_start": 0, "core:header_bytes": 16}]}, f)
+    assert np.array_equal(SigMFRecording(base + "_header").array, raw.reshape(-1, 2))
+
+    (raw[:4096].astype(np.int8)).tofile(base + "_ci8.sigmf-data")
+    with open(base + "_ci8.sigmf-meta", "w") as f:
+        json.dump({"global": {"core:datatype": "ci8", "core:sample_rate": 1e6}}, f)
+    ci8 = SigMFRecording(base + "_ci8")
+    assert ci8.data_type is None
+    assert ci8.read(10, 5).dtype == np.float32
+    assert np.array_equal(ci8.read(10, 5), raw[:4096].astype(np.int8).reshape(-1, 2)[10:15])
+
+    with open(base + "_real.sigmf-meta", "w") as f:
+        json.dump({"global": {"core:datatype": "rf32_le"}}, f)
+    shutil.copy(base + ".sigmf-data", base + "_real.sigmf-data")
+    with pytest.raises(ValueError):
+        SigMFRecording(base + "_real")
+
+
+def test_analyzer_stats():
+    rng = np.random.default_rng(9)
+    create_directories(["sample_data/test_results"])
+    path = "sample_data/test_results/stats.bin"
+    (rng.standard_normal(2 * 8192) * 1000).astype(np.int16).tofile(path)
+
+    analyzer = libiq.Analyzer()
+    assert not analyzer.getStatsEnabled()
+    analyzer.generateIQSpectrogram(path, 128, 256, 1e6, libiq.IQDataType.INT16.value)
+    assert all(analyzer.stats()[stage]["calls"] == 0 for stage in STATS_STAGES)
+
+    analyzer.setStatsEnabled(True)
+    analyzer.clearFFTPlanCache()
+    analyzer.generateIQSpectrogram(path, 128, 256, 1e6, libiq.IQDataType.INT16.value)
+    stats = analyzer.stats()
+    assert stats["bytes_read"] == 8192 * 2 * 2
+    assert stats["plans_created"] >= 1
+    for stage in ("read", "plan", "execute", "postprocess", "output"):
+        assert stats[stage]["calls"] >= 1
+        assert stats[stage]["ns"] > 0
+
+    iq_samples = (rng.standard_normal(2048) + 1j * rng.standard_normal(2048)).astype(np.complex64)
+    analyzer.calculatePSD(iq_samples, 1e6)
+    assert analyzer.stats()["convert"]["calls"] == 1
+
+    analyzer.reset_stats()
+    stats = analyzer.stats()
+    assert stats["bytes_read"] == 0 and stats["plans_created"] == 0
+    assert all(stats[stage] == {"ns": 0, "calls": 0} for stage in STATS_STAGES)
+
+
+def test_numpy_backend_parity():
+    try:
+        native = libiq.load_backend("native")
+    except ImportError:
+        pytest.skip("native extension not built")
+    numpy_backend = libiq.load_backend("numpy")
+    rng = np.random.default_rng(10)
+    create_directories(["sample_data/test_results"])
+    path = "sample_data/test_results/parity.bin"
+    (rng.standard_normal(2 * 5000) * 1000).astype(np.int16).tofile(path)
+    csv_path = "sample_data/combined_output.csv"
+    iq_samples = rng.standard_normal(3000) + 1j * rng.standard_normal(3000)
+    int16 = libiq.IQDataType.INT16.value
+    float64 = libiq.IQDataType.FLOAT64.value
+    hann = libiq.WindowFunction.HANN.value
+
+    calls = [
+        ("getIQSamplesArray", (path, int16)),
+        ("getIQSamplesArray", (path, 100, 900, int16)),
+        ("getIQSamplesArray", (csv_path, float64)),
+        ("getIQSamples", (path, 10, 20, int16)),
+        ("fastFourierTransform", (iq_samples,)),
+        ("fastFourierTransform", (iq_samples[:64].view(np.float64).reshape(-1, 2).tolist(),)),
+        ("fastFourierTransformArray", (path, int16)),
+        ("fastFourierTransformArray", (path, 0, 1024, int16)),
+        ("calculatePSD", (iq_samples, 1e6)),
+        ("calculatePSDArray", (path, 1e6, int16)),
+        ("calculatePSDArray", (path, 100, 612, int16)),
+        ("calculatePSDArray", (csv_path, 1e6, float64)),
+        ("calculateWelchPSD", (iq_samples, 256, 128, hann, 1e6)),
+        ("calculateWelchPSDArray", (path, 512, 256, libiq.WindowFunction.BLACKMAN.value, 1e6, int16)),
+        ("generateIQSpectrogram", (iq_samples, 64, 256, 1e6)),
+        ("generateIQSpectrogram", (iq_samples[:600].view(np.float64).reshape(-1, 2).tolist(), 0, 128, 1e6)),
+        ("generateIQSpectrogramArray", (path, 128, 512, 1e6, int16)),
+        ("generateIQSpectrogramArray", (iq_samples.astype(np.complex64), libiq.IQDataType.FLOAT32.value, 0, 100, 2e6)),
+        ("generateIQSpectrogramFloat32", (path, 0, 256, 1e6, int16)),
+        ("calculatePSDFloat32", (path, 1e6, int16)),
+        ("fastFourierTransformFloat32", (path, 0, 512, int16)),
+        ("extractFeaturesArray", (iq_samples, 1e-3)),
+        ("extractFeaturesArray", (path, int16, 0.0)),
+        ("realPartIQSamples", (iq_samples, 5, 50)),
+        ("imaginaryPartIQSamplesArray", (path, int16)),
+        ("generateIQSpectrogram", (iq_samples, 0, 5000, 1e6)),
+        ("fastFourierTransformArray", ("sample_data/test_results/missing.bin", int16)),
+    ]
+    native_analyzer = native.Analyzer()
+    numpy_analyzer = numpy_backend.Analyzer()
+    for method, args in calls:
+        expected = getattr(native_analyzer, method)(*args)
+        result = getattr(numpy_analyzer, method)(*args)
+        assert type(result) is type(expected), method
+        expected = np.asarray(expected)
+        result = np.asarray(result)
+        assert result.shape == expected.shape and result.dtype == expected.dtype, method
+        tolerance = 1e-3 if expected.dtype == np.float32 else 1e-9
+        assert np.allclose(result, expected, rtol=tolerance, atol=tolerance), method
+
+    native_analyzer.setPrecision(libiq.IQPrecision.FLOAT32.value)
+    numpy_analyzer.setPrecision(libiq.IQPrecision.FLOAT32.value)
+    assert np.allclose(
+        numpy_analyzer.calculatePSDArray(path, 1e6, int16), native_analyzer.calculatePSDArray(path, 1e6, int16), rtol=1e-3
+    )
+
+    capture = numpy_backend.IQCapture(path, int16)
+    assert np.array_equal(capture.array(), native.IQCapture(path, int16).array())
+    assert not capture.array().flags.writeable
+
+    streams = [backend.StreamingSpectrogram(256, 64, 1e6) for backend in (native, numpy_backend)]
+    for chunk in np.array_split(iq_samples, 7):
+        rows = [stream.push(chunk) or stream.pop_rows() for stream in streams]
+        assert rows[0].shape == rows[1].shape
+        assert np.allclose(rows[0], rows[1])
+    assert streams[0].bufferedSamples() == streams[1].bufferedSamples()
+
+    with pytest.raises(ValueError):
+        numpy_analyzer.getIQSamplesArray("sample_data/test_results/parity.dat", int16)
+    with pytest.raises(ValueError):
+        numpy_backend.StreamingSpectrogram(0, 0, 1e6)
+    with pytest.raises(ValueError):
+        libiq.load_backend("unknown")
+
+    default_backend = libiq.backend
+    libiq.set_backend("numpy")
+    try:
+        assert isinstance(libiq.Analyzer(), numpy_backend.Analyzer)
+    finally:
+        libiq.set_backend(default_backend)
+
+    # Without the extension, "import libiq" falls back to the NumPy backend
+    script = "import sys; sys.modules['libiq.libiqwrapped'] = None; import libiq; print(libiq.backend)"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "numpy"
+
+
+def test_iq_ring_buffer():
+    ring = IQRingBuffer(8)
+    ring.push(np.arange(12).reshape(6, 2))
+    ring.consume(4)
+    ring.push(np.arange(100, 112).reshape(6, 2))
+    assert len(ring) == 8 and ring.free == 0
+    window = ring.peek(8)
+    assert window.flags.c_contiguous
+    assert np.array_equal(window[:, 0], [8, 10, 100, 102, 104, 106, 108, 110])
+    with pytest.raises(ValueError):
+        ring.push(np.zeros((1, 2)))
+    ring.clear()
+    assert len(ring) == 0
+
+    classifier = Classifier(time_window=2)
+    blocks = []
+    classifier.cnn_test_dapp = lambda x: blocks.append(x.copy()) or len(blocks)
+    rng = np.random.default_rng(11)
+    stream = rng.standard_normal((5 * 2 * classifier.max_window, 2))
+    results = [classifier.predict(chunk) for chunk in np.array_split(stream, 17)]
+    assert results[0] is None
+    assert results[-1] == len(blocks) == 5
+    assert len(classifier.buffer) == 0
+
+    reference = Classifier(time_window=2)
+    block = stream[3 * 2 * reference.max_window : 4 * 2 * reference.max_window]
+    expected = reference.preprocessing(reference.apply_energy_detector_to_data(block))
+    assert np.array_equal(blocks[3], expected)
+
+    assert classifier.predict(stream[: 5 * 2 * classifier.max_window]) == 10
+
+
+def test_predict_batch():
+    classifier = Classifier(time_window=1, model_path="sample_data/test_model.keras")
+    rng = np.random.default_rng(12)
+    iq_windows = rng.standard_normal((9, classifier.max_window, 2))
+    iq_windows[:4, 700:780] *= 20
+
+    labels, probabilities = classifier.predict_batch(iq_windows)
+    assert probabilities.shape == (9, classifier.model.output_shape[-1])
+    assert np.allclose(probabilities.sum(axis=1), 1.0, atol=1e-4)
+    assert labels == [classifier.predict(window) for window in iq_windows]
+
+    flat_labels, flat_probabilities = classifier.predict_batch(iq_windows.reshape(9, -1))
+    assert flat_labels == labels
+    assert np.allclose(flat_probabilities, probabilities)
+
+    empty_labels, empty_probabilities = classifier.predict_batch(np.zeros((0, classifier.max_window, 2)))
+    assert empty_labels == [] and empty_probabilities.shape == (0, classifier.model.output_shape[-1])
+
+    with pytest.raises(ValueError):
+        classifier.predict_batch(iq_windows[:, :1000])
+
+
+def test_interpreter_backend(tmp_path):
+    from libiq.classifier.export import check_parity
+
+    classifier = Classifier(time_window=1, model_path="sample_data/test_model.keras")
+    rng = np.random.default_rng(21)
+    iq_windows = rng.standard_normal((16, classifier.max_window, 2))
+    iq_windows[:8, 700:780] *= 20
+    x = np.stack(
+        [classifier.preprocessing(classifier.apply_energy_detector_to_data(window)) for window in iq_windows]
+    )
+    reference_labels, reference_probabilities = classifier.predict_batch(iq_windows)
+
+    for quantization in (None, "float16", "int8"):
+        path = classifier.export_model(
+            str(tmp_path / f"model_{quantization}.tflite"), quantization=quantization, calibration_data=x
+        )
+        report = check_parity(classifier.model, path, x)
+        lite = Classifier(time_window=1, model_path=path)
+        labels, probabilities = lite.predict_batch(iq_windows)
+        assert probabilities.shape == reference_probabilities.shape
+        if quantization == "int8":
+            assert report["agreement"] >= 0.75
+        else:
+            assert report["agreement"] == 1.0
+            assert np.allclose(probabilities, reference_probabilities, atol=1e-2)
+            assert labels == reference_labels
+            assert lite.predict(iq_windows[0]) == reference_labels[0]
+
+    with pytest.raises(ValueError):
+        classifier.export_model(str(tmp_path / "model.tflite"), quantization="int8")
+
+    pytest.importorskip("tf2onnx")
+    pytest.importorskip("onnxruntime")
+    path = classifier.export_model(str(tmp_path / "model.onnx"))
+    assert check_parity(classifier.model, path, x)["agreement"] == 1.0
+
+
+def test_batching_inference_server():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from libiq.classifier.batching import BatchingInferenceServer
+
+    classifier = Classifier(time_window=1, model_path="sample_data/test_model.keras")
+    rng = np.random.default_rng(22)
+    iq_windows = rng.standard_normal((24, classifier.max_window, 2))
+    iq_windows[:12, 700:780] *= 20
+    reference_labels, reference_probabilities = classifier.predict_batch(iq_windows)
+
+    with BatchingInferenceServer(classifier, max_batch_size=8, max_wait=0.05) as server:
+        with ThreadPoolExecutor(max_workers=6) as producers:
+            futures = list(producers.map(server.submit_iq, iq_windows))
+        results = [future.result(timeout=30) for future in futures]
+        assert [label for label, _ in results] == reference_labels
+        assert np.allclose(np.stack([row for _, row in results]), reference_probabilities, atol=1e-5)
+
+        stats = server.stats()
+        assert stats["requests"] == 24
+        assert stats["batches"] < 24
+        assert stats["mean_batch_size"] > 1
+        assert stats["throughput"] > 0
+        assert 0 < stats["latency_p50_ms"] <= stats["latency_p99_ms"] <= stats["latency_max_ms"]
+
+        features = classifier.preprocessing(classifier.apply_energy_detector_to_data(iq_windows[0]))
+        assert server.classify(features, timeout=30)[0] == reference_labels[0]
+        with pytest.raises(ValueError):
+            server.classify(features[:100], timeout=30)
+        server.reset_stats()
+        assert server.stats()["requests"] == 0
+    with pytest.raises(RuntimeError):
+        server.submit(features)
+
+    with pytest.raises(ValueError):
+        BatchingInferenceServer(classifier, max_batch_size=0)
+
+    # close() with a timeout keeps track of a dispatcher still serving the queue
+    release = threading.Event()
+    model = types.SimpleNamespace(input_shape=(None, 4))
+    stub = types.SimpleNamespace(model=model, fast_predict=lambda x: release.wait(30) and np.ones((len(x), 1)))
+    server = BatchingInferenceServer(stub, max_batch_size=1, max_wait=0)
+    futures = [server.submit(np.zeros(4)) for _ in range(3)]
+    server.close(timeout=0.05)
+    assert server._thread is not None and server._thread.is_alive()
+    release.set()
+    server.close(timeout=30)
+    assert server._thread is None
+    assert all(future.result(timeout=30)[1][0] == 1 for future in futures)
+
+
+def test_preprocessing_into_buffer():
+    rng = np.random.default_rng(23)
+    iq_data = rng.standard_normal(600) + 1j * rng.standard_normal(600)
+    iq_data[5] = 0
+    expected = libiq.Analyzer().extractFeaturesArray(iq_data, 1e-6)
+
+    for name in ("native", "numpy"):
+        analyzer = libiq.load_backend(name).Analyzer()
+        out = np.full((700, 4), -1, dtype=np.float32)
+        assert analyzer.extractFeaturesInto(iq_data, 1e-6, out) == 600
+        assert np.allclose(out[:600], expected, atol=1e-5)
+        assert np.all(out[600:] == -1)
+        with pytest.raises(ValueError):
+            analyzer.extractFeaturesInto(iq_data, 1e-6, out[:100])
+        with pytest.raises(ValueError):
+            analyzer.extractFeaturesInto(iq_data, 1e-6, out.astype(np.float64))
+
+    classifier = Classifier(time_window=1, model_path="sample_data/test_model.keras")
+    buffer = np.empty((600, 4), dtype=np.float32)
+    cropped = classifier.apply_energy_detector_to_data(rng.standard_normal((classifier.max_window, 2)))
+    features = classifier.preprocessing(cropped, out=buffer)
+    assert np.shares_memory(features, buffer)
+    assert np.array_equal(features, classifier.preprocessing(cropped))
+
+    windows = rng.standard_normal((3, classifier.max_window, 2))
+    labels = [classifier.predict(window) for window in windows]
+    reused = classifier._features
+    assert [classifier.predict(window) for window in windows] == labels
+    assert classifier._features is reused and reused.dtype == np.float32
+    assert labels == classifier.predict_batch(windows)[0]
+
+
+def test_lazy_classifier_import():
+    probe = (
+        "import sys\n"
+        "from libiq.classifier.cnn import Classifier\n"
+        "heavy = ('tensorflow', 'keras', 'sklearn', 'matplotlib', 'scipy.signal')\n"
+        "assert not [m for m in heavy if m in sys.modules], [m for m in heavy if m in sys.modules]\n"
+        "Classifier(time_window=1)\n"
+        "assert 'tensorflow' not in sys.modules\n"
+        "import numpy as np\n"
+        "weights = [Classifier(deterministic=True, seed=7).make_model(7, (600, 4)).get_weights()[0] for _ in range(2)]\n"
+        "assert np.array_equal(*weights)\n"
+        "import tensorflow as tf\n"
+        "assert 'tensorflow' in sys.modules\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", probe], check=True, env=env, timeout=600)
+
+
+def test_classifier_threading():
+    with pytest.raises(ValueError):
+        Classifier(intra_op_threads=0)
+    with pytest.raises(ValueError):
+        Classifier(cpu_affinity=[])
+
+    probe = (
+        "import os, threading\n"
+        "import numpy as np\n"
+        "from libiq.classifier.cnn import Classifier\n"
+        "before = os.sched_getaffinity(0)\n"
+        "cpu = sorted(before)[0]\n"
+        "classifier = Classifier(model_path='sample_data/test_model.keras', intra_op_threads=1, inter_op_threads=1,\n"
+        "                        cpu_affinity=[cpu], inference_thread=True)\n"
+        "import tensorflow as tf\n"
+        "assert tf.config.threading.get_intra_op_parallelism_threads() == 1\n"
+        "assert tf.config.threading.get_inter_op_parallelism_threads() == 1\n"
+        "assert os.sched_getaffinity(0) == before\n"
+        "run_model, threads = classifier._run_model, []\n"
+        "classifier._run_model = lambda x: threads.append((threading.current_thread().name, os.sched_getaffinity(0))) or run_model(x)\n"
+        "label = classifier.predict(np.random.default_rng(0).standard_normal((classifier.max_window, 2)))\n"
+        "assert threads and all(name.startswith('libiq-inference') and mask == {cpu} for name, mask in threads), threads\n"
+        "assert os.sched_getaffinity(0) == before\n"
+        "classifier.close()\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", probe], check=True, env=env, timeout=600)
@@ -98,6 +98,7 @@ def main():
         batch_size=32,
         plots=plots,
         interactive_plots=interactive_plots,
+        deterministic=True,
     )
 
     create_dataset_from_bin(
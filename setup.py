@@ -1,6 +1,7 @@
 import os
 import re
 
+import numpy
 from setuptools import Extension, find_packages, setup
 from setuptools.command.build_ext import build_ext
 from setuptools.command.build_py import build_py as _build_py
@@ -34,15 +35,19 @@ module = Extension(
     sources=[
         "src/libiq_swig/libiq_wrapped.i",
         "src/libiq_swig/analyzer.cpp",
+        "src/libiq_swig/fft_plan_cache.cpp",
     ],
     swig_opts=["-c++", "-outdir", "src/libiq", "-Isrc/libiq_swig"],
     include_dirs=[
         "/usr/local/include",
         os.path.join(pwd, "src", "libiq_swig"),
+        numpy.get_include(),
     ],
     extra_objects=[
-        os.path.join(local_lib, "libfftw3.a"),
         os.path.join(local_lib, "libfftw3_threads.a"),
+        os.path.join(local_lib, "libfftw3f_threads.a"),
+        os.path.join(local_lib, "libfftw3.a"),
+        os.path.join(local_lib, "libfftw3f.a"),
     ],
     library_dirs=["/usr/local/lib"],
     language="c++",
@@ -1,14 +1,103 @@
+import os
 from enum import Enum
+from importlib import import_module
+from types import ModuleType
 
-from .libiqwrapped import (
-    Analyzer,
-    IQDataType_FLOAT32,
-    IQDataType_FLOAT64,
-    IQDataType_INT16
+from libiq.utils.logger import logger
+
+# "native" is the SWIG/FFTW extension, "numpy" the pure NumPy/SciPy fallback
+_BACKEND_MODULES = {
+    "native": "libiq.libiqwrapped",
+    "numpy": "libiq.numpy_backend",
+}
+
+# Names every backend module provides and libiq re-exports
+_BACKEND_NAMES = (
+    "Analyzer",
+    "FFTPlanRigor_ESTIMATE",
+    "FFTPlanRigor_MEASURE",
+    "FFTPlanRigor_PATIENT",
+    "IQCapture",
+    "IQDataType_FLOAT32",
+    "IQDataType_FLOAT64",
+    "IQDataType_INT16",
+    "IQPrecision_FLOAT32",
+    "IQPrecision_FLOAT64",
+    "StreamingSpectrogram",
+    "WindowFunction_BLACKMAN",
+    "WindowFunction_HAMMING",
+    "WindowFunction_HANN",
+    "WindowFunction_RECTANGULAR",
 )
 
 
+def load_backend(name: str) -> ModuleType:
+    """
+    Import an analysis backend without making it the default.
+
+    Args:
+        name (str): "native" (SWIG extension over FFTW) or "numpy" (NumPy/SciPy fallback).
+
+    Returns:
+        ModuleType: Module providing Analyzer, IQCapture, StreamingSpectrogram and the enum values.
+    """
+    if name not in _BACKEND_MODULES:
+        raise ValueError(f"Unknown backend: {name}. Expected one of {sorted(_BACKEND_MODULES)}.")
+    return import_module(_BACKEND_MODULES[name])
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the backend behind libiq.Analyzer, libiq.IQCapture and libiq.StreamingSpectrogram.
+
+    Objects created before the switch keep their backend, as do modules that already
+    bound the classes (e.g. with "from libiq import Analyzer").
+
+    Args:
+        name (str): "native" or "numpy".
+    """
+    global backend
+    module = load_backend(name)
+    globals().update({attribute: getattr(module, attribute) for attribute in _BACKEND_NAMES})
+    backend = name
+
+
+def _default_backend() -> str:
+    # LIBIQ_BACKEND forces a backend; otherwise the native one is preferred when it is built
+    requested = os.environ.get("LIBIQ_BACKEND", "auto")
+    if requested != "auto":
+        return requested
+    try:
+        load_backend("native")
+    except ImportError as e:
+        logger.warning(f"Native libiq extension unavailable ({e}); using the NumPy backend.")
+        return "numpy"
+    return "native"
+
+
+backend = None
+set_backend(_default_backend())
+
+
 class IQDataType(Enum):
     FLOAT32 = IQDataType_FLOAT32
     FLOAT64 = IQDataType_FLOAT64
     INT16 = IQDataType_INT16
+
+
+class IQPrecision(Enum):
+    FLOAT64 = IQPrecision_FLOAT64
+    FLOAT32 = IQPrecision_FLOAT32
+
+
+class WindowFunction(Enum):
+    RECTANGULAR = WindowFunction_RECTANGULAR
+    HANN = WindowFunction_HANN
+    HAMMING = WindowFunction_HAMMING
+    BLACKMAN = WindowFunction_BLACKMAN
+
+
+class FFTPlanRigor(Enum):
+    ESTIMATE = FFTPlanRigor_ESTIMATE
+    MEASURE = FFTPlanRigor_MEASURE
+    PATIENT = FFTPlanRigor_PATIENT
@@ -0,0 +1,92 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Operation names of process_files and the Analyzer methods they run
+FILE_OPERATIONS = {
+    "fft": "fastFourierTransformArray",
+    "psd": "calculatePSDArray",
+    "welch": "calculateWelchPSDArray",
+    "spectrogram": "generateIQSpectrogramArray",
+    "samples": "getIQSamplesArray",
+    "real": "realPartIQSamplesArray",
+    "imaginary": "imaginaryPartIQSamplesArray",
+    "features": "extractFeaturesArray",
+}
+
+# Stages reported by Analyzer.stats(), in pipeline order
+STATS_STAGES = ("read", "convert", "plan", "execute", "postprocess", "output")
+
+
+def _process_files_as_completed(method, paths, args, num_workers):
+    executor = ThreadPoolExecutor(max_workers=num_workers)
+    try:
+        pending = {executor.submit(method, path, *args): index for index, path in enumerate(paths)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class AnalyzerBatchMixin:
+    """
+    Python-level Analyzer methods shared by the native and NumPy backends.
+
+    The native proxy class cannot inherit from it, so it binds the methods in its class body
+    (process_files = AnalyzerBatchMixin.process_files, ...); the NumPy Analyzer subclasses it.
+    """
+
+    def process_files(self, paths, op, params=(), num_workers=None, ordered=True):
+        """
+        Run one analysis over many capture files concurrently.
+
+        The analysis methods release the GIL (native backend) or spend their time in NumPy and
+        scipy.fft, so a pool of worker threads reads and transforms several captures at once.
+
+        Args:
+            paths: Iterable of capture file paths.
+            op: Operation name ("fft", "psd", "welch", "spectrogram", "samples", "real",
+                "imaginary", "features") or the name of any Analyzer method taking a path first.
+            params: Arguments passed after the path, e.g. (sample_rate, data_type) for "psd".
+                Enum members (IQDataType, WindowFunction, ...) are passed by value.
+            num_workers: Number of worker threads (default: os.cpu_count()).
+            ordered: If True, return a list of results in the order of paths. If False,
+                return an iterator of (index, result) pairs in completion order.
+
+        Returns:
+            A list of NumPy arrays, or an iterator of (index, NumPy array) pairs.
+        """
+        method = getattr(self, FILE_OPERATIONS.get(op, op), None)
+        if method is None or op.startswith("_"):
+            raise ValueError(f"Unknown operation: {op}")
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if num_workers < 1:
+            raise ValueError("num_workers must be >= 1.")
+        args = tuple(getattr(param, "value", param) for param in params)
+        paths = [os.fspath(path) for path in paths]
+        if ordered:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                return list(executor.map(lambda path: method(path, *args), paths))
+        return _process_files_as_completed(method, paths, args, num_workers)
+
+    def stats(self):
+        """
+        Return the statistics collected since the last reset while setStatsEnabled(True).
+
+        Returns:
+            dict: {stage: {"ns": cumulative nanoseconds, "calls": count}} for the stages
+                read, convert, plan, execute, postprocess and output, plus "bytes_read"
+                and "plans_created" (always 0 on the NumPy backend, where scipy.fft does not
+                expose its plans). Stages running on several threads add up their thread time.
+        """
+        counters = dict(self.getStats())
+        stats = {stage: {"ns": counters[f"{stage}_ns"], "calls": counters[f"{stage}_calls"]} for stage in STATS_STAGES}
+        stats["bytes_read"] = counters["bytes_read"]
+        stats["plans_created"] = counters["plans_created"]
+        return stats
+
+    def reset_stats(self):
+        """Clear the counters returned by stats()."""
+        self.resetStats()
@@ -0,0 +1,185 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from libiq import Analyzer
+
+# Path-based *Array methods and the methods that accept an IQ array for the same result
+_NDARRAY_METHODS = {
+    "fastFourierTransformArray": "fastFourierTransform",
+    "calculatePSDArray": "calculatePSD",
+    "calculateWelchPSDArray": "calculateWelchPSD",
+    "generateIQSpectrogramArray": "generateIQSpectrogram",
+}
+
+
+class _BoundedExecutor:
+    def __init__(self, max_workers: int, max_pending: Optional[int], thread_name_prefix: str) -> None:
+        """
+        Thread pool that admits at most max_pending calls at a time.
+
+        Args:
+            max_workers (int): Number of worker threads.
+            max_pending (Optional[int]): Maximum number of admitted calls (queued or running);
+                further callers wait until a slot frees up. Defaults to 2 * max_workers.
+            thread_name_prefix (str): Name prefix of the worker threads.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1.")
+        if max_pending is None:
+            max_pending = 2 * max_workers
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1.")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending = 0
+
+    async def run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run function(*args) on the pool without blocking the event loop.
+
+        Waits for a free slot first (back-pressure). Cancelling the awaiting task drops a
+        call that has not started yet; a call that is already running finishes in its worker
+        thread, its result is discarded, and its slot is released when it returns.
+
+        Args:
+            function (Callable): Blocking function to call.
+            *args: Positional arguments of the call.
+
+        Returns:
+            The return value of function.
+        """
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._loop = loop
+        slots = self._slots
+        await slots.acquire()
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            slots.release()
+            raise
+        self._pending += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release, slots))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _release(self, slots: asyncio.Semaphore) -> None:
+        self._pending -= 1
+        slots.release()
+
+    @property
+    def pending(self) -> int:
+        """Number of admitted calls that have not completed yet."""
+        return self._pending
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut the worker threads down; calls that have not started are cancelled.
+
+        Args:
+            wait (bool): Whether to wait for the running calls to finish.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+class AsyncAnalyzer(_BoundedExecutor):
+    def __init__(
+        self,
+        analyzer: Optional[Analyzer] = None,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        """
+        Awaitable front end of an Analyzer for asyncio services.
+
+        The Analyzer is thread-safe and releases the GIL while it works, so several calls
+        run in parallel on the worker threads while the event loop keeps serving other tasks.
+
+        Args:
+            analyzer (Optional[Analyzer]): Analyzer to use (a new one by default).
+            max_workers (Optional[int]): Number of worker threads (default: os.cpu_count()).
+            max_pending (Optional[int]): Maximum number of admitted calls (default: 2 * max_workers).
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        super().__init__(max_workers, max_pending, "libiq-analyzer")
+        self.analyzer = analyzer if analyzer is not None else Analyzer()
+
+    async def call(self, method: str, *args: Any) -> Any:
+        """
+        Await any Analyzer method by name, e.g. await aio.call("calculatePSDArray", path, 1e6, data_type).
+        """
+        if method.startswith("_"):
+            raise ValueError(f"Unknown Analyzer method: {method}")
+        return await self.run(getattr(self.analyzer, method), *args)
+
+    async def fft(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        """Awaitable fastFourierTransformArray (a path or an IQ array, then its usual arguments)."""
+        return await self.run(self._array_call, "fastFourierTransformArray", iq_samples, args)
+
+    async def psd(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        """Awaitable calculatePSDArray (a path or an IQ array, then its usual arguments)."""
+        return await self.run(self._array_call, "calculatePSDArray", iq_samples, args)
+
+    async def welch_psd(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        """Awaitable calculateWelchPSDArray (a path or an IQ array, then its usual arguments)."""
+        return await self.run(self._array_call, "calculateWelchPSDArray", iq_samples, args)
+
+    async def spectrogram(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        """Awaitable generateIQSpectrogramArray (a path or an IQ array, then its usual arguments)."""
+        return await self.run(self._array_call, "generateIQSpectrogramArray", iq_samples, args)
+
+    async def samples(self, input_file_path: str, *args: Any) -> np.ndarray:
+        """Awaitable getIQSamplesArray."""
+        return await self.run(self.analyzer.getIQSamplesArray, input_file_path, *args)
+
+    async def features(self, iq_samples: Any, magnitude_floor: float = 0.0) -> np.ndarray:
+        """Awaitable extractFeaturesArray for an IQ array."""
+        return await self.run(self.analyzer.extractFeaturesArray, iq_samples, magnitude_floor)
+
+    def _array_call(self, method: str, iq_samples: Any, args: tuple) -> np.ndarray:
+        # NumPy inputs go through the list-method dispatch so both paths and arrays are accepted
+        if isinstance(iq_samples, np.ndarray):
+            method = _NDARRAY_METHODS[method]
+        return getattr(self.analyzer, method)(iq_samples, *args)
+
+
+class AsyncClassifier(_BoundedExecutor):
+    def __init__(self, classifier: Any, max_pending: Optional[int] = None) -> None:
+        """
+        Awaitable front end of a Classifier for asyncio services.
+
+        Classifier.predict keeps the time-window buffer between calls, so predictions run
+        one at a time, in submission order, on a single worker thread.
+
+        Args:
+            classifier (Classifier): Classifier with a loaded model.
+            max_pending (Optional[int]): Maximum number of admitted predictions (default: 2).
+        """
+        super().__init__(1, max_pending, "libiq-classifier")
+        self.classifier = classifier
+
+    async def predict(self, iq_data: np.ndarray) -> Any:
+        """
+        Awaitable Classifier.predict.
+
+        Args:
+            iq_data (np.ndarray): I/Q samples of shape (N, 2).
+
+        Returns:
+            The predicted label, or the last prediction while the time window is filling up.
+        """
+        return await self.run(self.classifier.predict, iq_data)
@@ -0,0 +1,265 @@
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from libiq.utils.constants import STATIC_LABELS
+from libiq.utils.logger import logger
+
+# Sentinel queued by close() to stop the dispatcher thread
+_STOP = object()
+
+
+class BatchingInferenceServer:
+    def __init__(
+        self,
+        classifier: Any,
+        max_batch_size: int = 32,
+        max_wait: float = 0.002,
+        latency_window: int = 10000,
+    ) -> None:
+        """
+        In-process micro-batching front end of a Classifier shared by many producers.
+
+        Producers (one per cell or stream, on any thread) submit preprocessed windows and get a
+        Future back. A dispatcher thread takes the oldest request, gathers more until
+        max_batch_size windows are queued or max_wait seconds have passed since that first
+        request, runs one model call for the whole batch and resolves every Future with its
+        own (label, probabilities) row. Under light load a request waits at most max_wait.
+
+        Args:
+            classifier (Classifier): Classifier with a loaded model (Keras, TFLite or ONNX).
+            max_batch_size (int): Maximum number of windows per model call.
+            max_wait (float): Maximum time in seconds the first request of a batch waits for more.
+            latency_window (int): Number of most recent request latencies kept for the percentiles.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1.")
+        if max_wait < 0:
+            raise ValueError("max_wait must be >= 0.")
+        if classifier.model is None:
+            raise ValueError("The model was not loaded correctly.")
+        self.classifier = classifier
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: "queue.Queue" = queue.Queue()
+        self._latencies: deque = deque(maxlen=latency_window)
+        self._stats_lock = threading.Lock()
+        # Guards _thread and _closed, and orders submissions before the stop sentinel
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.reset_stats()
+
+    def start(self) -> "BatchingInferenceServer":
+        """
+        Start the dispatcher thread (submit() starts it on first use).
+
+        Raises:
+            RuntimeError: If the server was closed.
+        """
+        with self._lock:
+            self._start_locked()
+        return self
+
+    def _start_locked(self) -> None:
+        if self._closed:
+            raise RuntimeError("The batching server is closed.")
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._serve, name="libiq-batching", daemon=True)
+            self._thread.start()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the dispatcher once the requests already submitted have been served.
+
+        Later submissions raise RuntimeError. Requests the dispatcher does not get to (it
+        was never started or has died) are cancelled.
+
+        Args:
+            timeout (Optional[float]): Maximum time in seconds to wait for the dispatcher. If
+                it is still running afterwards, it keeps serving the queued requests and
+                close() can be called again to wait for it.
+        """
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+            if thread is not None and thread.is_alive():
+                self._queue.put(_STOP)
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                return
+        with self._lock:
+            if self._thread is thread:
+                self._thread = None
+        self._cancel_pending()
+
+    def _cancel_pending(self) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                item[1].cancel()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def submit(self, features: np.ndarray) -> Future:
+        """
+        Queue one preprocessed window for classification.
+
+        Use asyncio.wrap_future on the result to await it from an event loop.
+
+        Args:
+            features (np.ndarray): Model input of shape (time_steps, 4), as returned by
+                Classifier.preprocessing.
+
+        Returns:
+            Future: Resolves to (label from STATIC_LABELS, class probabilities).
+
+        Raises:
+            ValueError: If the window does not match the model input shape.
+            RuntimeError: If the server was closed.
+        """
+        features = np.asarray(features, dtype=np.float32)
+        expected = tuple(self.classifier.model.input_shape[1:])
+        if len(features.shape) != len(expected) or any(
+            size is not None and size != actual for size, actual in zip(expected, features.shape)
+        ):
+            raise ValueError(f"Expected a window of shape {expected}; received {features.shape}.")
+        future: Future = Future()
+        with self._lock:
+            self._start_locked()
+            self._queue.put((features, future, time.perf_counter()))
+        return future
+
+    def submit_iq(self, iq_data: np.ndarray) -> Future:
+        """
+        Queue one raw I/Q window (time_window * max_window pairs) for classification.
+
+        Energy detection and preprocessing run on the calling thread, so producers prepare
+        their windows in parallel and only the model call is batched.
+
+        Args:
+            iq_data (np.ndarray): I/Q samples of shape (N, 2).
+
+        Returns:
+            Future: Resolves to (label from STATIC_LABELS, class probabilities).
+        """
+        cropped_data = self.classifier.apply_energy_detector_to_data(np.asarray(iq_data))
+        return self.submit(self.classifier.preprocessing(cropped_data))
+
+    def classify(self, features: np.ndarray, timeout: Optional[float] = None) -> Tuple[int, np.ndarray]:
+        """
+        Blocking submit(): wait for the (label, probabilities) of one preprocessed window.
+        """
+        return self.submit(features).result(timeout)
+
+    def _collect(self, first: tuple) -> Tuple[List[tuple], bool]:
+        batch = [first]
+        deadline = first[2] + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _serve(self) -> None:
+        stopping = False
+        try:
+            while not stopping:
+                first = self._queue.get()
+                if first is _STOP:
+                    break
+                batch, stopping = self._collect(first)
+                self._run_batch(batch)
+        finally:
+            # Nothing is queued after the stop sentinel unless the dispatcher failed
+            self._cancel_pending()
+
+    def _run_batch(self, batch: List[tuple]) -> None:
+        # Cancelled requests are dropped; windows of another shape than the first one cannot
+        # be stacked and fail on their own
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        shape = batch[0][0].shape
+        runnable = []
+        for item in batch:
+            if item[0].shape == shape:
+                runnable.append(item)
+            else:
+                item[1].set_exception(
+                    ValueError(f"Expected a window of shape {shape} in this batch; received {item[0].shape}.")
+                )
+        try:
+            probabilities = self.classifier.fast_predict(np.stack([item[0] for item in runnable]))
+        except Exception as e:
+            logger.error(f"Batched inference failed: {e}")
+            for item in runnable:
+                item[1].set_exception(e)
+            return
+
+        done = time.perf_counter()
+        with self._stats_lock:
+            self._batches += 1
+            self._requests += len(runnable)
+            if self._first_submit is None:
+                self._first_submit = runnable[0][2]
+            self._last_done = done
+            self._latencies.extend(done - item[2] for item in runnable)
+        for (_, future, _), row in zip(runnable, probabilities):
+            future.set_result((STATIC_LABELS[int(np.argmax(row))], row))
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Throughput and latency of the requests served since the last reset_stats().
+
+        Returns:
+            Dict[str, float]: "requests", "batches", "mean_batch_size", "throughput" (requests per
+                second between the first submission and the last completion) and the
+                "latency_p50_ms" / "latency_p99_ms" / "latency_max_ms" of the most recent requests,
+                measured from submit() to the Future resolving.
+        """
+        with self._stats_lock:
+            latencies = np.fromiter(self._latencies, dtype=np.float64) * 1e3
+            requests, batches = self._requests, self._batches
+            elapsed = self._last_done - self._first_submit if self._first_submit is not None else 0.0
+        report = {
+            "requests": requests,
+            "batches": batches,
+            "mean_batch_size": requests / batches if batches else 0.0,
+            "throughput": requests / elapsed if elapsed > 0 else 0.0,
+            "latency_p50_ms": 0.0,
+            "latency_p99_ms": 0.0,
+            "latency_max_ms": 0.0,
+        }
+        if len(latencies):
+            report["latency_p50_ms"] = float(np.percentile(latencies, 50))
+            report["latency_p99_ms"] = float(np.percentile(latencies, 99))
+            report["latency_max_ms"] = float(latencies.max())
+        return report
+
+    def reset_stats(self) -> None:
+        """Clear the request counters and latency samples."""
+        with self._stats_lock:
+            self._requests = 0
+            self._batches = 0
+            self._first_submit = None
+            self._last_done = None
+            self._latencies.clear()
@@ -1,24 +1,17 @@
 import os
-import random
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Optional, Sequence
 
 import numpy as np
-import tensorflow as tf
-from sklearn.metrics import (
-    accuracy_score,
-    confusion_matrix,
-    f1_score,
-    precision_score,
-    recall_score,
-)
-from tensorflow import keras
 
+from libiq.utils.features import extract_features
 from libiq.utils.logger import logger
-from libiq.classifier.energy_detector import energy_detector
-from libiq.plotter.confusion_matrix import plot_confusion_matrix
-from libiq.plotter.loss_curve import plot_loss_curve
+from libiq.utils.ring_buffer import IQRingBuffer
+from libiq.classifier.energy_detector import energy_detector, energy_detector_batch
+from libiq.classifier.interpreter import ONNXModel, TFLiteModel, is_interpreter_model, load_interpreter_model
 from libiq.utils.constants import (
     CNN_MODEL_PATH,
     PLOT_LABELS,
@@ -27,14 +20,38 @@ from libiq.utils.constants import (
     STATIC_LABELS,
 )
 
-os.environ["PYTHONHASHSEED"] = str(RANDOM_STATE)
-os.environ["TF_DETERMINISTIC_OPS"] = "1"
-os.environ["TF_CUDNN_DETERMINISTIC"] = "1"
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+if TYPE_CHECKING:
+    from tensorflow import keras
+
+# TensorFlow, scikit-learn and the plotters are imported on first use, so importing this
+# module (e.g. to run an exported model on the interpreter backend) stays cheap
+os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "3")
+
+
+def _set_cpu_affinity(cpus: Optional[Sequence[int]]) -> None:
+    # On Linux this pins the calling thread; threads it starts afterwards inherit the mask
+    if cpus is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+
 
-random.seed(RANDOM_STATE)
-np.random.seed(RANDOM_STATE)
-tf.random.set_seed(RANDOM_STATE)
+@contextmanager
+def _pinned(cpus: Optional[Sequence[int]]) -> Iterator[None]:
+    # Pins the calling thread only while the block runs (e.g. while a runtime starts its thread
+    # pools), then restores the caller's mask so threads started later are not confined
+    if cpus is None or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+    saved = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpus)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, saved)
+
+
+def _is_keras_model(model) -> bool:
+    # Interpreter models and None are told apart without importing TensorFlow
+    return model is not None and not isinstance(model, (TFLiteModel, ONNXModel))
 
 
 class Classifier:
@@ -49,6 +66,12 @@ class Classifier:
         model_path: Optional[str] = None,
         plots: bool = False,
         interactive_plots: bool = False,
+        deterministic: bool = False,
+        seed: int = RANDOM_STATE,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        cpu_affinity: Optional[Sequence[int]] = None,
+        inference_thread: bool = False,
     ) -> None:
         """
         Initialize the Classifier instance with parameters and optionally load a trained model.
@@ -58,7 +81,23 @@ class Classifier:
             input_vector (int): Length of each input vector.
             moving_avg_window (int): Window size for the moving average used in energy detection.
             extraction_window (int): Number of samples to extract after energy detection.
-            model_path (str, optional): Path to a pre-trained Keras model. If None, model is not loaded.
+            model_path (str, optional): Path to a pre-trained Keras model, or to a .tflite / .onnx export
+                run on the matching interpreter. If None, model is not loaded.
+            deterministic (bool): Seed Python, NumPy and TensorFlow with seed and enable TensorFlow's
+                deterministic kernels (reproducible training, slower on GPUs). Off by default.
+            seed (int): Seed used when deterministic is True.
+            intra_op_threads (int, optional): Threads used inside one TensorFlow op (and by the TFLite /
+                ONNX Runtime interpreter). None keeps the runtime default (every core).
+            inter_op_threads (int, optional): TensorFlow ops run concurrently. None keeps the default.
+            cpu_affinity (Sequence[int], optional): CPUs the TensorFlow and interpreter thread pools are
+                pinned to. The calling thread is pinned only while they are created and keeps its own
+                mask afterwards, so threads it starts later (e.g. Analyzer workers) are not confined.
+            inference_thread (bool): Run every model call on one dedicated thread (pinned to
+                cpu_affinity when given) instead of the calling thread.
+
+        The TensorFlow thread pools are process-wide and fixed by the first op, so the thread counts
+        of the first Classifier that builds or loads a Keras model in a process win; later different
+        values are reported with a warning.
         """
         self.time_window = time_window
         self.input_vector = input_vector
@@ -69,39 +108,180 @@ class Classifier:
         self.batch_size = batch_size
         self.plots = plots
         self.interactive_plots = interactive_plots
+        self.deterministic = deterministic
+        self.seed = seed
+        for name, threads in (("intra_op_threads", intra_op_threads), ("inter_op_threads", inter_op_threads)):
+            if threads is not None and threads < 1:
+                raise ValueError(f"{name} must be >= 1.")
+        if cpu_affinity is not None and len(cpu_affinity) == 0:
+            raise ValueError("cpu_affinity must list at least one CPU.")
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self.cpu_affinity = None if cpu_affinity is None else sorted(set(cpu_affinity))
+
+        if self.cpu_affinity is not None and not hasattr(os, "sched_setaffinity"):
+            logger.warning("CPU affinity is not supported on this platform; cpu_affinity is ignored.")
+
+        self._inference_executor = None
+        if inference_thread:
+            self._inference_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="libiq-inference",
+                initializer=_set_cpu_affinity,
+                initargs=(self.cpu_affinity,),
+            )
+
+        if self.deterministic:
+            self._seed_everything()
 
         if input_vector != extraction_window:
             self.input_vector = extraction_window
 
         if self.time_window > 1:
-            self.buffer = np.empty((0, 2))
+            # A block is classified as soon as it is complete, so at most one block
+            # minus one pair is left over and two blocks of capacity always suffice
+            self.buffer = IQRingBuffer(2 * self.time_window * self.max_window)
         else:
             self.buffer = None
 
-        if model_path is not None:
-            self.model = keras.models.load_model(model_path)
-        else:
-            self.model = None
-
         self.last_prediction = None
 
-        @tf.function
-        def fast_predict(x):
-            return self.model(x, training=False)
+        # Reused by predict: features are written in place and fed to the model as they are
+        self._features = None
+
+        self._keras_predict = None
+        self.load_model(model_path)
+
+    def _tensorflow(self):
+        """
+        Import TensorFlow and apply the thread-pool sizes (and cpu_affinity) before its first op.
+        """
+        import tensorflow as tf
+
+        threading_config = tf.config.threading
+        for name, requested, get, set_threads in (
+            ("intra-op", self.intra_op_threads, threading_config.get_intra_op_parallelism_threads,
+             threading_config.set_intra_op_parallelism_threads),
+            ("inter-op", self.inter_op_threads, threading_config.get_inter_op_parallelism_threads,
+             threading_config.set_inter_op_parallelism_threads),
+        ):
+            if requested is None or get() == requested:
+                continue
+            try:
+                set_threads(requested)
+            except RuntimeError:
+                logger.warning(
+                    f"TensorFlow is already initialized; keeping {get() or 'the default number of'} "
+                    f"{name} threads instead of {requested}."
+                )
+        if self.cpu_affinity is not None:
+            # The first op starts the process-wide pools, which inherit the mask of this thread
+            with _pinned(self.cpu_affinity):
+                tf.zeros(())
+        return tf
+
+    def _keras(self):
+        self._tensorflow()
+        from tensorflow import keras
+
+        return keras
 
-        self.fast_predict = fast_predict
+    def _seed_everything(self) -> None:
+        """
+        Make runs reproducible: seed Python, NumPy and TensorFlow and enable deterministic TF ops.
+        """
+        os.environ["PYTHONHASHSEED"] = str(self.seed)
+        os.environ["TF_DETERMINISTIC_OPS"] = "1"
+        os.environ["TF_CUDNN_DETERMINISTIC"] = "1"
+        tf = self._tensorflow()
+
+        # Seeds Python, NumPy, TensorFlow and the Keras weight initialisers (which
+        # tf.random.set_seed alone does not reach)
+        self._keras().utils.set_random_seed(self.seed)
+        tf.config.experimental.enable_op_determinism()
 
     def load_model(self, model_path: Optional[str] = None) -> None:
         """
-        Load a trained Keras model from a given path.
+        Load a trained model from a given path.
+
+        Keras files are loaded with Keras; .tflite and .onnx files run on the TFLite interpreter
+        and ONNX Runtime, with the same predict/cnn_test_dapp semantics.
 
         Args:
-            model_path (str, optional): File path to the saved Keras model. If None, does not load anything.
+            model_path (str, optional): File path to the saved model. If None, does not load anything.
         """
-        if model_path is not None:
-            self.model = keras.models.load_model(model_path)
-        else:
+        if model_path is None:
             self.model = None
+            return
+        # Interpreters start their thread pools when the model is loaded
+        with _pinned(self.cpu_affinity):
+            if is_interpreter_model(model_path):
+                self.model = load_interpreter_model(model_path, self.intra_op_threads)
+            else:
+                self.model = self._keras().models.load_model(model_path)
+
+    def fast_predict(self, x: np.ndarray) -> np.ndarray:
+        """
+        Return the class probabilities of a (batch, time_steps, 4) input on the loaded backend.
+
+        With inference_thread=True the call runs on the dedicated inference thread.
+        """
+        if self._inference_executor is not None:
+            return self._inference_executor.submit(self._run_model, x).result()
+        return self._run_model(x)
+
+    def _run_model(self, x: np.ndarray) -> np.ndarray:
+        if not _is_keras_model(self.model):
+            return self.model(x)
+        # A Keras model was built or loaded through _keras(), so the thread pools are configured
+        import tensorflow as tf
+
+        if self._keras_predict is None:
+            # Batches of different sizes share one generalised trace instead of retracing per size
+            @tf.function(reduce_retracing=True)
+            def keras_predict(x):
+                return self.model(x, training=False)
+
+            self._keras_predict = keras_predict
+        return np.asarray(self._keras_predict(tf.convert_to_tensor(x, dtype=tf.float32)))
+
+    def close(self) -> None:
+        """
+        Stop the dedicated inference thread (if any) once its current call returns.
+        """
+        if self._inference_executor is not None:
+            self._inference_executor.shutdown(wait=True)
+            self._inference_executor = None
+
+    def export_model(
+        self,
+        output_path: str,
+        quantization: Optional[str] = None,
+        calibration_data: Optional[np.ndarray] = None,
+    ) -> str:
+        """
+        Export the loaded Keras model to TFLite (.tflite) or ONNX (.onnx).
+
+        Args:
+            output_path (str): Destination file; the suffix selects the format.
+            quantization (Optional[str]): TFLite only: None, "float16" or "int8".
+            calibration_data (Optional[np.ndarray]): Representative inputs (e.g. x_train) for "int8".
+
+        Returns:
+            str: Path of the written model.
+
+        Raises:
+            ValueError: If no Keras model is loaded or the format does not support the quantization.
+        """
+        from libiq.classifier.export import export_onnx, export_tflite
+
+        if not _is_keras_model(self.model):
+            raise ValueError("Exporting requires a loaded Keras model.")
+        if Path(output_path).suffix.lower() == ".onnx":
+            if quantization is not None:
+                raise ValueError("Quantization is only supported for TFLite exports.")
+            return export_onnx(self.model, output_path)
+        return export_tflite(self.model, output_path, quantization, calibration_data)
 
     def apply_energy_detector_to_data(self, iq_data: np.ndarray) -> np.ndarray:
         """
@@ -115,7 +295,11 @@ class Classifier:
         """
         if iq_data.ndim == 1:
             iq_data = iq_data.reshape(-1, 2)
-        complex_data = iq_data[:, 0] + 1j * iq_data[:, 1]
+        if iq_data.dtype == np.float64 and iq_data.flags.c_contiguous:
+            # Interleaved float64 pairs already have the complex128 layout
+            complex_data = iq_data.view(np.complex128).reshape(-1)
+        else:
+            complex_data = iq_data[:, 0] + 1j * iq_data[:, 1]
         data_matrix = complex_data.reshape(self.time_window, self.max_window)
         updated_n_samples, cropped_data = energy_detector(
             data_matrix,
@@ -129,44 +313,87 @@ class Classifier:
         Run prediction on the given I/Q data.
 
         This function buffers the input if necessary, applies energy detection and preprocessing,
-        and uses the loaded CNN model to return the predicted class label.
+        and uses the loaded CNN model to return the predicted class label. With time_window > 1,
+        chunks accumulate in a preallocated ring buffer and every complete block of
+        time_window * max_window pairs is classified in order.
 
         Args:
             iq_data (np.ndarray): Raw I/Q samples to classify.
 
         Returns:
-            int: Predicted class label from STATIC_LABELS, or the last prediction if buffer is not full yet.
+            int: Predicted class label from STATIC_LABELS (of the last complete block), or the last
+                prediction if buffer is not full yet.
 
         Raises:
             ValueError: If model is not loaded or input shape is incorrect.
         """
         if self.buffer is not None:
-            iq_data_arr = np.array(iq_data).reshape(-1, 2)
-            self.buffer = np.concatenate((self.buffer, iq_data_arr), axis=0)
-
-            if self.buffer.shape[0] < self.time_window * self.max_window:
-                return self.last_prediction
-
-            if self.buffer.shape[0] == self.time_window * self.max_window:
-                data_to_predict = self.buffer
-                self.buffer = np.empty((0, 2))
-            else:
-                data_to_predict = self.buffer[: self.time_window * self.max_window]
-                self.buffer = self.buffer[self.time_window * self.max_window :]
-
-            cropped_data = self.apply_energy_detector_to_data(data_to_predict)
-            preprocessed_data = self.preprocessing(cropped_data)
-            result = self.cnn_test_dapp(preprocessed_data)
-            self.last_prediction = result
-            return result
+            block_size = self.time_window * self.max_window
+            iq_data_arr = np.asarray(iq_data).reshape(-1, 2)
+            offset = 0
+            while offset < len(iq_data_arr):
+                count = min(len(iq_data_arr) - offset, self.buffer.free)
+                self.buffer.push(iq_data_arr[offset : offset + count])
+                offset += count
+                while len(self.buffer) >= block_size:
+                    # The block is read in place, so it is released once its features are written
+                    cropped_data = self.apply_energy_detector_to_data(self.buffer.peek(block_size))
+                    preprocessed_data = self.preprocessing(cropped_data, out=self._feature_buffer(cropped_data.size))
+                    self.buffer.consume(block_size)
+                    self.last_prediction = self.cnn_test_dapp(preprocessed_data)
+            return self.last_prediction
 
         else:
             processed_data = self.apply_energy_detector_to_data(iq_data)
-            preprocessed_data = self.preprocessing(processed_data)
+            preprocessed_data = self.preprocessing(processed_data, out=self._feature_buffer(processed_data.size))
             result = self.cnn_test_dapp(preprocessed_data)
             self.last_prediction = result
             return result
 
+    def predict_batch(self, iq_windows: np.ndarray) -> Tuple[List[int], np.ndarray]:
+        """
+        Classify a stack of I/Q windows with one model invocation.
+
+        Each window holds time_window * max_window I/Q pairs, as a complete block given to
+        predict. Energy detection and preprocessing run vectorised over the whole batch and
+        the time-window buffer of predict is neither used nor modified.
+
+        Args:
+            iq_windows (np.ndarray): I/Q windows of shape (batch, time_window * max_window, 2)
+                or (batch, 2 * time_window * max_window) with interleaved [real, imaginary] values.
+
+        Returns:
+            Tuple[List[int], np.ndarray]: Predicted label from STATIC_LABELS for every window,
+                and the class probabilities of shape (batch, classes).
+
+        Raises:
+            ValueError: If model is not loaded or input shape is incorrect.
+        """
+        if self.model is None:
+            raise ValueError("The model was not loaded correctly.")
+
+        iq_windows = np.asarray(iq_windows)
+        block_size = self.time_window * self.max_window
+        if iq_windows.ndim < 2 or np.prod(iq_windows.shape[1:]) != 2 * block_size:
+            raise ValueError(
+                f"Expected windows of {block_size} I/Q pairs; received an array of shape {iq_windows.shape}."
+            )
+        batch_size = iq_windows.shape[0]
+        if batch_size == 0:
+            return [], np.empty((0, self.model.output_shape[-1]), dtype=np.float32)
+
+        iq_pairs = iq_windows.reshape(batch_size, block_size, 2)
+        complex_data = iq_pairs[:, :, 0] + 1j * iq_pairs[:, :, 1]
+        _, cropped_data = energy_detector_batch(
+            complex_data.reshape(batch_size, self.time_window, self.max_window),
+            extraction_window=self.extraction_window,
+            moving_avg_window=self.moving_avg_window,
+        )
+        features = extract_features(cropped_data.reshape(-1), magnitude_floor=np.finfo(float).eps)
+        probabilities = self.fast_predict(features.reshape(batch_size, cropped_data.shape[1], 4))
+        labels = [STATIC_LABELS[index] for index in np.argmax(probabilities, axis=1)]
+        return labels, probabilities
+
     def cnn_metrics(
         self, y_true: List[int], y_pred: List[int], path: str = ''
     ) -> Tuple[float, float, float, float]:
@@ -184,6 +411,14 @@ class Classifier:
         Raises:
             ValueError: If input label lists are not the same length.
         """
+        from sklearn.metrics import (
+            accuracy_score,
+            confusion_matrix,
+            f1_score,
+            precision_score,
+            recall_score,
+        )
+
         try:
             if len(y_true) != len(y_pred):
                 raise ValueError(
@@ -205,6 +440,8 @@ class Classifier:
             logger.info(f"    F1 Score: {f1}")
 
             if self.plots:
+                from libiq.plotter.confusion_matrix import plot_confusion_matrix
+
                 plot_confusion_matrix(cm, PLOT_LABELS, path, self.interactive_plots)
 
             return acc, precision, recall, f1
@@ -236,7 +473,7 @@ class Classifier:
         except (TypeError, ValueError) as e:
             raise e
 
-    def make_model(self, num_classes: int, input_shape: tuple) -> keras.models.Model:
+    def make_model(self, num_classes: int, input_shape: tuple) -> "keras.models.Model":
         """
         Build a simple 1D CNN model architecture.
 
@@ -250,6 +487,7 @@ class Classifier:
         Raises:
             ValueError: If input shape is empty or invalid.
         """
+        keras = self._keras()
         try:
             if len(input_shape) == 0:
                 raise ValueError("input_shape must be a non-empty tuple.")
@@ -300,6 +538,7 @@ class Classifier:
             if x_train is None or len(x_train) == 0:
                 raise ValueError("The input time series is empty or None.")
 
+            keras = self._keras()
             model = self.make_model(
                 7, input_shape=(self.time_window * self.input_vector, 4)
             )
@@ -339,6 +578,8 @@ class Classifier:
             )
 
             if self.plots:
+                from libiq.plotter.loss_curve import plot_loss_curve
+
                 plot_loss_curve(
                     history.history,
                     path=f"{path}loss_curve_train.pdf",
@@ -371,7 +612,10 @@ class Classifier:
             if x_test is None or len(x_test) == 0:
                 raise ValueError("The input time series is empty or None.")
 
-            y_pred = self.model.predict(x_test)
+            if _is_keras_model(self.model):
+                y_pred = self.model.predict(x_test)
+            else:
+                y_pred = self.model(x_test)
             y_pred_classes = np.argmax(y_pred, axis=1)
             acc, precision, recall, f1 = self.cnn_metrics(
                 y_test, y_pred_classes, f"{path}confusion_matrix_test.pdf"
@@ -414,7 +658,6 @@ class Classifier:
         elif x.ndim == 3 and x.shape[0] != 1:
             x = x[0:1, :, :]
 
-        x = tf.convert_to_tensor(x, dtype=tf.float32)
         predictions = self.fast_predict(x)
 
         if predictions.ndim == 2:
@@ -426,25 +669,22 @@ class Classifier:
         final_label = Counter(y_pred_classes).most_common(1)[0][0]
         return STATIC_LABELS[final_label]
 
-    def preprocessing(self, iq_data: np.ndarray) -> np.ndarray:
+    def preprocessing(self, iq_data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Convert raw I/Q samples into a 4-channel input: real, imag, magnitude in dB, and phase.
 
         Args:
             iq_data (np.ndarray): Raw complex I/Q data.
+            out (np.ndarray, optional): Preallocated float32 (samples, 4) array written in place.
 
         Returns:
-            np.ndarray: Preprocessed data of shape (samples, 4).
+            np.ndarray: Preprocessed float32 data of shape (samples, 4).
         """
-        iq_array = np.array(iq_data).reshape(-1)
-        real_vals = np.real(iq_array)
-        imag_vals = np.imag(iq_array)
-
-        mag_vals = np.sqrt(np.clip(real_vals**2 + imag_vals**2, a_min=0, a_max=None))
-        eps = np.finfo(float).eps
-        mag_dB = 20 * np.log10(np.maximum(mag_vals, eps))
-        mag_dB[mag_vals == 0] = 0
-        phase_vals = np.arctan2(imag_vals, real_vals)
-
-        x = np.stack((real_vals, imag_vals, phase_vals, mag_dB), axis=1)
-        return x
+        iq_array = np.asarray(iq_data).reshape(-1)
+        return extract_features(iq_array, magnitude_floor=np.finfo(float).eps, out=out)
+
+    def _feature_buffer(self, num_samples: int) -> np.ndarray:
+        # The block size only changes with the classifier parameters, so this allocates once
+        if self._features is None or len(self._features) != num_samples:
+            self._features = np.empty((num_samples, 4), dtype=np.float32)
+        return self._features
@@ -0,0 +1,138 @@
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import tensorflow as tf
+from tensorflow import keras
+
+from libiq.classifier.interpreter import load_interpreter_model
+from libiq.utils.logger import logger
+
+# Post-training quantisation modes accepted by export_tflite
+QUANTIZATION_MODES = (None, "float16", "int8")
+
+
+def export_tflite(
+    model: keras.models.Model,
+    output_path: str,
+    quantization: Optional[str] = None,
+    calibration_data: Optional[np.ndarray] = None,
+    calibration_samples: int = 200,
+) -> str:
+    """
+    Convert a Keras classifier to a TFLite flatbuffer, optionally with post-training quantisation.
+
+    "float16" stores the weights as float16. "int8" quantises weights and activations to int8,
+    calibrated on calibration_data (typically the training features); the model inputs and
+    outputs stay float32 so the interpreter is fed the same features as the Keras model.
+
+    Args:
+        model (keras.models.Model): Trained Keras model.
+        output_path (str): Destination .tflite file.
+        quantization (Optional[str]): None, "float16" or "int8".
+        calibration_data (Optional[np.ndarray]): Representative inputs of shape (N, time_steps, 4),
+            required for "int8".
+        calibration_samples (int): Maximum number of calibration inputs used.
+
+    Returns:
+        str: Path of the written model.
+
+    Raises:
+        ValueError: If the quantisation mode is unknown or int8 has no calibration data.
+    """
+    if quantization not in QUANTIZATION_MODES:
+        raise ValueError(f"Unknown quantization: {quantization}. Expected one of {QUANTIZATION_MODES}.")
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if quantization == "float16":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == "int8":
+        if calibration_data is None or len(calibration_data) == 0:
+            raise ValueError("int8 quantization requires calibration_data.")
+        calibration = np.asarray(calibration_data, dtype=np.float32)[:calibration_samples]
+
+        def representative_dataset():
+            for sample in calibration:
+                yield [sample[np.newaxis]]
+
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(converter.convert())
+    logger.info(f"Exported TFLite model ({quantization or 'float32'}) to {output_path}")
+    return str(output_path)
+
+
+def export_onnx(model: keras.models.Model, output_path: str, opset: int = 13) -> str:
+    """
+    Convert a Keras classifier to ONNX with tf2onnx.
+
+    Args:
+        model (keras.models.Model): Trained Keras model.
+        output_path (str): Destination .onnx file.
+        opset (int): ONNX opset version.
+
+    Returns:
+        str: Path of the written model.
+    """
+    try:
+        import tf2onnx
+    except ImportError as e:
+        raise ImportError("Exporting to ONNX requires tf2onnx (pip install tf2onnx).") from e
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    input_signature = [tf.TensorSpec((None, *model.input_shape[1:]), tf.float32, name="input")]
+    tf2onnx.convert.from_keras(model, input_signature=input_signature, opset=opset, output_path=str(output_path))
+    logger.info(f"Exported ONNX model to {output_path}")
+    return str(output_path)
+
+
+def check_parity(
+    model: keras.models.Model,
+    exported_path: str,
+    x: np.ndarray,
+    y: Optional[np.ndarray] = None,
+    batch_size: int = 64,
+) -> Dict[str, float]:
+    """
+    Compare an exported (.tflite / .onnx) classifier with the Keras model it came from.
+
+    Args:
+        model (keras.models.Model): Reference Keras model.
+        exported_path (str): Path to the exported model.
+        x (np.ndarray): Inputs of shape (N, time_steps, 4).
+        y (Optional[np.ndarray]): Class indices; when given, both accuracies are reported.
+        batch_size (int): Number of inputs per inference call.
+
+    Returns:
+        Dict[str, float]: "agreement" (fraction of equal argmax predictions), "max_abs_diff"
+            (largest probability difference) and, with y, "keras_accuracy" and "exported_accuracy".
+    """
+    x = np.asarray(x, dtype=np.float32)
+    exported = load_interpreter_model(exported_path)
+    keras_probabilities = []
+    exported_probabilities = []
+    for start in range(0, len(x), batch_size):
+        batch = x[start : start + batch_size]
+        keras_probabilities.append(np.asarray(model(batch, training=False)))
+        exported_probabilities.append(exported(batch))
+    keras_probabilities = np.concatenate(keras_probabilities)
+    exported_probabilities = np.concatenate(exported_probabilities)
+
+    keras_classes = np.argmax(keras_probabilities, axis=1)
+    exported_classes = np.argmax(exported_probabilities, axis=1)
+    report = {
+        "agreement": float(np.mean(keras_classes == exported_classes)),
+        "max_abs_diff": float(np.max(np.abs(keras_probabilities - exported_probabilities))),
+    }
+    if y is not None:
+        y = np.asarray(y)
+        report["keras_accuracy"] = float(np.mean(keras_classes == y))
+        report["exported_accuracy"] = float(np.mean(exported_classes == y))
+    logger.info(f"Parity of {exported_path} against Keras: {report}")
+    return report
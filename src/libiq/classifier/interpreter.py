@@ -0,0 +1,135 @@
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Models with these suffixes run on a lightweight interpreter instead of Keras
+INTERPRETER_SUFFIXES = (".tflite", ".onnx")
+
+
+def _tflite_interpreter_class():
+    # The standalone runtimes avoid importing TensorFlow; tf.lite is the fallback
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+
+            Interpreter = tf.lite.Interpreter
+    return Interpreter
+
+
+class TFLiteModel:
+    def __init__(self, model_path: str, num_threads: Optional[int] = None) -> None:
+        """
+        Run a .tflite classifier (float32, float16 or int8 quantised) on the TFLite interpreter.
+
+        Inputs and outputs of integer-quantised models are (de)quantised with the tensor
+        parameters, so the model is always fed float32 features and returns probabilities.
+
+        Args:
+            model_path (str): Path to the .tflite file.
+            num_threads (Optional[int]): Number of interpreter threads (default: runtime default).
+        """
+        self.model_path = str(model_path)
+        self._interpreter = _tflite_interpreter_class()(model_path=self.model_path, num_threads=num_threads)
+        self._interpreter.allocate_tensors()
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._batch_size = int(self._input["shape"][0])
+
+    @property
+    def input_shape(self) -> Tuple:
+        return (None, *(int(size) for size in self._input["shape"][1:]))
+
+    @property
+    def output_shape(self) -> Tuple:
+        return (None, *(int(size) for size in self._output["shape"][1:]))
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Return the class probabilities of a (batch, samples, 4) float32 input.
+        """
+        x = np.asarray(x, dtype=np.float32)
+        if x.shape[0] != self._batch_size:
+            self._interpreter.resize_tensor_input(self._input["index"], list(x.shape))
+            self._interpreter.allocate_tensors()
+            self._input = self._interpreter.get_input_details()[0]
+            self._output = self._interpreter.get_output_details()[0]
+            self._batch_size = x.shape[0]
+        input_dtype = self._input["dtype"]
+        if np.issubdtype(input_dtype, np.integer):
+            scale, zero_point = self._input["quantization"]
+            info = np.iinfo(input_dtype)
+            x = np.clip(np.round(x / scale + zero_point), info.min, info.max)
+        self._interpreter.set_tensor(self._input["index"], x.astype(input_dtype, copy=False))
+        self._interpreter.invoke()
+        predictions = self._interpreter.get_tensor(self._output["index"])
+        if np.issubdtype(predictions.dtype, np.integer):
+            scale, zero_point = self._output["quantization"]
+            predictions = (predictions.astype(np.float32) - zero_point) * scale
+        return predictions
+
+
+class ONNXModel:
+    def __init__(self, model_path: str, num_threads: Optional[int] = None) -> None:
+        """
+        Run a .onnx classifier on ONNX Runtime (CPU).
+
+        Args:
+            model_path (str): Path to the .onnx file.
+            num_threads (Optional[int]): Number of intra-op threads (default: runtime default).
+        """
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError("Running .onnx models requires onnxruntime (pip install onnxruntime).") from e
+        self.model_path = str(model_path)
+        options = onnxruntime.SessionOptions()
+        if num_threads is not None:
+            options.intra_op_num_threads = num_threads
+        self._session = onnxruntime.InferenceSession(
+            self.model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._input = self._session.get_inputs()[0]
+        self._output = self._session.get_outputs()[0]
+
+    @property
+    def input_shape(self) -> Tuple:
+        return (None, *(size if isinstance(size, int) else None for size in self._input.shape[1:]))
+
+    @property
+    def output_shape(self) -> Tuple:
+        return (None, *(size if isinstance(size, int) else None for size in self._output.shape[1:]))
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Return the class probabilities of a (batch, samples, 4) float32 input.
+        """
+        x = np.asarray(x, dtype=np.float32)
+        return self._session.run([self._output.name], {self._input.name: x})[0]
+
+
+def is_interpreter_model(model_path: str) -> bool:
+    """
+    Whether a model file is run by an interpreter backend (.tflite or .onnx) rather than Keras.
+    """
+    return Path(model_path).suffix.lower() in INTERPRETER_SUFFIXES
+
+
+def load_interpreter_model(model_path: str, num_threads: Optional[int] = None):
+    """
+    Load a .tflite or .onnx classifier.
+
+    Args:
+        model_path (str): Path to the model file.
+        num_threads (Optional[int]): Number of inference threads (default: runtime default).
+
+    Returns:
+        TFLiteModel or ONNXModel: Callable returning class probabilities.
+    """
+    if Path(model_path).suffix.lower() == ".onnx":
+        return ONNXModel(model_path, num_threads)
+    return TFLiteModel(model_path, num_threads)
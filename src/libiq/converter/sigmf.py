@@ -1,10 +1,159 @@
 import json
 import os
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import scipy.io as sio
 
+from libiq import IQDataType
 from libiq.utils.logger import logger
 
+# SigMF datatype strings: [c]omplex or [r]eal, the value type, and the byte order
+_SIGMF_DATATYPE = re.compile(r"^(?P<kind>[cr])(?P<type>f64|f32|i32|i16|i8|u32|u16|u8)(?P<order>_le|_be)?$")
+
+# Complex datatypes the Analyzer reads in place
+_ANALYZER_DATA_TYPES = {
+    "ci16_le": IQDataType.INT16,
+    "cf32_le": IQDataType.FLOAT32,
+    "cf64_le": IQDataType.FLOAT64,
+}
+
+
+def _sigmf_field(entry: Dict[str, Any], name: str, default: Any = None) -> Any:
+    # Accepts both namespaced ("core:sample_rate") and bare ("sample_rate") keys
+    return entry.get(f"core:{name}", entry.get(name, default))
+
+
+class SigMFRecording:
+    def __init__(self, path: str) -> None:
+        """
+        Open a SigMF recording: parse its .sigmf-meta and memory-map its .sigmf-data.
+
+        Args:
+            path (str): Path of the recording, with or without the .sigmf-meta/.sigmf-data extension.
+
+        Raises:
+            FileNotFoundError: If the metadata or the dataset file does not exist.
+            ValueError: If the metadata is invalid or the datatype is not a complex SigMF datatype.
+        """
+        base = str(path)
+        for ext in (".sigmf-meta", ".sigmf-data"):
+            if base.endswith(ext):
+                base = base[: -len(ext)]
+        self.meta_path = base + ".sigmf-meta"
+        self.data_path = base + ".sigmf-data"
+
+        with open(self.meta_path, "r") as f:
+            try:
+                self.metadata = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid SigMF metadata in {self.meta_path}: {e}") from None
+
+        self.global_info: Dict[str, Any] = self.metadata.get("global", {})
+        self.captures: List[Dict[str, Any]] = self.metadata.get("captures", [])
+        self.annotations: List[Dict[str, Any]] = sorted(
+            self.metadata.get("annotations", []), key=lambda a: _sigmf_field(a, "sample_start", 0)
+        )
+        self.datatype: str = _sigmf_field(self.global_info, "datatype", "")
+        self.value_dtype = self._parse_datatype(self.datatype)
+        sample_rate = _sigmf_field(self.global_info, "sample_rate")
+        self.sample_rate: Optional[float] = float(sample_rate) if sample_rate is not None else None
+        self.data_type: Optional[IQDataType] = _ANALYZER_DATA_TYPES.get(self.datatype)
+
+        header_bytes = _sigmf_field(self.captures[0], "header_bytes", 0) if self.captures else 0
+        sample_size = 2 * self.value_dtype.itemsize
+        data_size = os.path.getsize(self.data_path) - header_bytes
+        if data_size < 0 or data_size % sample_size != 0:
+            raise ValueError(
+                f"Dataset size of {self.data_path} is not aligned with the datatype {self.datatype}."
+            )
+        self.num_samples = data_size // sample_size
+        if self.num_samples == 0:
+            self._samples = np.zeros((0, 2), dtype=self.value_dtype)
+        else:
+            self._samples = np.memmap(
+                self.data_path, dtype=self.value_dtype, mode="r", offset=header_bytes, shape=(self.num_samples, 2)
+            )
+        logger.debug(f"Opened SigMF recording {base}: {self.num_samples} samples of {self.datatype}")
+
+    @staticmethod
+    def _parse_datatype(datatype: str) -> np.dtype:
+        match = _SIGMF_DATATYPE.match(datatype)
+        if match is None:
+            raise ValueError(f"Unsupported SigMF datatype: '{datatype}'")
+        if match["kind"] != "c":
+            raise ValueError(f"SigMF datatype '{datatype}' is real-valued; IQ recordings must be complex.")
+        kind = match["type"][0]
+        itemsize = int(match["type"][1:]) // 8
+        order = ">" if match["order"] == "_be" else "<"
+        return np.dtype(f"{order}{kind}{itemsize}")
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        Read-only (N, 2) array of [real, imaginary] values backed by the memory-mapped dataset.
+        For ci16_le, cf32_le and cf64_le it can be passed to any Analyzer method as is.
+        """
+        return self._samples
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+    def read(self, start: int = 0, count: Optional[int] = None) -> np.ndarray:
+        """
+        Return the samples in [start, start + count) as an (count, 2) array.
+
+        Datatypes the Analyzer reads in place are returned as views of the mapping, so only
+        the pages of the requested range are ever read from disk; other datatypes (e.g. ci8,
+        big-endian) are converted to float32 for the requested range only.
+
+        Args:
+            start (int): Index of the first sample.
+            count (Optional[int]): Number of samples (default: up to the end of the recording).
+
+        Returns:
+            np.ndarray: The (count, 2) array of [real, imaginary] values.
+        """
+        if start < 0 or start > self.num_samples:
+            raise ValueError(f"start must be in [0, {self.num_samples}], received {start}.")
+        end = self.num_samples if count is None else min(start + max(count, 0), self.num_samples)
+        samples = self._samples[start:end]
+        if self.data_type is None:
+            samples = samples.astype(np.float32)
+        return samples
+
+    def annotation_range(self, annotation: Union[int, Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Return the [start, end) sample range of an annotation (by index or as a dict).
+        Annotations without sample_count extend to the end of the recording.
+        """
+        if isinstance(annotation, int):
+            annotation = self.annotations[annotation]
+        start = int(_sigmf_field(annotation, "sample_start", 0))
+        count = _sigmf_field(annotation, "sample_count")
+        end = self.num_samples if count is None else min(start + int(count), self.num_samples)
+        return start, end
+
+    def read_annotation(self, annotation: Union[int, Dict[str, Any]]) -> np.ndarray:
+        """
+        Return the samples covered by an annotation (by index or as a dict); see read().
+        """
+        start, end = self.annotation_range(annotation)
+        return self.read(start, end - start)
+
+    def capture_at(self, sample_index: int) -> Optional[Dict[str, Any]]:
+        """
+        Return the capture segment containing a sample index (None if there are no captures).
+        """
+        current = None
+        for capture in self.captures:
+            if int(_sigmf_field(capture, "sample_start", 0)) > sample_index:
+                break
+            current = capture
+        return current
+
+
 class SigMFConverter:
     def __init__(
         self,
@@ -0,0 +1,835 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Sequence
+
+import numpy as np
+import scipy.fft
+
+from libiq._batch import STATS_STAGES, AnalyzerBatchMixin
+from libiq.utils.logger import logger
+
+# Enum values shared with the native extension, so libiq.IQDataType & co. work with both backends
+IQDataType_FLOAT32 = 0
+IQDataType_FLOAT64 = 1
+IQDataType_INT16 = 2
+
+WindowFunction_RECTANGULAR = 0
+WindowFunction_HANN = 1
+WindowFunction_HAMMING = 2
+WindowFunction_BLACKMAN = 3
+
+IQPrecision_FLOAT64 = 0
+IQPrecision_FLOAT32 = 1
+
+FFTPlanRigor_ESTIMATE = 0
+FFTPlanRigor_MEASURE = 1
+FFTPlanRigor_PATIENT = 2
+
+_VALUE_TYPES = {
+    IQDataType_FLOAT32: np.dtype(np.float32),
+    IQDataType_FLOAT64: np.dtype(np.float64),
+    IQDataType_INT16: np.dtype(np.int16),
+}
+
+_IQ_ARRAY_TYPES = {
+    np.dtype(np.complex64): IQDataType_FLOAT32,
+    np.dtype(np.complex128): IQDataType_FLOAT64,
+    np.dtype(np.float32): IQDataType_FLOAT32,
+    np.dtype(np.float64): IQDataType_FLOAT64,
+    np.dtype(np.int16): IQDataType_INT16,
+}
+
+_BINARY_EXTENSIONS = (".iq", ".bin")
+_CSV_EXTENSIONS = (".csv", ".CSV", ".txt")
+_DEFAULT_CSV_COLUMNS = ("Real", "Imaginary")
+
+# Same thresholds as the native backend: FFTs of at least this many samples use several workers
+_THREADED_FFT_MIN_SIZE = 1 << 15
+# Spectrogram windows and Welch segments are transformed in batches of about this many
+# samples per scipy.fft call, which bounds the complex temporaries
+_FFT_BATCH_SAMPLES = 1 << 20
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _value_type(data_type: Any) -> np.dtype:
+    value_type = _VALUE_TYPES.get(_enum_value(data_type))
+    if value_type is None:
+        logger.error("Invalid data type specified.")
+        raise ValueError("Invalid data type specified.")
+    return value_type
+
+
+def _complex_type(real_type: Any) -> np.dtype:
+    return np.dtype(np.complex64) if np.dtype(real_type) == np.float32 else np.dtype(np.complex128)
+
+
+def _is_path(value: Any) -> bool:
+    return isinstance(value, (str, os.PathLike))
+
+
+def _threads_from_environment(name: str) -> int:
+    try:
+        num_threads = int(os.environ.get(name, ""))
+    except ValueError:
+        return 0
+    return min(num_threads, 1024) if num_threads > 0 else 0
+
+
+def _default_num_threads() -> int:
+    for name in ("LIBIQ_NUM_THREADS", "OMP_NUM_THREADS"):
+        num_threads = _threads_from_environment(name)
+        if num_threads > 0:
+            return num_threads
+    return 1
+
+
+def _iq_buffer(iq_samples: Any) -> tuple:
+    """
+    Return a C-contiguous view of an IQ array and the IQDataType of its values.
+
+    Accepts complex64/complex128 arrays and (N, 2) float32/float64/int16 arrays of
+    [real, imaginary] pairs. Contiguous inputs are passed through without copying.
+    """
+    array = np.asarray(iq_samples)
+    data_type = _IQ_ARRAY_TYPES.get(array.dtype)
+    if data_type is None or (not np.iscomplexobj(array) and (array.ndim != 2 or array.shape[1] != 2)):
+        raise ValueError(
+            "Expected a complex64/complex128 array or an (N, 2) float32/float64/int16 array, "
+            f"received dtype {array.dtype} with shape {array.shape}."
+        )
+    return np.ascontiguousarray(array), data_type
+
+
+def _map_iq_file(input_file_path: str, data_type: Any) -> Optional[np.ndarray]:
+    """
+    Memory-map a binary capture as a read-only (N, 2) array of its values.
+
+    Returns None (after logging why) if the file is missing, has another extension or
+    a size that is not a whole number of samples.
+    """
+    value_type = _value_type(data_type)
+    path = os.fspath(input_file_path)
+    if not os.path.exists(path):
+        logger.error(f"File does not exist: {path}")
+        return None
+    if os.path.splitext(path)[1] not in _BINARY_EXTENSIONS:
+        logger.error("Invalid file extension. Required: .iq or .bin")
+        return None
+    size = os.path.getsize(path)
+    if size % (2 * value_type.itemsize) != 0:
+        logger.error("File size is not aligned with the expected data type size.")
+        return None
+    if size == 0:
+        return np.zeros((0, 2), dtype=value_type)
+    return np.memmap(path, dtype=value_type, mode="r").reshape(-1, 2)
+
+
+def _buffer_values(iq_buffer: Any, data_type: Any) -> Optional[np.ndarray]:
+    value_type = _value_type(data_type)
+    nbytes = memoryview(iq_buffer).nbytes
+    if nbytes == 0:
+        logger.error("Provided IQ buffer is empty.")
+        return None
+    if nbytes % (2 * value_type.itemsize) != 0:
+        logger.error("Buffer size is not aligned with the expected data type size.")
+        return None
+    return np.frombuffer(iq_buffer, dtype=value_type).reshape(-1, 2)
+
+
+def _to_complex(values: np.ndarray, real_type: Any = np.float64) -> np.ndarray:
+    """Convert (N, 2) [real, imaginary] values into a new complex array of the given precision."""
+    return np.array(values, dtype=real_type, order="C").view(_complex_type(real_type)).reshape(-1)
+
+
+def _window_coefficients(window: Any, size: int) -> np.ndarray:
+    step = 2.0 * np.pi * np.arange(size) / size
+    window = _enum_value(window)
+    if window == WindowFunction_RECTANGULAR:
+        return np.ones(size)
+    if window == WindowFunction_HANN:
+        return 0.5 - 0.5 * np.cos(step)
+    if window == WindowFunction_HAMMING:
+        return 0.54 - 0.46 * np.cos(step)
+    if window == WindowFunction_BLACKMAN:
+        return 0.42 - 0.5 * np.cos(step) + 0.08 * np.cos(2.0 * step)
+    logger.error("Invalid window function specified.")
+    raise ValueError("Invalid window function specified.")
+
+
+def _spectrogram_window_count(num_samples: int, overlap: int, window_size: int) -> int:
+    if window_size <= 0 or window_size > num_samples:
+        logger.error("window_size is invalid or larger than the total samples.")
+        return 0
+    if overlap < 0 or overlap >= window_size:
+        logger.error("overlap must be >= 0 and < window_size.")
+        return 0
+    return 1 + (num_samples - window_size) // (window_size - overlap)
+
+
+def _spectrogram_db_offset(num_samples: int, sample_rate: float) -> float:
+    # power = |X|^2 / num_samples, expressed in dB per rad/sample
+    return -10.0 * np.log10(num_samples) - 10.0 * np.log10(2.0 * np.pi / sample_rate)
+
+
+def _welch_segment_count(num_samples: int, segment_size: int, overlap: int, sample_rate: float) -> int:
+    if segment_size <= 0 or segment_size > num_samples:
+        logger.error("segment_size is invalid or larger than the total samples.")
+        return 0
+    if overlap < 0 or overlap >= segment_size:
+        logger.error("overlap must be >= 0 and < segment_size.")
+        return 0
+    if sample_rate <= 0.0:
+        logger.error("sample_rate must be > 0.")
+        return 0
+    return 1 + (num_samples - segment_size) // (segment_size - overlap)
+
+
+def _batch_size(segment_size: int) -> int:
+    return max(1, _FFT_BATCH_SAMPLES // segment_size)
+
+
+def _rows(array: np.ndarray) -> tuple:
+    return tuple(map(tuple, array.tolist()))
+
+
+def _complex_rows(samples: np.ndarray) -> np.ndarray:
+    """(N, 2) [real, imaginary] view of a complex array."""
+    return samples.view(samples.real.dtype).reshape(-1, 2)
+
+
+def _empty_complex(real_type: Any = np.float64) -> np.ndarray:
+    return np.zeros((0, 2), dtype=real_type)
+
+
+def _empty(real_type: Any = np.float64) -> np.ndarray:
+    return np.zeros(0, dtype=real_type)
+
+
+def _stft_db(
+    fft: Any, samples: np.ndarray, num_windows: int, overlap: int, window_size: int, db_offset: float
+) -> np.ndarray:
+    """Row-major (num_windows, window_size) spectrogram in dB; zero-power bins are set to -120 dB."""
+    real_type = samples.real.dtype
+    hop_size = window_size - overlap
+    windows = np.lib.stride_tricks.sliding_window_view(samples, window_size)[::hop_size][:num_windows]
+    result = np.empty((num_windows, window_size), dtype=real_type)
+    offset = real_type.type(db_offset)
+    batch_windows = _batch_size(window_size)
+    for first in range(0, num_windows, batch_windows):
+        spectrum = fft(windows[first : first + batch_windows])
+        power = np.square(spectrum.real)
+        power += np.square(spectrum.imag)
+        rows = result[first : first + len(power)]
+        with np.errstate(divide="ignore"):
+            np.log10(power, out=rows)
+        rows *= real_type.type(10)
+        rows += offset
+        rows[power <= 0] = -120
+    return result
+
+
+class Analyzer(AnalyzerBatchMixin):
+    """
+    Pure NumPy/SciPy implementation of the native Analyzer.
+
+    Methods take the same arguments and return the same values as the native backend
+    (tuples for the list-based methods, NumPy arrays for the *Array/*Float32 methods).
+    Binary captures are memory-mapped with numpy.memmap and transforms use scipy.fft,
+    with setNumThreads workers for transforms of at least 32768 samples. FFTW-specific
+    settings (plan rigor, wisdom, plan cache) are accepted and have no effect.
+    """
+
+    def __init__(self) -> None:
+        self._rigor = FFTPlanRigor_ESTIMATE
+        self._num_threads = _default_num_threads()
+        self._precision = IQPrecision_FLOAT64
+        self._stats_enabled = False
+        self._stats_lock = threading.Lock()
+        self.resetStats()
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    def setFFTPlanRigor(self, rigor: Any) -> None:
+        self._rigor = _enum_value(rigor)
+
+    def getFFTPlanRigor(self) -> int:
+        return self._rigor
+
+    def importFFTWisdom(self, wisdom_file_path: str) -> bool:
+        if not os.path.exists(wisdom_file_path):
+            logger.error(f"File does not exist: {wisdom_file_path}")
+            return False
+        logger.warning("FFTW wisdom is not used by the NumPy backend.")
+        return False
+
+    def exportFFTWisdom(self, wisdom_file_path: str) -> bool:
+        logger.warning("FFTW wisdom is not used by the NumPy backend.")
+        return False
+
+    def setNumThreads(self, num_threads: int) -> None:
+        if num_threads < 1:
+            logger.error("num_threads must be >= 1.")
+            raise ValueError("num_threads must be >= 1.")
+        self._num_threads = int(num_threads)
+
+    def getNumThreads(self) -> int:
+        return self._num_threads
+
+    def setPrecision(self, precision: Any) -> None:
+        precision = _enum_value(precision)
+        if precision not in (IQPrecision_FLOAT64, IQPrecision_FLOAT32):
+            logger.error("Invalid precision specified.")
+            raise ValueError("Invalid precision specified.")
+        self._precision = precision
+
+    def getPrecision(self) -> int:
+        return self._precision
+
+    def clearFFTPlanCache(self) -> None:
+        pass
+
+    # ------------------------------------------------------------------
+    # Instrumentation
+    # ------------------------------------------------------------------
+    def setStatsEnabled(self, enabled: bool) -> None:
+        self._stats_enabled = bool(enabled)
+
+    def getStatsEnabled(self) -> bool:
+        return self._stats_enabled
+
+    def getStats(self) -> dict:
+        with self._stats_lock:
+            return dict(self._counters)
+
+    def resetStats(self) -> None:
+        with self._stats_lock:
+            self._counters = {f"{stage}_{kind}": 0 for stage in STATS_STAGES for kind in ("ns", "calls")}
+            self._counters["bytes_read"] = 0
+            self._counters["plans_created"] = 0
+
+    @contextmanager
+    def _stage(self, stage: str) -> Iterator[None]:
+        if not self._stats_enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            with self._stats_lock:
+                self._counters[f"{stage}_ns"] += elapsed
+                self._counters[f"{stage}_calls"] += 1
+
+    def _add_bytes_read(self, num_bytes: int) -> None:
+        if self._stats_enabled:
+            with self._stats_lock:
+                self._counters["bytes_read"] += num_bytes
+
+    # ------------------------------------------------------------------
+    # Reading and conversion
+    # ------------------------------------------------------------------
+    def _read(
+        self,
+        input_file_path: str,
+        data_type: Any,
+        start_sample: Optional[int] = None,
+        end_sample: Optional[int] = None,
+        csv_columns: Sequence[str] = _DEFAULT_CSV_COLUMNS,
+        real_type: Any = np.float64,
+    ) -> np.ndarray:
+        """Read a capture (optionally [start_sample, end_sample)) into a new complex array."""
+        ranged = start_sample is not None
+        if ranged and (start_sample < 0 or end_sample <= start_sample):
+            logger.error("Invalid sample range.")
+            return np.zeros(0, dtype=_complex_type(real_type))
+        ext = os.path.splitext(os.fspath(input_file_path))[1]
+        with self._stage("read"):
+            if ext in _BINARY_EXTENSIONS:
+                values = _map_iq_file(input_file_path, data_type)
+                if values is None or len(values) == 0:
+                    return np.zeros(0, dtype=_complex_type(real_type))
+            elif ext in _CSV_EXTENSIONS:
+                values = self._read_csv(input_file_path, csv_columns)
+            else:
+                logger.error(f"Unsupported file extension: {ext}")
+                raise ValueError("Unsupported file extension.")
+            if ranged:
+                if len(values) == 0:
+                    return np.zeros(0, dtype=_complex_type(real_type))
+                if start_sample >= len(values):
+                    logger.error("Invalid sample range.")
+                    return np.zeros(0, dtype=_complex_type(real_type))
+                values = values[start_sample:end_sample]
+            if ext in _BINARY_EXTENSIONS:
+                self._add_bytes_read(values.nbytes)
+            return _to_complex(values, real_type)
+
+    def _read_csv(self, input_file_path: str, csv_columns: Sequence[str]) -> np.ndarray:
+        if len(csv_columns) < 2:
+            logger.error("CSV columns must include at least two entries for IQ data (Real and Imaginary).")
+            raise ValueError("Insufficient CSV column names provided.")
+        try:
+            with open(input_file_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            logger.error(f"Cannot open CSV file: {input_file_path}")
+            raise RuntimeError("Cannot open CSV file.")
+        self._add_bytes_read(len(data))
+        text = data.decode()
+        if not text:
+            logger.error(f"Cannot read header from CSV file: {input_file_path}")
+            raise RuntimeError("CSV file header is empty.")
+        lines = text.split("\n")
+        headers = [column.strip(" \t\r\n") for column in lines[0].split(",")]
+        if csv_columns[0] not in headers or csv_columns[1] not in headers:
+            logger.error("Specified column names not found in CSV header.")
+            raise ValueError("CSV column names not found.")
+        real_index = len(headers) - 1 - headers[::-1].index(csv_columns[0])
+        imag_index = len(headers) - 1 - headers[::-1].index(csv_columns[1])
+        required_fields = max(real_index, imag_index) + 1
+        values = []
+        for line in lines[1:]:
+            if not line:
+                continue
+            fields = line.split(",")
+            if len(fields) < required_fields:
+                logger.warning(f"Incomplete line encountered, skipping: {line}")
+                continue
+            try:
+                values.append((float(fields[real_index]), float(fields[imag_index])))
+            except ValueError:
+                logger.error(f"Failed to parse line: {line}.")
+                raise RuntimeError("CSV parsing error.")
+        return np.array(values, dtype=np.float64).reshape(-1, 2)
+
+    def _from_list(self, iq_samples: Sequence[Sequence[float]]) -> np.ndarray:
+        with self._stage("convert"):
+            pairs = [pair for pair in iq_samples if len(pair) == 2]
+            return _to_complex(np.array(pairs, dtype=np.float64).reshape(-1, 2))
+
+    def _from_buffer(self, iq_buffer: Any, data_type: Any, real_type: Any = np.float64) -> np.ndarray:
+        values = _buffer_values(iq_buffer, data_type)
+        if values is None:
+            return np.zeros(0, dtype=_complex_type(real_type))
+        complex_type = _complex_type(real_type)
+        if values.dtype == real_type:
+            return values.view(complex_type).reshape(-1)
+        with self._stage("convert"):
+            return _to_complex(values, real_type)
+
+    # ------------------------------------------------------------------
+    # Transforms
+    # ------------------------------------------------------------------
+    def _fft(self, samples: np.ndarray) -> np.ndarray:
+        workers = self._num_threads if samples.shape[-1] >= _THREADED_FFT_MIN_SIZE else 1
+        with self._stage("execute"):
+            return scipy.fft.fft(samples, axis=-1, workers=workers)
+
+    def _psd(self, samples: np.ndarray, scale: float) -> np.ndarray:
+        spectrum = self._fft(samples)
+        with self._stage("postprocess"):
+            power = np.square(spectrum.real)
+            power += np.square(spectrum.imag)
+            power *= power.dtype.type(1.0 / scale)
+            return power
+
+    def _spectrogram(self, samples: np.ndarray, overlap: int, window_size: int, sample_rate: float) -> np.ndarray:
+        num_windows = _spectrogram_window_count(len(samples), overlap, window_size)
+        if num_windows <= 0:
+            return _empty(samples.real.dtype)
+        return _stft_db(
+            self._batch_fft, samples, num_windows, overlap, window_size, _spectrogram_db_offset(len(samples), sample_rate)
+        )
+
+    def _batch_fft(self, windows: np.ndarray) -> np.ndarray:
+        workers = min(self._num_threads, len(windows))
+        with self._stage("execute"):
+            spectrum = scipy.fft.fft(windows, axis=-1, workers=workers)
+        return spectrum
+
+    def _welch(
+        self, values: np.ndarray, segment_size: int, overlap: int, window: Any, sample_rate: float
+    ) -> np.ndarray:
+        num_segments = _welch_segment_count(len(values), segment_size, overlap, sample_rate)
+        if num_segments == 0:
+            return _empty()
+        coefficients = _window_coefficients(window, segment_size)
+        hop_size = segment_size - overlap
+        power = np.zeros(segment_size)
+        batch_segments = _batch_size(segment_size)
+        for first in range(0, num_segments, batch_segments):
+            count = min(batch_segments, num_segments - first)
+            start = first * hop_size
+            with self._stage("convert"):
+                span = _to_complex(values[start : start + (count - 1) * hop_size + segment_size])
+                segments = np.lib.stride_tricks.sliding_window_view(span, segment_size)[::hop_size] * coefficients
+            spectrum = self._batch_fft(segments)
+            with self._stage("postprocess"):
+                power += (np.square(spectrum.real) + np.square(spectrum.imag)).sum(axis=0)
+        with self._stage("postprocess"):
+            return power / (num_segments * sample_rate * np.sum(coefficients * coefficients))
+
+    def _features(self, values: np.ndarray, magnitude_floor: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if magnitude_floor < 0.0:
+            logger.error("magnitude_floor must be >= 0.")
+            raise ValueError("magnitude_floor must be >= 0.")
+        with self._stage("postprocess"):
+            real = values[:, 0].astype(np.float64)
+            imag = values[:, 1].astype(np.float64)
+            features = np.empty((len(values), 4), dtype=np.float32) if out is None else out[: len(values)]
+            features[:, 0] = real
+            features[:, 1] = imag
+            # The phase and power reuse the real/imaginary temporaries instead of allocating new ones
+            power = np.multiply(real, real)
+            power += np.square(imag, out=imag)
+            features[:, 2] = np.arctan2(values[:, 1], values[:, 0], out=real, dtype=np.float64)
+            zero = power == 0.0
+            np.maximum(power, magnitude_floor * magnitude_floor, out=power)
+            with np.errstate(divide="ignore"):
+                np.log10(power, out=power)
+            power *= 10.0
+            power[zero] = 0.0
+            features[:, 3] = power
+            return features
+
+    def _output(self, array: np.ndarray) -> tuple:
+        with self._stage("output"):
+            return _rows(array) if array.ndim == 2 else tuple(array.tolist())
+
+    # ------------------------------------------------------------------
+    # List interface
+    # ------------------------------------------------------------------
+    def getIQSamples(self, input_file_path: str, *args: Any) -> tuple:
+        return self._output(self.getIQSamplesArray(input_file_path, *args))
+
+    def fastFourierTransform(self, iq_samples: Any, *args: Any) -> Any:
+        if isinstance(iq_samples, np.ndarray):
+            return self.fastFourierTransformArray(*_iq_buffer(iq_samples), *args)
+        if _is_path(iq_samples):
+            samples = self._read(iq_samples, args[-1], *args[:-1])
+        else:
+            samples = self._from_list(iq_samples)
+        if len(samples) == 0:
+            logger.error("IQ samples are empty or could not be read.")
+            return ()
+        return self._output(_complex_rows(self._fft(samples)))
+
+    def calculatePSD(self, iq_samples: Any, *args: Any) -> Any:
+        if isinstance(iq_samples, np.ndarray):
+            return self.calculatePSDArray(*_iq_buffer(iq_samples), *args)
+        if _is_path(iq_samples):
+            return self._output(self._psd_array(iq_samples, args, np.float64))
+        samples = self._from_list(iq_samples)
+        if len(samples) == 0:
+            logger.error("Provided IQ samples are empty or invalid.")
+            return ()
+        return self._output(self._psd(samples, len(samples) * args[0]))
+
+    def calculateWelchPSD(self, iq_samples: Any, *args: Any) -> Any:
+        if isinstance(iq_samples, np.ndarray):
+            return self.calculateWelchPSDArray(*_iq_buffer(iq_samples), *args)
+        if _is_path(iq_samples):
+            return self._output(self.calculateWelchPSDArray(iq_samples, *args))
+        samples = self._from_list(iq_samples)
+        if len(samples) == 0:
+            logger.error("Provided IQ samples are empty or invalid.")
+            return ()
+        return self._output(self._welch(_complex_rows(samples), *args))
+
+    def generateIQSpectrogram(self, iq_samples: Any, overlap: Any, *args: Any) -> Any:
+        if isinstance(iq_samples, np.ndarray):
+            return self.generateIQSpectrogramArray(*_iq_buffer(iq_samples), overlap, *args)
+        if _is_path(iq_samples):
+            samples = self._read(iq_samples, args[-1])
+        else:
+            samples = self._from_list(iq_samples)
+        if len(samples) == 0:
+            logger.error("IQ samples are empty or could not be read.")
+            return ()
+        return self._output(self._spectrogram(samples, overlap, *args[:2]))
+
+    def realPartIQSamples(self, iq_samples: Any, *args: Any) -> Any:
+        return self._component(iq_samples, args, 0)
+
+    def imaginaryPartIQSamples(self, iq_samples: Any, *args: Any) -> Any:
+        return self._component(iq_samples, args, 1)
+
+    def _component(self, iq_samples: Any, args: tuple, component: int) -> Any:
+        if isinstance(iq_samples, np.ndarray):
+            return self._component_array(*_iq_buffer(iq_samples), *args, component=component)
+        if _is_path(iq_samples):
+            return self._output(_complex_rows(self._read(iq_samples, args[0]))[:, component])
+        start_sample, end_sample = args
+        if len(iq_samples) == 0 or start_sample < 0 or end_sample <= start_sample or start_sample >= len(iq_samples):
+            logger.error("Invalid sample range or empty input data.")
+            return ()
+        return tuple(pair[component] for pair in iq_samples[start_sample:end_sample] if len(pair) == 2)
+
+    # ------------------------------------------------------------------
+    # NumPy interface
+    # ------------------------------------------------------------------
+    def getIQSamplesArray(self, input_file_path: str, *args: Any) -> np.ndarray:
+        if len(args) == 3:
+            samples = self._read(input_file_path, args[2], args[0], args[1])
+            if len(samples) == 0:
+                logger.error("File is empty or could not be read.")
+        elif len(args) == 2:
+            samples = self._read(input_file_path, args[0], csv_columns=args[1])
+        else:
+            samples = self._read(input_file_path, args[0])
+        return _complex_rows(samples)
+
+    def fastFourierTransformArray(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        if self._precision == IQPrecision_FLOAT32:
+            return self.fastFourierTransformFloat32(iq_samples, *args)
+        return self._fft_array(iq_samples, args, np.float64)
+
+    def calculatePSDArray(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        if self._precision == IQPrecision_FLOAT32:
+            return self.calculatePSDFloat32(iq_samples, *args)
+        return self._psd_array(iq_samples, args, np.float64)
+
+    def calculateWelchPSDArray(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        if _is_path(iq_samples):
+            segment_size, overlap, window, sample_rate, data_type = args
+            if os.path.splitext(os.fspath(iq_samples))[1] in _BINARY_EXTENSIONS:
+                values = _map_iq_file(iq_samples, data_type)
+                if values is None:
+                    return _empty()
+                self._add_bytes_read(values.nbytes)
+            else:
+                samples = self._read(iq_samples, data_type)
+                if len(samples) == 0:
+                    logger.error("File is empty or could not be read.")
+                    return _empty()
+                values = _complex_rows(samples)
+            return self._welch(values, segment_size, overlap, window, sample_rate)
+        data_type, segment_size, overlap, window, sample_rate = args
+        values = _buffer_values(iq_samples, data_type)
+        if values is None:
+            return _empty()
+        return self._welch(values, segment_size, overlap, window, sample_rate)
+
+    def extractFeaturesArray(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        if len(args) == 1 and isinstance(iq_samples, np.ndarray):
+            return self.extractFeaturesArray(*_iq_buffer(iq_samples), *args)
+        data_type, magnitude_floor = args
+        if _is_path(iq_samples):
+            if os.path.splitext(os.fspath(iq_samples))[1] in _BINARY_EXTENSIONS:
+                values = _map_iq_file(iq_samples, data_type)
+                if values is not None:
+                    self._add_bytes_read(values.nbytes)
+            else:
+                samples = self._read(iq_samples, data_type)
+                if len(samples) == 0:
+                    logger.error("File is empty or could not be read.")
+                values = _complex_rows(samples) if len(samples) else None
+        else:
+            values = _buffer_values(iq_samples, data_type)
+        if values is None or len(values) == 0:
+            return _empty(np.float32)
+        return self._features(values, magnitude_floor)
+
+    def extractFeaturesInto(self, iq_samples: Any, *args: Any) -> int:
+        if len(args) == 2 and isinstance(iq_samples, np.ndarray):
+            return self.extractFeaturesInto(*_iq_buffer(iq_samples), *args)
+        data_type, magnitude_floor, out = args
+        if not (
+            isinstance(out, np.ndarray) and out.dtype == np.float32 and out.ndim == 2
+            and out.shape[1] == 4 and out.flags.c_contiguous and out.flags.writeable
+        ):
+            raise ValueError("Expected a writable C-contiguous float32 array of shape (N, 4) for the features.")
+        values = _buffer_values(iq_samples, data_type)
+        if values is None or len(values) == 0:
+            return 0
+        if len(values) > len(out):
+            logger.error(f"Feature buffer is too small for {len(values)} samples.")
+            raise ValueError("Feature buffer is too small for the IQ samples.")
+        self._features(values, magnitude_floor, out)
+        return len(values)
+
+    def generateIQSpectrogramArray(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        if self._precision == IQPrecision_FLOAT32:
+            return self.generateIQSpectrogramFloat32(iq_samples, *args)
+        return self._spectrogram_array(iq_samples, args, np.float64)
+
+    def realPartIQSamplesArray(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        return self._component_array(iq_samples, *args, component=0)
+
+    def imaginaryPartIQSamplesArray(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        return self._component_array(iq_samples, *args, component=1)
+
+    def _component_array(self, iq_samples: Any, data_type: Any, *sample_range: int, component: int) -> np.ndarray:
+        if _is_path(iq_samples):
+            return _complex_rows(self._read(iq_samples, data_type))[:, component].copy()
+        samples = self._from_buffer(iq_samples, data_type)
+        start_sample, end_sample = sample_range
+        if len(samples) == 0 or start_sample < 0 or end_sample <= start_sample or start_sample >= len(samples):
+            logger.error("Invalid sample range or empty input data.")
+            return _empty()
+        return _complex_rows(samples)[start_sample:end_sample, component].copy()
+
+    # ------------------------------------------------------------------
+    # Single-precision NumPy interface
+    # ------------------------------------------------------------------
+    def fastFourierTransformFloat32(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        return self._fft_array(iq_samples, args, np.float32)
+
+    def calculatePSDFloat32(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        return self._psd_array(iq_samples, args, np.float32)
+
+    def generateIQSpectrogramFloat32(self, iq_samples: Any, *args: Any) -> np.ndarray:
+        return self._spectrogram_array(iq_samples, args, np.float32)
+
+    def _fft_array(self, iq_samples: Any, args: tuple, real_type: Any) -> np.ndarray:
+        if _is_path(iq_samples):
+            samples = self._read(iq_samples, args[-1], *args[:-1], real_type=real_type)
+        else:
+            samples = self._from_buffer(iq_samples, args[0], real_type)
+        if len(samples) == 0:
+            logger.error("IQ samples are empty or could not be read.")
+            return _empty_complex(real_type)
+        return _complex_rows(self._fft(samples))
+
+    def _psd_array(self, iq_samples: Any, args: tuple, real_type: Any) -> np.ndarray:
+        if _is_path(iq_samples) and len(args) == 3:
+            samples = self._read(iq_samples, args[2], args[0], args[1], real_type=real_type)
+            scale = float(len(samples))
+        elif _is_path(iq_samples):
+            samples = self._read(iq_samples, args[1], real_type=real_type)
+            scale = len(samples) * args[0]
+        else:
+            samples = self._from_buffer(iq_samples, args[0], real_type)
+            scale = len(samples) * args[1]
+        if len(samples) == 0:
+            logger.error("IQ samples are empty or could not be read.")
+            return _empty(real_type)
+        return self._psd(samples, scale)
+
+    def _spectrogram_array(self, iq_samples: Any, args: tuple, real_type: Any) -> np.ndarray:
+        if _is_path(iq_samples):
+            overlap, window_size, sample_rate, data_type = args
+            samples = self._read(iq_samples, data_type, real_type=real_type)
+        else:
+            data_type, overlap, window_size, sample_rate = args
+            samples = self._from_buffer(iq_samples, data_type, real_type)
+        if len(samples) == 0:
+            logger.error("IQ samples are empty or could not be read.")
+            return _empty(real_type)
+        return self._spectrogram(samples, overlap, window_size, sample_rate)
+
+
+class IQCapture:
+    def __init__(self, input_file_path: str, data_type: Any) -> None:
+        """
+        Memory-mapped binary capture (numpy.memmap), as the native IQCapture.
+
+        Args:
+            input_file_path (str): Path of a .iq or .bin file.
+            data_type (IQDataType): Type of the stored values.
+        """
+        self._path = os.fspath(input_file_path)
+        self._data_type = _enum_value(data_type)
+        values = _map_iq_file(self._path, self._data_type)
+        if values is None:
+            raise ValueError("Invalid IQ capture file.")
+        self._values = values
+
+    def path(self) -> str:
+        return self._path
+
+    def dataType(self) -> int:
+        return self._data_type
+
+    def numSamples(self) -> int:
+        return len(self._values)
+
+    def sizeBytes(self) -> int:
+        return self._values.nbytes
+
+    def array(self) -> np.ndarray:
+        """Read-only (N, 2) array of [real, imaginary] values backed by the mapping."""
+        return self._values.view(np.ndarray)
+
+
+class StreamingSpectrogram:
+    def __init__(self, window_size: int, overlap: int, sample_rate: float, scale_samples: int = 0) -> None:
+        """
+        Incremental spectrogram of a live IQ stream, as the native StreamingSpectrogram.
+
+        Args:
+            window_size (int): The window size for the FFT.
+            overlap (int): The number of overlapping samples between consecutive windows.
+            sample_rate (float): The sampling rate of the IQ data.
+            scale_samples (int): The number of samples the power is normalised by
+                (default: 0, which normalises by window_size).
+        """
+        if window_size <= 0:
+            raise ValueError("window_size must be > 0.")
+        if overlap < 0 or overlap >= window_size:
+            raise ValueError("overlap must be >= 0 and < window_size.")
+        if sample_rate <= 0.0:
+            raise ValueError("sample_rate must be > 0.")
+        self._window_size = window_size
+        self._overlap = overlap
+        self._sample_rate = sample_rate
+        self._scale_samples = scale_samples if scale_samples else window_size
+        self._num_threads = _default_num_threads()
+        self._buffer = np.zeros(0, dtype=np.complex128)
+        self._lock = threading.Lock()
+
+    def push(self, iq_samples: Any, data_type: Any = None) -> None:
+        if isinstance(iq_samples, np.ndarray) and data_type is None:
+            iq_samples, data_type = _iq_buffer(iq_samples)
+        if data_type is None:
+            pairs = [pair for pair in iq_samples if len(pair) == 2]
+            samples = _to_complex(np.array(pairs, dtype=np.float64).reshape(-1, 2))
+        else:
+            if memoryview(iq_samples).nbytes == 0:
+                return
+            values = _buffer_values(iq_samples, data_type)
+            samples = _to_complex(values) if values is not None else np.zeros(0, dtype=np.complex128)
+        with self._lock:
+            self._buffer = np.concatenate((self._buffer, samples))
+
+    def _window_count(self) -> int:
+        if len(self._buffer) < self._window_size:
+            return 0
+        return 1 + (len(self._buffer) - self._window_size) // (self._window_size - self._overlap)
+
+    def pendingRows(self) -> int:
+        with self._lock:
+            return self._window_count()
+
+    def bufferedSamples(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def popRows(self) -> np.ndarray:
+        with self._lock:
+            num_windows = self._window_count()
+            if num_windows == 0:
+                return np.zeros((0, self._window_size))
+            result = _stft_db(
+                lambda windows: scipy.fft.fft(windows, axis=-1, workers=min(self._num_threads, len(windows))),
+                self._buffer,
+                num_windows,
+                self._overlap,
+                self._window_size,
+                _spectrogram_db_offset(self._scale_samples, self._sample_rate),
+            )
+            self._buffer = self._buffer[num_windows * (self._window_size - self._overlap) :].copy()
+            return result
+
+    pop_rows = popRows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buffer = np.zeros(0, dtype=np.complex128)
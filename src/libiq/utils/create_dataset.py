@@ -99,6 +99,8 @@ def read_binary_data(
     """
     Reads a binary file and converts it into a NumPy array of complex numbers.
     Only the number of FFT rows specified by max_rows is read (if provided).
+    The file is memory-mapped, so only the pages backing the requested rows are
+    loaded and they are shared through the page cache with other readers.
 
     Parameters:
         file_path: Path to the binary file.
@@ -121,13 +123,21 @@ def read_binary_data(
         n_iq_data = 1536
         if max_rows is not None:
             count = max_rows * n_iq_data * 2
-        data = np.fromfile(file_path, dtype=dtype, count=count)
-        if data.size % 2 != 0:
+        dtype = np.dtype(dtype)
+        n_values = os.path.getsize(file_path) // dtype.itemsize
+        if count is not None:
+            n_values = min(n_values, count)
+        if n_values % 2 != 0:
             raise ValueError(
                 "The binary file does not contain an even number of elements."
             )
-        data = data.reshape(-1, 2)
-        complex_data = data[:, 0] + 1j * data[:, 1]
+        complex_data = np.empty(n_values // 2, dtype=np.complex128)
+        if n_values == 0:
+            return complex_data
+        data = np.memmap(file_path, dtype=dtype, mode="r", shape=(n_values // 2, 2))
+        complex_data.real = data[:, 0]
+        complex_data.imag = data[:, 1]
+        del data
         return complex_data
     except Exception as e:
         raise ValueError(f"Error reading binary data: {e}") from None
@@ -144,6 +154,8 @@ def process_samples_vectorized(data: np.ndarray, ground_truth: int) -> pd.DataFr
     Returns:
         A pandas DataFrame containing the processed data.
     """
+    # Dataset CSVs keep float64 precision; the float32 fused kernel is only used for inference
+    data = np.asarray(data).reshape(-1)
     df = pd.DataFrame()
     df["Real"] = np.real(data)
     df["Imaginary"] = np.imag(data)
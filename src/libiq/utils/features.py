@@ -0,0 +1,40 @@
+from typing import Optional
+
+import numpy as np
+
+from libiq import Analyzer
+
+# Analyzers are thread-safe, so a single instance serves every caller
+_analyzer = Analyzer()
+
+_NATIVE_COMPLEX_TYPES = (np.dtype(np.complex64), np.dtype(np.complex128))
+_NATIVE_PAIR_TYPES = (np.dtype(np.int16), np.dtype(np.float32), np.dtype(np.float64))
+
+
+def extract_features(iq_data: np.ndarray, magnitude_floor: float = 0.0, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert I/Q samples into the 4-channel CNN input with the native fused kernel.
+
+    Each sample yields [real, imaginary, phase, magnitude in dB], where the magnitude is
+    clamped to magnitude_floor before the dB conversion and samples of zero magnitude get 0 dB.
+    complex64/complex128 arrays and (N, 2) int16/float32/float64 arrays of [real, imaginary]
+    pairs are read in place; any other input is flattened and converted to complex128.
+
+    Args:
+        iq_data (np.ndarray): I/Q samples.
+        magnitude_floor (float): Smallest magnitude converted to dB.
+        out (Optional[np.ndarray]): Preallocated C-contiguous float32 array of shape (M, 4), M >= samples.
+            The rows are written in place and no output array is allocated.
+
+    Returns:
+        np.ndarray: float32 array of shape (samples, 4); with out, a view of its first rows.
+    """
+    iq_array = np.asarray(iq_data)
+    is_pairs = iq_array.ndim == 2 and iq_array.shape[1] == 2 and iq_array.dtype in _NATIVE_PAIR_TYPES
+    if iq_array.dtype not in _NATIVE_COMPLEX_TYPES and not is_pairs:
+        iq_array = iq_array.reshape(-1).astype(np.complex128)
+    if iq_array.size == 0:
+        return np.zeros((0, 4), dtype=np.float32) if out is None else out[:0]
+    if out is None:
+        return _analyzer.extractFeaturesArray(iq_array, float(magnitude_floor))
+    return out[: _analyzer.extractFeaturesInto(iq_array, float(magnitude_floor), out)]
@@ -0,0 +1,85 @@
+import numpy as np
+
+
+class IQRingBuffer:
+    def __init__(self, capacity: int, dtype: np.dtype = np.float64) -> None:
+        """
+        Fixed-capacity FIFO of I/Q pairs with O(chunk) inserts and contiguous reads.
+
+        The storage is preallocated once and mirrored (every sample is written at i and
+        i + capacity), so the oldest n <= capacity samples are always a contiguous slice
+        and peek() returns a view instead of a copy.
+
+        Args:
+            capacity (int): Maximum number of buffered I/Q pairs.
+            dtype (np.dtype): Type of the stored values.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1.")
+        self.capacity = capacity
+        self._storage = np.empty((2 * capacity, 2), dtype=dtype)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def free(self) -> int:
+        """Number of I/Q pairs that can be pushed before the buffer is full."""
+        return self.capacity - self._size
+
+    def push(self, iq_data: np.ndarray) -> None:
+        """
+        Append I/Q pairs at the end of the buffer.
+
+        Args:
+            iq_data (np.ndarray): I/Q pairs, reshaped to (N, 2).
+
+        Raises:
+            ValueError: If the pairs do not fit in the free space.
+        """
+        values = np.asarray(iq_data).reshape(-1, 2)
+        count = len(values)
+        if count > self.free:
+            raise ValueError(f"Cannot push {count} I/Q pairs into a ring buffer with {self.free} free.")
+        index = (self._start + self._size) % self.capacity
+        first = min(count, self.capacity - index)
+        rest = count - first
+        for offset in (0, self.capacity):
+            self._storage[offset + index : offset + index + first] = values[:first]
+            self._storage[offset : offset + rest] = values[first:]
+        self._size += count
+
+    def peek(self, count: int) -> np.ndarray:
+        """
+        Return the oldest count I/Q pairs without removing them.
+
+        The result is a view of the storage: it is valid until the next push overwrites it.
+
+        Args:
+            count (int): Number of I/Q pairs, at most len(self).
+
+        Returns:
+            np.ndarray: Contiguous (count, 2) view.
+        """
+        if count > self._size:
+            raise ValueError(f"Cannot read {count} I/Q pairs from a ring buffer holding {self._size}.")
+        return self._storage[self._start : self._start + count]
+
+    def consume(self, count: int) -> None:
+        """
+        Remove the oldest count I/Q pairs.
+
+        Args:
+            count (int): Number of I/Q pairs, at most len(self).
+        """
+        if count > self._size:
+            raise ValueError(f"Cannot consume {count} I/Q pairs from a ring buffer holding {self._size}.")
+        self._start = (self._start + count) % self.capacity
+        self._size -= count
+
+    def clear(self) -> None:
+        """Remove every buffered I/Q pair."""
+        self._start = 0
+        self._size = 0
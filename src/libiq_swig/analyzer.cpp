@@ -1,61 +1,296 @@
 #include "analyzer.h"
 
+#include <charconv>
+#include <cstring>
+#include <exception>
+#include <type_traits>
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
 // ============================================================================
-// Template function to read IQ sample blocks from binary files (.iq or .bin)
+// RAII read-only memory mapping of a whole file
 // ============================================================================
-template <typename T>
-std::vector<std::complex<double>> readIQSampleBlock(const std::string& input_file_path) {
-    std::filesystem::path input_filepath = input_file_path;
-    std::vector<std::complex<double>> iq_samples;
+class MappedFile {
+public:
+    explicit MappedFile(const std::string& input_file_path) {
+        int fd = ::open(input_file_path.c_str(), O_RDONLY);
+        if (fd < 0) {
+            std::cerr << "Error: File cannot be opened: " << input_file_path << std::endl;
+            throw std::runtime_error("File cannot be opened.");
+        }
+        struct stat file_stat;
+        if (::fstat(fd, &file_stat) != 0) {
+            ::close(fd);
+            std::cerr << "Error: Cannot stat file: " << input_file_path << std::endl;
+            throw std::runtime_error("Cannot stat file.");
+        }
+        size_ = static_cast<std::size_t>(file_stat.st_size);
+        if (size_ > 0) {
+            addr_ = ::mmap(nullptr, size_, PROT_READ, MAP_SHARED, fd, 0);
+            if (addr_ == MAP_FAILED) {
+                addr_ = nullptr;
+                ::close(fd);
+                std::cerr << "Error: File cannot be memory-mapped: " << input_file_path << std::endl;
+                throw std::runtime_error("File cannot be memory-mapped.");
+            }
+        }
+        ::close(fd);
+    }
+
+    ~MappedFile() {
+        if (addr_ != nullptr) {
+            ::munmap(addr_, size_);
+        }
+    }
+
+    MappedFile(const MappedFile&) = delete;
+    MappedFile& operator=(const MappedFile&) = delete;
+
+    const void* data() const { return addr_; }
+    std::size_t size() const { return size_; }
+
+private:
+    void* addr_ = nullptr;
+    std::size_t size_ = 0;
+};
+
+// ============================================================================
+// Helper function to convert interleaved [real, imaginary] values into std::complex<Real>
+// ============================================================================
+template <typename T, typename Real>
+static void widenIQSamples(const T* values, std::size_t num_complex_samples, std::complex<Real>* iq_samples) {
+    for (std::size_t i = 0; i < num_complex_samples; ++i) {
+        iq_samples[i] = std::complex<Real>(
+            static_cast<Real>(values[2 * i]),
+            static_cast<Real>(values[2 * i + 1])
+        );
+    }
+}
+
+// ============================================================================
+// Template function to read IQ sample blocks from binary files (.iq or .bin).
+// The file is memory-mapped and only the samples in [start_sample, end_sample)
+// are converted, so the cost depends on the range, not the file size.
+// end_sample is clipped to the number of samples in the file.
+// ============================================================================
+template <typename T, typename Real = double>
+std::vector<std::complex<Real>> readIQSampleBlock(const MappedFile& mapping, std::size_t start_sample, std::size_t end_sample) {
+    std::vector<std::complex<Real>> iq_samples;
+    std::size_t total_samples = mapping.size() / (2 * sizeof(T));
+    if (total_samples == 0) {
+        return iq_samples;
+    }
+    if (end_sample <= start_sample || start_sample >= total_samples) {
+        std::cerr << "Error: Invalid sample range." << std::endl;
+        return iq_samples;
+    }
+    std::size_t num_complex_samples = std::min(end_sample, total_samples) - start_sample;
+    iq_samples.resize(num_complex_samples);
+    const T* values = static_cast<const T*>(mapping.data()) + 2 * start_sample;
+    widenIQSamples(values, num_complex_samples, iq_samples.data());
+    return iq_samples;
+}
+
+// ============================================================================
+// Binary IQ captures: raw .iq/.bin files. SigMF datasets carry a header offset
+// and datatype in their metadata and are read through SigMFRecording instead.
+// ============================================================================
+static bool isBinaryIQExtension(const std::string& ext) {
+    return ext == ".iq" || ext == ".bin";
+}
 
+// ============================================================================
+// Validates a binary IQ file (existence, extension and size alignment)
+// ============================================================================
+static bool validateIQFile(const std::filesystem::path& input_filepath, std::size_t value_size) {
     if (!std::filesystem::exists(input_filepath)) {
         std::cerr << "Error: File does not exist: " << input_filepath << std::endl;
-        return iq_samples;
+        return false;
     }
 
-    if (input_filepath.extension() != ".iq" && input_filepath.extension() != ".bin") {
+    if (!isBinaryIQExtension(input_filepath.extension().string())) {
         std::cerr << "Error: Invalid file extension. Required: .iq or .bin" << std::endl;
-        return iq_samples;
+        return false;
     }
 
     std::uintmax_t file_size = std::filesystem::file_size(input_filepath);
-    if (file_size % (2 * sizeof(T)) != 0) {
+    if (file_size % (2 * value_size) != 0) {
         std::cerr << "Error: File size is not aligned with the expected data type size." << std::endl;
-        return iq_samples;
+        return false;
     }
+    return true;
+}
 
-    std::size_t num_complex_samples = file_size / (2 * sizeof(T));
-    iq_samples.resize(num_complex_samples);
+static std::size_t dataTypeSize(IQDataType data_type) {
+    switch (data_type) {
+        case IQDataType::FLOAT32:
+            return sizeof(float);
+        case IQDataType::FLOAT64:
+            return sizeof(double);
+        case IQDataType::INT16:
+            return sizeof(std::int16_t);
+    }
+    std::cerr << "Error: Invalid data type specified." << std::endl;
+    throw std::invalid_argument("Invalid data type specified.");
+}
 
-    std::ifstream file(input_file_path, std::ios::binary);
-    if (!file) {
-        std::cerr << "Error: File cannot be opened: " << input_filepath << std::endl;
-        iq_samples.clear();
-        return iq_samples;
+template <typename T, typename Real = double>
+std::vector<std::complex<Real>> readIQSampleBlock(const std::string& input_file_path, std::size_t start_sample, std::size_t end_sample) {
+    if (!validateIQFile(input_file_path, sizeof(T))) {
+        return {};
+    }
+    try {
+        MappedFile mapping(input_file_path);
+        return readIQSampleBlock<T, Real>(mapping, start_sample, end_sample);
+    } catch (const std::runtime_error&) {
+        return {};
+    }
+}
+
+template <typename T>
+std::vector<std::complex<double>> readIQSampleBlock(const std::string& input_file_path) {
+    return readIQSampleBlock<T>(input_file_path, 0, std::numeric_limits<std::size_t>::max());
+}
+
+// ============================================================================
+// Reads [start_sample, end_sample) of a binary file as std::complex<Real>
+// ============================================================================
+template <typename Real>
+static std::vector<std::complex<Real>> readBinaryIQSamples(const std::string& input_file_path, std::size_t start_sample, std::size_t end_sample, IQDataType data_type) {
+    if (data_type == IQDataType::FLOAT32) {
+        return readIQSampleBlock<float, Real>(input_file_path, start_sample, end_sample);
+    } else if (data_type == IQDataType::FLOAT64) {
+        return readIQSampleBlock<double, Real>(input_file_path, start_sample, end_sample);
+    } else if (data_type == IQDataType::INT16) {
+        return readIQSampleBlock<std::int16_t, Real>(input_file_path, start_sample, end_sample);
+    }
+    std::cerr << "Error: Invalid data type specified." << std::endl;
+    throw std::invalid_argument("Invalid data type specified.");
+}
+
+// ============================================================================
+// IQCapture implementation
+// ============================================================================
+IQCapture::IQCapture(const std::string& input_file_path, IQDataType data_type)
+    : path_(input_file_path), data_type_(data_type) {
+    if (!validateIQFile(input_file_path, dataTypeSize(data_type))) {
+        throw std::invalid_argument("Invalid IQ capture file.");
+    }
+    mapping_ = std::make_shared<const MappedFile>(input_file_path);
+}
+
+std::size_t IQCapture::numSamples() const {
+    return mapping_->size() / (2 * dataTypeSize(data_type_));
+}
+
+std::size_t IQCapture::sizeBytes() const {
+    return mapping_->size();
+}
+
+const void* IQCapture::data() const {
+    return mapping_->data();
+}
+
+std::vector<std::complex<double>> IQCapture::readSamples(std::size_t start_sample, std::size_t end_sample) const {
+    if (data_type_ == IQDataType::FLOAT32) {
+        return readIQSampleBlock<float>(*mapping_, start_sample, end_sample);
+    } else if (data_type_ == IQDataType::FLOAT64) {
+        return readIQSampleBlock<double>(*mapping_, start_sample, end_sample);
     }
+    return readIQSampleBlock<std::int16_t>(*mapping_, start_sample, end_sample);
+}
 
-    std::vector<T> buffer(num_complex_samples * 2);
-    file.read(reinterpret_cast<char*>(buffer.data()), buffer.size() * sizeof(T));
+// ============================================================================
+// Template function to read IQ samples from an in-memory buffer of interleaved values
+// ============================================================================
+template <typename T, typename Real = double>
+std::vector<std::complex<Real>> readIQBufferBlock(const void* iq_buffer, std::size_t buffer_size) {
+    std::vector<std::complex<Real>> iq_samples;
 
-    if (static_cast<std::size_t>(file.gcount()) != buffer.size() * sizeof(T)) {
-        std::cerr << "Error: Unexpected file read size. Possibly corrupted file or read error." << std::endl;
-        iq_samples.clear();
+    if (iq_buffer == nullptr || buffer_size == 0) {
+        std::cerr << "Error: Provided IQ buffer is empty." << std::endl;
         return iq_samples;
     }
 
-    for (std::size_t i = 0; i < num_complex_samples; ++i) {
-        iq_samples[i] = std::complex<double>(
-            static_cast<double>(buffer[2 * i]),
-            static_cast<double>(buffer[2 * i + 1])
-        );
+    if (buffer_size % (2 * sizeof(T)) != 0) {
+        std::cerr << "Error: Buffer size is not aligned with the expected data type size." << std::endl;
+        return iq_samples;
     }
+
+    std::size_t num_complex_samples = buffer_size / (2 * sizeof(T));
+    iq_samples.resize(num_complex_samples);
+    widenIQSamples(static_cast<const T*>(iq_buffer), num_complex_samples, iq_samples.data());
     return iq_samples;
 }
 
+// ============================================================================
+// View over IQ samples held in a caller buffer whose values already have the
+// working precision (FLOAT64 for double, FLOAT32 for float) or converted into
+// owned storage
+// ============================================================================
+template <typename Real>
+struct BasicIQSampleView {
+    const std::complex<Real>* data = nullptr;
+    std::size_t size = 0;
+    std::vector<std::complex<Real>> storage;
+};
+
+using IQSampleView = BasicIQSampleView<double>;
+
+template <typename Real>
+static constexpr IQDataType nativeDataType() {
+    return std::is_same<Real, float>::value ? IQDataType::FLOAT32 : IQDataType::FLOAT64;
+}
+
+template <typename Real = double>
+static BasicIQSampleView<Real> viewIQBuffer(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, AnalyzerStats* stats = nullptr) {
+    BasicIQSampleView<Real> view;
+    if (data_type == nativeDataType<Real>()) {
+        if (iq_buffer == nullptr || buffer_size == 0) {
+            std::cerr << "Error: Provided IQ buffer is empty." << std::endl;
+            return view;
+        }
+        if (buffer_size % sizeof(std::complex<Real>) != 0) {
+            std::cerr << "Error: Buffer size is not aligned with the expected data type size." << std::endl;
+            return view;
+        }
+        view.data = static_cast<const std::complex<Real>*>(iq_buffer);
+        view.size = buffer_size / sizeof(std::complex<Real>);
+        return view;
+    }
+    StageTimer timer(stats, AnalyzerStage::CONVERT);
+    if (data_type == IQDataType::FLOAT32) {
+        view.storage = readIQBufferBlock<float, Real>(iq_buffer, buffer_size);
+    } else if (data_type == IQDataType::FLOAT64) {
+        view.storage = readIQBufferBlock<double, Real>(iq_buffer, buffer_size);
+    } else if (data_type == IQDataType::INT16) {
+        view.storage = readIQBufferBlock<std::int16_t, Real>(iq_buffer, buffer_size);
+    } else {
+        std::cerr << "Error: Invalid data type specified." << std::endl;
+        throw std::invalid_argument("Invalid data type specified.");
+    }
+    view.data = view.storage.data();
+    view.size = view.storage.size();
+    return view;
+}
+
+template <typename Real>
+static BasicIQSampleView<Real> viewIQSamples(std::vector<std::complex<Real>>&& iq_samples) {
+    BasicIQSampleView<Real> view;
+    view.storage = std::move(iq_samples);
+    view.data = view.storage.data();
+    view.size = view.storage.size();
+    return view;
+}
+
 // ============================================================================
 // Helper function to convert a 2D vector of [real, imaginary] into a vector of std::complex<double>
 // ============================================================================
-static std::vector<std::complex<double>> convertToComplex(const std::vector<std::vector<double>>& iq_samples_input) {
+static std::vector<std::complex<double>> convertToComplex(const std::vector<std::vector<double>>& iq_samples_input, AnalyzerStats* stats = nullptr) {
+    StageTimer timer(stats, AnalyzerStage::CONVERT);
     std::vector<std::complex<double>> iq_sample;
     iq_sample.reserve(iq_samples_input.size());
     for (const auto& pair : iq_samples_input) {
@@ -66,33 +301,336 @@ static std::vector<std::complex<double>> convertToComplex(const std::vector<std:
     return iq_sample;
 }
 
+// ============================================================================
+// Executes an FFT using the cached FFTW plans on contiguous std::complex<Real> samples,
+// writing interleaved [real, imaginary] values to output (2 * size values)
+// ============================================================================
+template <typename Real>
+static void executeFFTCtoC(BasicFFTPlanCache<Real>& plans, const std::complex<Real>* iq_sample, std::size_t size, Real* output) {
+    plans.executeForward(iq_sample, reinterpret_cast<std::complex<Real>*>(output), size);
+}
+
 // ============================================================================
 // Executes an FFT using FFTW on a vector of std::complex<double> and returns a 2D vector [real, imaginary]
 // ============================================================================
-static std::vector<std::vector<double>> executeFFTCtoC(std::vector<std::complex<double>>& iq_sample) {
+static std::vector<std::vector<double>> executeFFTCtoC(FFTPlanCache& plans, std::vector<std::complex<double>>& iq_sample) {
     int signalSize = static_cast<int>(iq_sample.size());
     if (signalSize == 0) {
         return {};
     }
-    fftw_complex* in = reinterpret_cast<fftw_complex*>(iq_sample.data());
-    std::vector<fftw_complex> out(signalSize);
-    fftw_plan p = fftw_plan_dft_1d(signalSize, in, out.data(), FFTW_FORWARD, FFTW_ESTIMATE);
-    fftw_execute(p);
-    fftw_destroy_plan(p);
+    std::vector<double> out(2 * static_cast<std::size_t>(signalSize));
+    executeFFTCtoC(plans, iq_sample.data(), iq_sample.size(), out.data());
 
+    StageTimer timer(plans.stats(), AnalyzerStage::OUTPUT);
     std::vector<std::vector<double>> vec(signalSize, std::vector<double>(2));
     for (int i = 0; i < signalSize; ++i) {
-        vec[i][0] = out[i][0];
-        vec[i][1] = out[i][1];
+        vec[i][0] = out[2 * i];
+        vec[i][1] = out[2 * i + 1];
     }
     return vec;
 }
 
+// ============================================================================
+// Computes |FFT|^2 / scale for every bin of the given samples
+// ============================================================================
+template <typename Real>
+static void computePSD(BasicFFTPlanCache<Real>& plans, const std::complex<Real>* iq_sample, std::size_t size, double scale, Real* psd) {
+    std::vector<Real> fft(2 * size);
+    executeFFTCtoC(plans, iq_sample, size, fft.data());
+    StageTimer timer(plans.stats(), AnalyzerStage::POSTPROCESS);
+    const long num_bins = static_cast<long>(size);
+    const Real inverse_scale = static_cast<Real>(1.0 / scale);
+    #pragma omp parallel for num_threads(plans.numThreads()) if (size >= BasicFFTPlanCache<Real>::kThreadedFFTMinSize && plans.numThreads() > 1)
+    for (long i = 0; i < num_bins; ++i) {
+        Real re = fft[2 * i];
+        Real im = fft[2 * i + 1];
+        psd[i] = (re * re + im * im) * inverse_scale;
+    }
+}
+
+// ============================================================================
+// Validates spectrogram parameters and returns the number of windows (0 on error)
+// ============================================================================
+static int spectrogramWindowCount(std::size_t num_samples, int overlap, int window_size) {
+    int iq_sample_size = static_cast<int>(num_samples);
+    if (window_size <= 0 || window_size > iq_sample_size) {
+        std::cerr << "Error: window_size is invalid or larger than the total samples." << std::endl;
+        return 0;
+    }
+    if (overlap < 0 || overlap >= window_size) {
+        std::cerr << "Error: overlap must be >= 0 and < window_size." << std::endl;
+        return 0;
+    }
+    int hop_size = window_size - overlap;
+    int num_windows = 1 + (iq_sample_size - window_size) / hop_size;
+    if (num_windows <= 0) {
+        std::cerr << "Error: Not enough samples to form even one window." << std::endl;
+        return 0;
+    }
+    return num_windows;
+}
+
+// ============================================================================
+// Short-time Fourier transform engine: windows are transformed in batches with a
+// single strided FFTW plan over the contiguous samples and the power of each bin
+// is converted to dB in one pass into a row-major (num_windows, window_size) buffer.
+// Batches are independent, so they are spread over plans.numThreads() OpenMP threads.
+// ============================================================================
+static constexpr int kSpectrogramBatchWindows = 64;
+
+// power = |X|^2 / num_samples, expressed in dB per rad/sample
+static double spectrogramDbOffset(std::size_t num_samples, double sample_rate) {
+    return -10.0 * std::log10(static_cast<double>(num_samples)) - 10.0 * std::log10(2.0 * M_PI / sample_rate);
+}
+
+template <typename Real>
+static void computeSpectrogram(BasicFFTPlanCache<Real>& plans, const std::complex<Real>* iq_sample,
+                               int num_windows, int overlap, int window_size, double db_offset_value, Real* result) {
+    const std::size_t hop_size = static_cast<std::size_t>(window_size - overlap);
+    const std::size_t bins = static_cast<std::size_t>(window_size);
+    const std::size_t batch_windows = static_cast<std::size_t>(std::min(num_windows, kSpectrogramBatchWindows));
+    const std::size_t total_windows = static_cast<std::size_t>(num_windows);
+    const long num_batches = static_cast<long>((total_windows + batch_windows - 1) / batch_windows);
+    const Real db_offset = static_cast<Real>(db_offset_value);
+
+    // Plans are created up front so the parallel loop only reads the cache
+    plans.planForwardBatch(bins, batch_windows, hop_size);
+    plans.planForwardBatch(bins, total_windows - (num_batches - 1) * batch_windows, hop_size);
+    const int num_threads = static_cast<int>(std::min<long>(plans.numThreads(), num_batches));
+
+    // error is only touched inside critical sections; failed is the lock-free early-exit flag
+    std::exception_ptr error;
+    std::atomic<bool> failed{false};
+    #pragma omp parallel num_threads(num_threads) if (num_threads > 1)
+    {
+        std::complex<Real>* spectrum = nullptr;
+        try {
+            spectrum = BasicFFTPlanCache<Real>::allocate(batch_windows * bins);
+        } catch (const std::bad_alloc&) {
+        }
+
+        #pragma omp for schedule(static)
+        for (long batch = 0; batch < num_batches; ++batch) {
+            if (spectrum == nullptr || failed.load(std::memory_order_relaxed)) {
+                continue;
+            }
+            std::size_t first = static_cast<std::size_t>(batch) * batch_windows;
+            std::size_t count = std::min(batch_windows, total_windows - first);
+            try {
+                plans.executeForwardBatch(iq_sample + first * hop_size, spectrum,
+                                          bins, count, hop_size);
+            } catch (...) {
+                #pragma omp critical
+                error = std::current_exception();
+                failed.store(true, std::memory_order_relaxed);
+                continue;
+            }
+            StageTimer timer(plans.stats(), AnalyzerStage::POSTPROCESS);
+            Real* rows = result + first * bins;
+            for (std::size_t k = 0; k < count * bins; ++k) {
+                Real re = spectrum[k].real();
+                Real im = spectrum[k].imag();
+                Real magnitude2 = re * re + im * im;
+                rows[k] = magnitude2 <= Real(0) ? Real(-120) : Real(10) * std::log10(magnitude2) + db_offset;
+            }
+        }
+        if (spectrum == nullptr) {
+            #pragma omp critical
+            error = std::make_exception_ptr(std::bad_alloc());
+            failed.store(true, std::memory_order_relaxed);
+        }
+        BasicFFTPlanCache<Real>::deallocate(spectrum);
+    }
+    if (error) {
+        std::rethrow_exception(error);
+    }
+}
+
+// ============================================================================
+// Helpers to build NDArray results
+// ============================================================================
+static NDArray<std::complex<double>> complexArray(std::vector<std::complex<double>>&& iq_sample) {
+    NDArray<std::complex<double>> result;
+    result.rows = iq_sample.size();
+    result.data = std::move(iq_sample);
+    return result;
+}
+
+template <typename Real>
+static NDArray<std::complex<Real>> fftArray(BasicFFTPlanCache<Real>& plans, const BasicIQSampleView<Real>& view) {
+    NDArray<std::complex<Real>> result;
+    result.data.resize(view.size);
+    executeFFTCtoC(plans, view.data, view.size, reinterpret_cast<Real*>(result.data.data()));
+    result.rows = view.size;
+    return result;
+}
+
+template <typename Real>
+static NDArray<Real> psdArray(BasicFFTPlanCache<Real>& plans, const BasicIQSampleView<Real>& view, double scale) {
+    NDArray<Real> result;
+    result.data.resize(view.size);
+    computePSD(plans, view.data, view.size, scale, result.data.data());
+    result.rows = view.size;
+    return result;
+}
+
+template <typename Real>
+static NDArray<Real> spectrogramArray(BasicFFTPlanCache<Real>& plans, const BasicIQSampleView<Real>& view, int overlap, int window_size, double sample_rate) {
+    NDArray<Real> result;
+    int num_windows = spectrogramWindowCount(view.size, overlap, window_size);
+    if (num_windows <= 0) {
+        return result;
+    }
+    result.data.resize(static_cast<std::size_t>(num_windows) * window_size);
+    computeSpectrogram(plans, view.data, num_windows, overlap, window_size, spectrogramDbOffset(view.size, sample_rate), result.data.data());
+    result.rows = static_cast<std::size_t>(num_windows);
+    result.cols = static_cast<std::size_t>(window_size);
+    return result;
+}
+
+static NDArray<double> componentArray(const IQSampleView& view, int start_sample, int end_sample, int component) {
+    NDArray<double> result;
+    if (view.size == 0 || start_sample < 0 || end_sample <= start_sample || start_sample >= static_cast<int>(view.size)) {
+        std::cerr << "Error: Invalid sample range or empty input data." << std::endl;
+        return result;
+    }
+    int sample_size = std::min(end_sample, static_cast<int>(view.size));
+    const double* values = reinterpret_cast<const double*>(view.data);
+    result.data.resize(sample_size - start_sample);
+    for (int i = start_sample; i < sample_size; ++i) {
+        result.data[i - start_sample] = values[2 * i + component];
+    }
+    result.rows = result.data.size();
+    return result;
+}
+
+// ============================================================================
+// Bulk CSV parsing: the file is scanned in place for line and field delimiters,
+// only the two selected columns are trimmed and parsed with std::from_chars,
+// and large files are split at line boundaries into chunks parsed in parallel.
+// Lines keep the semantics of the original getline/stod reader: empty lines are
+// skipped, lines with too few fields are skipped with a warning and unparsable
+// values raise "CSV parsing error.".
+// ============================================================================
+static constexpr std::size_t kParallelCSVMinBytes = 1 << 22;
+
+static bool isCSVSpace(char c) {
+    return c == ' ' || c == '\t' || c == '\r' || c == '\n';
+}
+
+static bool parseCSVValue(const char* begin, const char* end, double& value) {
+    while (begin < end && isCSVSpace(*begin)) {
+        ++begin;
+    }
+    while (end > begin && isCSVSpace(*(end - 1))) {
+        --end;
+    }
+    // std::stod accepts an explicit '+' sign, std::from_chars does not
+    if (begin < end && *begin == '+' && end - begin > 1 && begin[1] != '+' && begin[1] != '-') {
+        ++begin;
+    }
+    std::from_chars_result result = std::from_chars(begin, end, value);
+    return result.ec == std::errc() && result.ptr != begin;
+}
+
+static void parseCSVRows(const char* begin, const char* end, std::size_t real_index, std::size_t imag_index,
+                         std::vector<std::complex<double>>& iq_samples) {
+    const std::size_t required_fields = std::max(real_index, imag_index) + 1;
+    const char* line = begin;
+    while (line < end) {
+        const char* line_end = static_cast<const char*>(std::memchr(line, '\n', end - line));
+        if (line_end == nullptr) {
+            line_end = end;
+        }
+        if (line_end != line) {
+            const char* fields[2][2] = {{nullptr, nullptr}, {nullptr, nullptr}};
+            std::size_t num_fields = 0;
+            const char* field = line;
+            while (field < line_end && num_fields < required_fields) {
+                const char* field_end = static_cast<const char*>(std::memchr(field, ',', line_end - field));
+                if (field_end == nullptr) {
+                    field_end = line_end;
+                }
+                if (num_fields == real_index) {
+                    fields[0][0] = field;
+                    fields[0][1] = field_end;
+                }
+                if (num_fields == imag_index) {
+                    fields[1][0] = field;
+                    fields[1][1] = field_end;
+                }
+                ++num_fields;
+                field = field_end + 1;
+            }
+            if (num_fields < required_fields) {
+                std::cerr << "Warning: Incomplete line encountered, skipping: " << std::string(line, line_end) << std::endl;
+            } else {
+                double real_val = 0.0;
+                double imag_val = 0.0;
+                if (!parseCSVValue(fields[0][0], fields[0][1], real_val) || !parseCSVValue(fields[1][0], fields[1][1], imag_val)) {
+                    std::cerr << "Error: Failed to parse line: " << std::string(line, line_end) << "." << std::endl;
+                    throw std::runtime_error("CSV parsing error.");
+                }
+                iq_samples.emplace_back(real_val, imag_val);
+            }
+        }
+        line = line_end + 1;
+    }
+}
+
+static std::vector<std::complex<double>> parseCSVData(const char* begin, const char* end, std::size_t real_index, std::size_t imag_index, int num_threads) {
+    std::size_t size = static_cast<std::size_t>(end - begin);
+    int num_chunks = size >= kParallelCSVMinBytes ? std::max(num_threads, 1) : 1;
+    if (num_chunks == 1) {
+        std::vector<std::complex<double>> iq_samples;
+        parseCSVRows(begin, end, real_index, imag_index, iq_samples);
+        return iq_samples;
+    }
+
+    // Chunk boundaries are moved forward to the start of the next line
+    std::vector<const char*> bounds(num_chunks + 1, end);
+    bounds[0] = begin;
+    for (int k = 1; k < num_chunks; ++k) {
+        const char* split = std::max(begin + size * k / num_chunks, bounds[k - 1]);
+        const char* newline = static_cast<const char*>(std::memchr(split, '\n', end - split));
+        bounds[k] = newline == nullptr ? end : newline + 1;
+    }
+
+    std::vector<std::vector<std::complex<double>>> chunks(num_chunks);
+    std::exception_ptr error;
+    #pragma omp parallel for num_threads(num_chunks) schedule(static, 1)
+    for (int k = 0; k < num_chunks; ++k) {
+        try {
+            parseCSVRows(bounds[k], bounds[k + 1], real_index, imag_index, chunks[k]);
+        } catch (...) {
+            #pragma omp critical
+            if (!error) {
+                error = std::current_exception();
+            }
+        }
+    }
+    if (error) {
+        std::rethrow_exception(error);
+    }
+
+    std::size_t total = 0;
+    for (const auto& chunk : chunks) {
+        total += chunk.size();
+    }
+    std::vector<std::complex<double>> iq_samples;
+    iq_samples.reserve(total);
+    for (const auto& chunk : chunks) {
+        iq_samples.insert(iq_samples.end(), chunk.begin(), chunk.end());
+    }
+    return iq_samples;
+}
+
 // ============================================================================
 // Implementation of readIQSamples for CSV and binary files (three-parameter version)
 // Default CSV columns: {"Real", "Imaginary"}
 // ============================================================================
 std::vector<std::complex<double>> Analyzer::readIQSamples(const std::string& input_file_path, IQDataType data_type, const std::vector<std::string>& csv_columns) {
+    StageTimer timer(&stats_, AnalyzerStage::READ);
     std::filesystem::path input_filepath(input_file_path);
     std::string ext = input_filepath.extension().string();
 
@@ -101,16 +639,25 @@ std::vector<std::complex<double>> Analyzer::readIQSamples(const std::string& inp
             std::cerr << "Error: CSV columns must include at least two entries for IQ data (Real and Imaginary)." << std::endl;
             throw std::invalid_argument("Insufficient CSV column names provided.");
         }
-        std::ifstream csv_file(input_file_path);
-        if (!csv_file.is_open()) {
+        std::unique_ptr<MappedFile> csv_file;
+        try {
+            csv_file = std::make_unique<MappedFile>(input_file_path);
+        } catch (const std::runtime_error&) {
             std::cerr << "Error: Cannot open CSV file: " << input_file_path << std::endl;
             throw std::runtime_error("Cannot open CSV file.");
         }
-        std::string header_line;
-        if (!std::getline(csv_file, header_line)) {
+        stats_.addBytesRead(csv_file->size());
+        const char* begin = static_cast<const char*>(csv_file->data());
+        const char* end = begin + csv_file->size();
+        if (begin == end) {
             std::cerr << "Error: Cannot read header from CSV file: " << input_file_path << std::endl;
             throw std::runtime_error("CSV file header is empty.");
         }
+        const char* header_end = static_cast<const char*>(std::memchr(begin, '\n', end - begin));
+        if (header_end == nullptr) {
+            header_end = end;
+        }
+        std::string header_line(begin, header_end);
         std::vector<std::string> headers;
         std::istringstream header_stream(header_line);
         std::string col;
@@ -130,45 +677,14 @@ std::vector<std::complex<double>> Analyzer::readIQSamples(const std::string& inp
             std::cerr << "Error: Specified column names not found in CSV header." << std::endl;
             throw std::invalid_argument("CSV column names not found.");
         }
-        std::vector<std::complex<double>> iq_samples;
-        std::string line;
-        while (std::getline(csv_file, line)) {
-            if (line.empty())
-                continue;
-            std::istringstream line_stream(line);
-            std::string token;
-            std::vector<std::string> tokens;
-            while (std::getline(line_stream, token, ',')) {
-                token.erase(0, token.find_first_not_of(" \t\r\n"));
-                token.erase(token.find_last_not_of(" \t\r\n") + 1);
-                tokens.push_back(token);
-            }
-            if (tokens.size() <= static_cast<size_t>(std::max(real_index, imag_index))) {
-                std::cerr << "Warning: Incomplete line encountered, skipping: " << line << std::endl;
-                continue;
-            }
-            try {
-                double real_val = std::stod(tokens[real_index]);
-                double imag_val = std::stod(tokens[imag_index]);
-                iq_samples.push_back(std::complex<double>(real_val, imag_val));
-            } catch (const std::exception& e) {
-                std::cerr << "Error: Failed to parse line: " << line << ". Exception: " << e.what() << std::endl;
-                throw std::runtime_error("CSV parsing error.");
-            }
-        }
-        csv_file.close();
-        return iq_samples;
+        const char* data_begin = header_end == end ? end : header_end + 1;
+        return parseCSVData(data_begin, end, static_cast<std::size_t>(real_index), static_cast<std::size_t>(imag_index),
+                            plan_cache_.numThreads());
     }
-    else if (ext == ".iq" || ext == ".bin") {
-        if (data_type == IQDataType::FLOAT32) {
-            return readIQSampleBlock<float>(input_file_path);
-        } else if (data_type == IQDataType::FLOAT64) {
-            return readIQSampleBlock<double>(input_file_path);
-        } else if (data_type == IQDataType::INT16) {
-            return readIQSampleBlock<std::int16_t>(input_file_path);
-        }
-        std::cerr << "Error: Invalid data type specified." << std::endl;
-        throw std::invalid_argument("Invalid data type specified.");
+    else if (isBinaryIQExtension(ext)) {
+        std::vector<std::complex<double>> iq_sample = readBinaryIQSamples<double>(input_file_path, 0, std::numeric_limits<std::size_t>::max(), data_type);
+        stats_.addBytesRead(iq_sample.size() * 2 * dataTypeSize(data_type));
+        return iq_sample;
     }
     else {
         std::cerr << "Error: Unsupported file extension: " << ext << std::endl;
@@ -184,6 +700,37 @@ std::vector<std::complex<double>> Analyzer::readIQSamples(const std::string& inp
     return readIQSamples(input_file_path, data_type, default_csv_columns);
 }
 
+// ============================================================================
+// Ranged readIQSamples: binary files are read only over the requested range,
+// other formats are read whole and sliced
+// ============================================================================
+std::vector<std::complex<double>> Analyzer::readIQSamples(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type) {
+    if (start_sample < 0 || end_sample <= start_sample) {
+        std::cerr << "Error: Invalid sample range." << std::endl;
+        return {};
+    }
+    std::string ext = std::filesystem::path(input_file_path).extension().string();
+    if (isBinaryIQExtension(ext)) {
+        StageTimer timer(&stats_, AnalyzerStage::READ);
+        std::vector<std::complex<double>> iq_sample = readBinaryIQSamples<double>(input_file_path, static_cast<std::size_t>(start_sample), static_cast<std::size_t>(end_sample), data_type);
+        stats_.addBytesRead(iq_sample.size() * 2 * dataTypeSize(data_type));
+        return iq_sample;
+    }
+
+    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, data_type);
+    if (iq_sample.empty()) {
+        return iq_sample;
+    }
+    if (start_sample >= static_cast<int>(iq_sample.size())) {
+        std::cerr << "Error: Invalid sample range." << std::endl;
+        return {};
+    }
+    end_sample = std::min(end_sample, static_cast<int>(iq_sample.size()));
+    iq_sample.erase(iq_sample.begin() + end_sample, iq_sample.end());
+    iq_sample.erase(iq_sample.begin(), iq_sample.begin() + start_sample);
+    return iq_sample;
+}
+
 // ============================================================================
 // Public getIQSamples functions using readIQSamples
 // ============================================================================
@@ -198,20 +745,15 @@ std::vector<std::vector<double>> Analyzer::getIQSamples(const std::string& input
 }
 
 std::vector<std::vector<double>> Analyzer::getIQSamples(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type) {
-    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, data_type);
+    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, start_sample, end_sample, data_type);
     std::vector<std::vector<double>> result;
     if (iq_sample.empty()) {
         std::cerr << "Error: File is empty or could not be read." << std::endl;
         return result;
     }
-    if (start_sample < 0 || end_sample <= start_sample || start_sample >= static_cast<int>(iq_sample.size())) {
-        std::cerr << "Error: Invalid sample range." << std::endl;
-        return result;
-    }
-    end_sample = std::min(end_sample, static_cast<int>(iq_sample.size()));
-    result.reserve(end_sample - start_sample);
-    for (int i = start_sample; i < end_sample; ++i) {
-        result.push_back({ iq_sample[i].real(), iq_sample[i].imag() });
+    result.reserve(iq_sample.size());
+    for (const auto &c : iq_sample) {
+        result.push_back({ c.real(), c.imag() });
     }
     return result;
 }
@@ -235,52 +777,38 @@ std::vector<std::vector<double>> Analyzer::fastFourierTransform(const std::strin
         std::cerr << "Error: File is empty or not valid." << std::endl;
         return {};
     }
-    return executeFFTCtoC(iq_sample);
+    return executeFFTCtoC(plan_cache_, iq_sample);
 }
 
 std::vector<std::vector<double>> Analyzer::fastFourierTransform(const std::vector<std::vector<double>>& iq_samples) {
-    std::vector<std::complex<double>> iq_sample = convertToComplex(iq_samples);
+    std::vector<std::complex<double>> iq_sample = convertToComplex(iq_samples, &stats_);
     if (iq_sample.empty()) {
         std::cerr << "Error: Provided IQ samples are empty or invalid." << std::endl;
         return {};
     }
-    return executeFFTCtoC(iq_sample);
+    return executeFFTCtoC(plan_cache_, iq_sample);
 }
 
 std::vector<std::vector<double>> Analyzer::fastFourierTransform(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type) {
-    std::vector<std::vector<double>> iq_samples = getIQSamples(input_file_path, start_sample, end_sample, data_type);
-    if (iq_samples.empty()) {
+    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, start_sample, end_sample, data_type);
+    if (iq_sample.empty()) {
         std::cerr << "Error: Could not extract IQ samples from the specified range." << std::endl;
         return {};
     }
-    std::vector<std::complex<double>> iq_sample = convertToComplex(iq_samples);
-    return executeFFTCtoC(iq_sample);
+    return executeFFTCtoC(plan_cache_, iq_sample);
 }
 
 // ============================================================================
 // PSD functions implementations
 // ============================================================================
 std::vector<double> Analyzer::calculatePSD(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type) {
-    std::vector<std::vector<double>> iq_samples = getIQSamples(input_file_path, start_sample, end_sample, data_type);
-    if (iq_samples.empty()) {
-        std::cerr << "Error: Could not extract IQ samples from the specified range." << std::endl;
-        return {};
-    }
-    std::vector<std::complex<double>> iq_sample = convertToComplex(iq_samples);
+    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, start_sample, end_sample, data_type);
     if (iq_sample.empty()) {
-        std::cerr << "Error: No valid IQ samples available for PSD calculation." << std::endl;
+        std::cerr << "Error: Could not extract IQ samples from the specified range." << std::endl;
         return {};
     }
-    std::vector<std::vector<double>> fft = executeFFTCtoC(iq_sample);
-    int fft_size = static_cast<int>(fft.size());
-    std::vector<double> psd;
-    psd.reserve(fft_size);
-    for (int i = 0; i < fft_size; ++i) {
-        double re = fft[i][0];
-        double im = fft[i][1];
-        double magnitude2 = re * re + im * im;
-        psd.push_back(magnitude2 / fft_size);
-    }
+    std::vector<double> psd(iq_sample.size());
+    computePSD(plan_cache_, iq_sample.data(), iq_sample.size(), static_cast<double>(iq_sample.size()), psd.data());
     return psd;
 }
 
@@ -290,131 +818,361 @@ std::vector<double> Analyzer::calculatePSD(const std::string& input_file_path, d
         std::cerr << "Error: File is empty or could not be read." << std::endl;
         return {};
     }
-    std::vector<std::vector<double>> fft = executeFFTCtoC(iq_sample);
-    int fft_size = static_cast<int>(fft.size());
-    std::vector<double> result;
-    result.reserve(fft_size);
-    for (int i = 0; i < fft_size; ++i) {
-        double re = fft[i][0];
-        double im = fft[i][1];
-        double magnitude2 = re * re + im * im;
-        result.push_back(magnitude2 / (fft_size * sampleRate));
-    }
+    std::vector<double> result(iq_sample.size());
+    computePSD(plan_cache_, iq_sample.data(), iq_sample.size(), iq_sample.size() * sampleRate, result.data());
     return result;
 }
 
 std::vector<double> Analyzer::calculatePSD(const std::vector<std::vector<double>>& iq_samples, double sampleRate) {
-    std::vector<std::complex<double>> iq_sample = convertToComplex(iq_samples);
+    std::vector<std::complex<double>> iq_sample = convertToComplex(iq_samples, &stats_);
     if (iq_sample.empty()) {
         std::cerr << "Error: Provided IQ samples are empty or invalid." << std::endl;
         return {};
     }
-    std::vector<std::vector<double>> fft = executeFFTCtoC(iq_sample);
-    int fft_size = static_cast<int>(fft.size());
-    std::vector<double> result;
-    result.reserve(fft_size);
-    for (int i = 0; i < fft_size; ++i) {
-        double re = fft[i][0];
-        double im = fft[i][1];
-        double magnitude2 = re * re + im * im;
-        result.push_back(magnitude2 / (fft_size * sampleRate));
-    }
+    std::vector<double> result(iq_sample.size());
+    computePSD(plan_cache_, iq_sample.data(), iq_sample.size(), iq_sample.size() * sampleRate, result.data());
     return result;
 }
 
 // ============================================================================
-// Spectrogram functions implementations
+// Welch PSD engine: segments are read straight from interleaved values of type
+// T, windowed into a fixed-size batch buffer and transformed with one batched
+// plan; their power is accumulated per thread and averaged at the end, so the
+// working memory is O(segment_size) whatever the number of segments.
+// Scaling matches scipy.signal.welch(scaling="density", detrend=False,
+// return_onesided=False): |X|^2 / (sample_rate * sum(w^2)), averaged.
 // ============================================================================
-std::vector<std::vector<double>> Analyzer::generateIQSpectrogram(const std::string& input_file_path, int overlap, int window_size, double sample_rate, IQDataType data_type) {
-    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, data_type);
-    std::vector<std::vector<double>> result;
-    if (iq_sample.empty()) {
-        std::cerr << "Error: File is empty or could not be read." << std::endl;
-        return result;
+static constexpr int kWelchBatchSegments = 16;
+
+static std::vector<double> windowCoefficients(WindowFunction window, int size) {
+    std::vector<double> coefficients(size, 1.0);
+    const double step = 2.0 * M_PI / size;
+    for (int n = 0; n < size; ++n) {
+        switch (window) {
+            case WindowFunction::RECTANGULAR:
+                break;
+            case WindowFunction::HANN:
+                coefficients[n] = 0.5 - 0.5 * std::cos(step * n);
+                break;
+            case WindowFunction::HAMMING:
+                coefficients[n] = 0.54 - 0.46 * std::cos(step * n);
+                break;
+            case WindowFunction::BLACKMAN:
+                coefficients[n] = 0.42 - 0.5 * std::cos(step * n) + 0.08 * std::cos(2.0 * step * n);
+                break;
+            default:
+                std::cerr << "Error: Invalid window function specified." << std::endl;
+                throw std::invalid_argument("Invalid window function specified.");
+        }
     }
-    int iq_sample_size = static_cast<int>(iq_sample.size());
-    if (window_size <= 0 || window_size > iq_sample_size) {
-        std::cerr << "Error: window_size is invalid or larger than the total samples." << std::endl;
-        return result;
+    return coefficients;
+}
+
+// Validates Welch parameters and returns the number of segments (0 on error)
+static std::size_t welchSegmentCount(std::size_t num_samples, int segment_size, int overlap, double sample_rate) {
+    if (segment_size <= 0 || static_cast<std::size_t>(segment_size) > num_samples) {
+        std::cerr << "Error: segment_size is invalid or larger than the total samples." << std::endl;
+        return 0;
     }
-    if (overlap < 0 || overlap >= window_size) {
-        std::cerr << "Error: overlap must be >= 0 and < window_size." << std::endl;
-        return result;
+    if (overlap < 0 || overlap >= segment_size) {
+        std::cerr << "Error: overlap must be >= 0 and < segment_size." << std::endl;
+        return 0;
     }
-    int hop_size = window_size - overlap;
-    int num_windows = 1 + (iq_sample_size - window_size) / hop_size;
-    if (num_windows <= 0) {
-        std::cerr << "Error: Not enough samples to form even one window." << std::endl;
+    if (sample_rate <= 0.0) {
+        std::cerr << "Error: sample_rate must be > 0." << std::endl;
+        return 0;
+    }
+    return 1 + (num_samples - segment_size) / static_cast<std::size_t>(segment_size - overlap);
+}
+
+template <typename T>
+static NDArray<double> computeWelchPSD(FFTPlanCache& plans, const T* values, std::size_t num_samples,
+                                       int segment_size, int overlap, WindowFunction window, double sample_rate) {
+    NDArray<double> result;
+    const std::size_t num_segments = welchSegmentCount(num_samples, segment_size, overlap, sample_rate);
+    if (num_segments == 0) {
         return result;
     }
-    result.resize(num_windows, std::vector<double>(window_size));
-    for (int i = 0; i < num_windows; ++i) {
-        int start_index = i * hop_size;
-        int end_index = start_index + window_size;
-        std::vector<std::complex<double>> iq_sample_window(iq_sample.begin() + start_index, iq_sample.begin() + end_index);
-        std::vector<std::vector<double>> fft_result = executeFFTCtoC(iq_sample_window);
-        for (int j = 0; j < window_size; ++j) {
-            double re = fft_result[j][0];
-            double im = fft_result[j][1];
-            double magnitude = std::sqrt(re * re + im * im);
-            double power = (magnitude * magnitude) / iq_sample_size;
-            double power_db_per_rad_sample;
-            if (power <= 0.0) {
-                power_db_per_rad_sample = -120.0;
-            } else {
-                power_db_per_rad_sample = 10.0 * std::log10(power) - 10.0 * std::log10(2.0 * M_PI / sample_rate);
+    const std::vector<double> coefficients = windowCoefficients(window, segment_size);
+    const std::size_t bins = static_cast<std::size_t>(segment_size);
+    const std::size_t hop_size = static_cast<std::size_t>(segment_size - overlap);
+    const std::size_t batch_segments = std::min<std::size_t>(num_segments, kWelchBatchSegments);
+    const long num_batches = static_cast<long>((num_segments + batch_segments - 1) / batch_segments);
+
+    plans.planForwardBatch(bins, batch_segments, bins);
+    plans.planForwardBatch(bins, num_segments - (num_batches - 1) * batch_segments, bins);
+    const int num_threads = static_cast<int>(std::min<long>(plans.numThreads(), num_batches));
+
+    result.data.assign(bins, 0.0);
+    result.rows = bins;
+    // error is only touched inside critical sections; failed is the lock-free early-exit flag
+    std::exception_ptr error;
+    std::atomic<bool> failed{false};
+    #pragma omp parallel num_threads(num_threads) if (num_threads > 1)
+    {
+        std::vector<double> power(bins, 0.0);
+        std::complex<double>* segments = nullptr;
+        std::complex<double>* spectrum = nullptr;
+        try {
+            segments = FFTPlanCache::allocate(batch_segments * bins);
+            spectrum = FFTPlanCache::allocate(batch_segments * bins);
+        } catch (...) {
+            #pragma omp critical
+            error = std::current_exception();
+            failed.store(true, std::memory_order_relaxed);
+        }
+
+        #pragma omp for schedule(static)
+        for (long batch = 0; batch < num_batches; ++batch) {
+            if (segments == nullptr || spectrum == nullptr || failed.load(std::memory_order_relaxed)) {
+                continue;
+            }
+            std::size_t first = static_cast<std::size_t>(batch) * batch_segments;
+            std::size_t count = std::min(batch_segments, num_segments - first);
+            {
+                StageTimer timer(plans.stats(), AnalyzerStage::CONVERT);
+                for (std::size_t s = 0; s < count; ++s) {
+                    const T* segment = values + 2 * (first + s) * hop_size;
+                    std::complex<double>* windowed = segments + s * bins;
+                    for (std::size_t i = 0; i < bins; ++i) {
+                        windowed[i] = std::complex<double>(static_cast<double>(segment[2 * i]) * coefficients[i],
+                                                           static_cast<double>(segment[2 * i + 1]) * coefficients[i]);
+                    }
+                }
+            }
+            try {
+                plans.executeForwardBatch(segments, spectrum, bins, count, bins);
+            } catch (...) {
+                #pragma omp critical
+                error = std::current_exception();
+                failed.store(true, std::memory_order_relaxed);
+                continue;
+            }
+            StageTimer timer(plans.stats(), AnalyzerStage::POSTPROCESS);
+            for (std::size_t s = 0; s < count; ++s) {
+                const std::complex<double>* row = spectrum + s * bins;
+                for (std::size_t i = 0; i < bins; ++i) {
+                    power[i] += std::norm(row[i]);
+                }
             }
-            result[i][j] = power_db_per_rad_sample;
         }
+        #pragma omp critical
+        for (std::size_t i = 0; i < bins; ++i) {
+            result.data[i] += power[i];
+        }
+        FFTPlanCache::deallocate(segments);
+        FFTPlanCache::deallocate(spectrum);
+    }
+    if (error) {
+        std::rethrow_exception(error);
+    }
+
+    StageTimer timer(plans.stats(), AnalyzerStage::POSTPROCESS);
+    double window_power = 0.0;
+    for (double coefficient : coefficients) {
+        window_power += coefficient * coefficient;
+    }
+    const double scale = 1.0 / (static_cast<double>(num_segments) * sample_rate * window_power);
+    for (double& value : result.data) {
+        value *= scale;
     }
     return result;
 }
 
-std::vector<std::vector<double>> Analyzer::generateIQSpectrogram(const std::vector<std::vector<double>>& iq_samples_input, int overlap, int window_size, double sample_rate) {
-    std::vector<std::complex<double>> iq_sample = convertToComplex(iq_samples_input);
-    std::vector<std::vector<double>> result;
+static NDArray<double> welchPSDFromBuffer(FFTPlanCache& plans, const void* iq_buffer, std::size_t buffer_size, IQDataType data_type,
+                                          int segment_size, int overlap, WindowFunction window, double sample_rate) {
+    std::size_t value_size = dataTypeSize(data_type);
+    if (iq_buffer == nullptr || buffer_size == 0) {
+        std::cerr << "Error: Provided IQ buffer is empty." << std::endl;
+        return {};
+    }
+    if (buffer_size % (2 * value_size) != 0) {
+        std::cerr << "Error: Buffer size is not aligned with the expected data type size." << std::endl;
+        return {};
+    }
+    std::size_t num_samples = buffer_size / (2 * value_size);
+    if (data_type == IQDataType::FLOAT32) {
+        return computeWelchPSD(plans, static_cast<const float*>(iq_buffer), num_samples, segment_size, overlap, window, sample_rate);
+    } else if (data_type == IQDataType::FLOAT64) {
+        return computeWelchPSD(plans, static_cast<const double*>(iq_buffer), num_samples, segment_size, overlap, window, sample_rate);
+    }
+    return computeWelchPSD(plans, static_cast<const std::int16_t*>(iq_buffer), num_samples, segment_size, overlap, window, sample_rate);
+}
+
+NDArray<double> Analyzer::calculateWelchPSDArray(const std::string& input_file_path, int segment_size, int overlap, WindowFunction window, double sampleRate, IQDataType data_type) {
+    std::string ext = std::filesystem::path(input_file_path).extension().string();
+    if (isBinaryIQExtension(ext)) {
+        if (!validateIQFile(input_file_path, dataTypeSize(data_type))) {
+            return {};
+        }
+        MappedFile mapping(input_file_path);
+        stats_.addBytesRead(mapping.size());
+        return welchPSDFromBuffer(plan_cache_, mapping.data(), mapping.size(), data_type, segment_size, overlap, window, sampleRate);
+    }
+    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, data_type);
+    if (iq_sample.empty()) {
+        std::cerr << "Error: File is empty or could not be read." << std::endl;
+        return {};
+    }
+    return computeWelchPSD(plan_cache_, reinterpret_cast<const double*>(iq_sample.data()), iq_sample.size(), segment_size, overlap, window, sampleRate);
+}
+
+NDArray<double> Analyzer::calculateWelchPSDArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, int segment_size, int overlap, WindowFunction window, double sampleRate) {
+    return welchPSDFromBuffer(plan_cache_, iq_buffer, buffer_size, data_type, segment_size, overlap, window, sampleRate);
+}
+
+std::vector<double> Analyzer::calculateWelchPSD(const std::string& input_file_path, int segment_size, int overlap, WindowFunction window, double sampleRate, IQDataType data_type) {
+    return calculateWelchPSDArray(input_file_path, segment_size, overlap, window, sampleRate, data_type).data;
+}
+
+std::vector<double> Analyzer::calculateWelchPSD(const std::vector<std::vector<double>>& iq_samples, int segment_size, int overlap, WindowFunction window, double sampleRate) {
+    std::vector<std::complex<double>> iq_sample = convertToComplex(iq_samples, &stats_);
     if (iq_sample.empty()) {
         std::cerr << "Error: Provided IQ samples are empty or invalid." << std::endl;
-        return result;
+        return {};
     }
-    int iq_sample_size = static_cast<int>(iq_sample.size());
-    if (window_size <= 0 || window_size > iq_sample_size) {
-        std::cerr << "Error: window_size is invalid or larger than the total samples." << std::endl;
-        return result;
+    return computeWelchPSD(plan_cache_, reinterpret_cast<const double*>(iq_sample.data()), iq_sample.size(), segment_size, overlap, window, sampleRate).data;
+}
+
+// ============================================================================
+// CNN feature extraction: one pass over interleaved values of type T writes the
+// [real, imaginary, phase, magnitude in dB] rows consumed by the classifier,
+// so no complex, magnitude or phase intermediates are materialised
+// ============================================================================
+static constexpr std::size_t kParallelFeatureMinSamples = 1 << 15;
+
+template <typename T>
+static void computeFeatures(const T* values, std::size_t num_samples, double magnitude_floor, int num_threads, float* features) {
+    const double power_floor = magnitude_floor * magnitude_floor;
+    const long count = static_cast<long>(num_samples);
+    #pragma omp parallel for num_threads(num_threads) schedule(static) if (num_samples >= kParallelFeatureMinSamples && num_threads > 1)
+    for (long i = 0; i < count; ++i) {
+        const double real = static_cast<double>(values[2 * i]);
+        const double imag = static_cast<double>(values[2 * i + 1]);
+        const double power = real * real + imag * imag;
+        float* row = features + 4 * i;
+        row[0] = static_cast<float>(real);
+        row[1] = static_cast<float>(imag);
+        row[2] = static_cast<float>(std::atan2(imag, real));
+        row[3] = power == 0.0 ? 0.0f : static_cast<float>(10.0 * std::log10(std::max(power, power_floor)));
     }
-    if (overlap < 0 || overlap >= window_size) {
-        std::cerr << "Error: overlap must be >= 0 and < window_size." << std::endl;
-        return result;
+}
+
+// Number of samples in a feature-extraction input, or 0 (after reporting why) if it is unusable
+static std::size_t featureSampleCount(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, double magnitude_floor) {
+    std::size_t value_size = dataTypeSize(data_type);
+    if (iq_buffer == nullptr || buffer_size == 0) {
+        std::cerr << "Error: Provided IQ buffer is empty." << std::endl;
+        return 0;
     }
-    int hop_size = window_size - overlap;
-    int num_windows = 1 + (iq_sample_size - window_size) / hop_size;
-    if (num_windows <= 0) {
-        std::cerr << "Error: Not enough samples to form even one window." << std::endl;
-        return result;
+    if (buffer_size % (2 * value_size) != 0) {
+        std::cerr << "Error: Buffer size is not aligned with the expected data type size." << std::endl;
+        return 0;
     }
-    result.resize(num_windows, std::vector<double>(window_size));
-    for (int i = 0; i < num_windows; ++i) {
-        int start_index = i * hop_size;
-        int end_index = start_index + window_size;
-        std::vector<std::complex<double>> iq_sample_window(iq_sample.begin() + start_index, iq_sample.begin() + end_index);
-        std::vector<std::vector<double>> fft_result = executeFFTCtoC(iq_sample_window);
-        for (int j = 0; j < window_size; ++j) {
-            double re = fft_result[j][0];
-            double im = fft_result[j][1];
-            double magnitude = std::sqrt(re * re + im * im);
-            double power = (magnitude * magnitude) / iq_sample_size;
-            double power_db_per_rad_sample;
-            if (power <= 0.0) {
-                power_db_per_rad_sample = -120.0;
-            } else {
-                power_db_per_rad_sample = 10.0 * std::log10(power) - 10.0 * std::log10(2.0 * M_PI / sample_rate);
-            }
-            result[i][j] = power_db_per_rad_sample;
+    if (magnitude_floor < 0.0) {
+        std::cerr << "Error: magnitude_floor must be >= 0." << std::endl;
+        throw std::invalid_argument("magnitude_floor must be >= 0.");
+    }
+    return buffer_size / (2 * value_size);
+}
+
+static void featuresInto(const void* iq_buffer, std::size_t num_samples, IQDataType data_type,
+                         double magnitude_floor, int num_threads, float* features) {
+    if (data_type == IQDataType::FLOAT32) {
+        computeFeatures(static_cast<const float*>(iq_buffer), num_samples, magnitude_floor, num_threads, features);
+    } else if (data_type == IQDataType::FLOAT64) {
+        computeFeatures(static_cast<const double*>(iq_buffer), num_samples, magnitude_floor, num_threads, features);
+    } else {
+        computeFeatures(static_cast<const std::int16_t*>(iq_buffer), num_samples, magnitude_floor, num_threads, features);
+    }
+}
+
+static NDArray<float> featuresFromBuffer(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type,
+                                         double magnitude_floor, int num_threads) {
+    std::size_t num_samples = featureSampleCount(iq_buffer, buffer_size, data_type, magnitude_floor);
+    if (num_samples == 0) {
+        return {};
+    }
+    NDArray<float> result;
+    result.data.resize(num_samples * 4);
+    result.rows = num_samples;
+    result.cols = 4;
+    featuresInto(iq_buffer, num_samples, data_type, magnitude_floor, num_threads, result.data.data());
+    return result;
+}
+
+NDArray<float> Analyzer::extractFeaturesArray(const std::string& input_file_path, IQDataType data_type, double magnitude_floor) {
+    std::string ext = std::filesystem::path(input_file_path).extension().string();
+    if (isBinaryIQExtension(ext)) {
+        if (!validateIQFile(input_file_path, dataTypeSize(data_type))) {
+            return {};
         }
+        MappedFile mapping(input_file_path);
+        stats_.addBytesRead(mapping.size());
+        StageTimer timer(&stats_, AnalyzerStage::POSTPROCESS);
+        return featuresFromBuffer(mapping.data(), mapping.size(), data_type, magnitude_floor, plan_cache_.numThreads());
+    }
+    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, data_type);
+    if (iq_sample.empty()) {
+        std::cerr << "Error: File is empty or could not be read." << std::endl;
+        return {};
+    }
+    StageTimer timer(&stats_, AnalyzerStage::POSTPROCESS);
+    return featuresFromBuffer(iq_sample.data(), iq_sample.size() * sizeof(std::complex<double>), IQDataType::FLOAT64,
+                              magnitude_floor, plan_cache_.numThreads());
+}
+
+NDArray<float> Analyzer::extractFeaturesArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, double magnitude_floor) {
+    StageTimer timer(&stats_, AnalyzerStage::POSTPROCESS);
+    return featuresFromBuffer(iq_buffer, buffer_size, data_type, magnitude_floor, plan_cache_.numThreads());
+}
+
+std::size_t Analyzer::extractFeaturesInto(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, double magnitude_floor,
+                                          void* features_buffer, std::size_t features_size) {
+    StageTimer timer(&stats_, AnalyzerStage::POSTPROCESS);
+    std::size_t num_samples = featureSampleCount(iq_buffer, buffer_size, data_type, magnitude_floor);
+    if (num_samples == 0) {
+        return 0;
+    }
+    if (features_size < num_samples * 4 * sizeof(float)) {
+        std::cerr << "Error: Feature buffer is too small for " << num_samples << " samples." << std::endl;
+        throw std::invalid_argument("Feature buffer is too small for the IQ samples.");
+    }
+    featuresInto(iq_buffer, num_samples, data_type, magnitude_floor, plan_cache_.numThreads(), static_cast<float*>(features_buffer));
+    return num_samples;
+}
+
+// ============================================================================
+// Spectrogram functions implementations
+// ============================================================================
+static std::vector<std::vector<double>> spectrogramRows(const NDArray<double>& spectrogram, AnalyzerStats* stats) {
+    StageTimer timer(stats, AnalyzerStage::OUTPUT);
+    std::vector<std::vector<double>> result(spectrogram.rows);
+    for (std::size_t i = 0; i < spectrogram.rows; ++i) {
+        auto row = spectrogram.data.begin() + i * spectrogram.cols;
+        result[i].assign(row, row + spectrogram.cols);
     }
     return result;
 }
 
+std::vector<std::vector<double>> Analyzer::generateIQSpectrogram(const std::string& input_file_path, int overlap, int window_size, double sample_rate, IQDataType data_type) {
+    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, data_type);
+    if (iq_sample.empty()) {
+        std::cerr << "Error: File is empty or could not be read." << std::endl;
+        return {};
+    }
+    return spectrogramRows(spectrogramArray(plan_cache_, viewIQSamples(std::move(iq_sample)), overlap, window_size, sample_rate), &stats_);
+}
+
+std::vector<std::vector<double>> Analyzer::generateIQSpectrogram(const std::vector<std::vector<double>>& iq_samples_input, int overlap, int window_size, double sample_rate) {
+    std::vector<std::complex<double>> iq_sample = convertToComplex(iq_samples_input, &stats_);
+    if (iq_sample.empty()) {
+        std::cerr << "Error: Provided IQ samples are empty or invalid." << std::endl;
+        return {};
+    }
+    return spectrogramRows(spectrogramArray(plan_cache_, viewIQSamples(std::move(iq_sample)), overlap, window_size, sample_rate), &stats_);
+}
+
 // ============================================================================
 // Real part extraction functions
 // ============================================================================
@@ -472,3 +1230,382 @@ std::vector<double> Analyzer::imaginaryPartIQSamples(const std::vector<std::vect
     }
     return result;
 }
+
+// ============================================================================
+// NumPy interface implementations
+// ============================================================================
+NDArray<std::complex<double>> Analyzer::fastFourierTransformArray(const std::string& input_file_path, IQDataType data_type) {
+    IQSampleView view = viewIQSamples(readIQSamples(input_file_path, data_type));
+    if (view.size == 0) {
+        std::cerr << "Error: File is empty or not valid." << std::endl;
+        return {};
+    }
+    return fftArray(plan_cache_, view);
+}
+
+NDArray<std::complex<double>> Analyzer::fastFourierTransformArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type) {
+    IQSampleView view = viewIQBuffer(iq_buffer, buffer_size, data_type, &stats_);
+    if (view.size == 0) {
+        std::cerr << "Error: Provided IQ samples are empty or invalid." << std::endl;
+        return {};
+    }
+    return fftArray(plan_cache_, view);
+}
+
+NDArray<std::complex<double>> Analyzer::fastFourierTransformArray(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type) {
+    IQSampleView view = viewIQSamples(readIQSamples(input_file_path, start_sample, end_sample, data_type));
+    if (view.size == 0) {
+        std::cerr << "Error: Could not extract IQ samples from the specified range." << std::endl;
+        return {};
+    }
+    return fftArray(plan_cache_, view);
+}
+
+NDArray<double> Analyzer::calculatePSDArray(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type) {
+    IQSampleView view = viewIQSamples(readIQSamples(input_file_path, start_sample, end_sample, data_type));
+    if (view.size == 0) {
+        std::cerr << "Error: Could not extract IQ samples from the specified range." << std::endl;
+        return {};
+    }
+    return psdArray(plan_cache_, view, static_cast<double>(view.size));
+}
+
+NDArray<double> Analyzer::calculatePSDArray(const std::string& input_file_path, double sampleRate, IQDataType data_type) {
+    IQSampleView view = viewIQSamples(readIQSamples(input_file_path, data_type));
+    if (view.size == 0) {
+        std::cerr << "Error: File is empty or could not be read." << std::endl;
+        return {};
+    }
+    return psdArray(plan_cache_, view, view.size * sampleRate);
+}
+
+NDArray<double> Analyzer::calculatePSDArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, double sampleRate) {
+    IQSampleView view = viewIQBuffer(iq_buffer, buffer_size, data_type, &stats_);
+    if (view.size == 0) {
+        std::cerr << "Error: Provided IQ samples are empty or invalid." << std::endl;
+        return {};
+    }
+    return psdArray(plan_cache_, view, view.size * sampleRate);
+}
+
+NDArray<double> Analyzer::generateIQSpectrogramArray(const std::string& input_file_path, int overlap, int window_size, double sample_rate, IQDataType data_type) {
+    IQSampleView view = viewIQSamples(readIQSamples(input_file_path, data_type));
+    if (view.size == 0) {
+        std::cerr << "Error: File is empty or could not be read." << std::endl;
+        return {};
+    }
+    return spectrogramArray(plan_cache_, view, overlap, window_size, sample_rate);
+}
+
+NDArray<double> Analyzer::generateIQSpectrogramArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, int overlap, int window_size, double sample_rate) {
+    IQSampleView view = viewIQBuffer(iq_buffer, buffer_size, data_type, &stats_);
+    if (view.size == 0) {
+        std::cerr << "Error: Provided IQ samples are empty or invalid." << std::endl;
+        return {};
+    }
+    return spectrogramArray(plan_cache_, view, overlap, window_size, sample_rate);
+}
+
+NDArray<double> Analyzer::realPartIQSamplesArray(const std::string& input_file_path, IQDataType data_type) {
+    IQSampleView view = viewIQSamples(readIQSamples(input_file_path, data_type));
+    if (view.size == 0) {
+        return {};
+    }
+    return componentArray(view, 0, static_cast<int>(view.size), 0);
+}
+
+NDArray<double> Analyzer::realPartIQSamplesArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, int start_sample, int end_sample) {
+    return componentArray(viewIQBuffer(iq_buffer, buffer_size, data_type, &stats_), start_sample, end_sample, 0);
+}
+
+NDArray<double> Analyzer::imaginaryPartIQSamplesArray(const std::string& input_file_path, IQDataType data_type) {
+    IQSampleView view = viewIQSamples(readIQSamples(input_file_path, data_type));
+    if (view.size == 0) {
+        return {};
+    }
+    return componentArray(view, 0, static_cast<int>(view.size), 1);
+}
+
+NDArray<double> Analyzer::imaginaryPartIQSamplesArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, int start_sample, int end_sample) {
+    return componentArray(viewIQBuffer(iq_buffer, buffer_size, data_type, &stats_), start_sample, end_sample, 1);
+}
+
+NDArray<std::complex<double>> Analyzer::getIQSamplesArray(const std::string& input_file_path, IQDataType data_type) {
+    return complexArray(readIQSamples(input_file_path, data_type));
+}
+
+NDArray<std::complex<double>> Analyzer::getIQSamplesArray(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type) {
+    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, start_sample, end_sample, data_type);
+    if (iq_sample.empty()) {
+        std::cerr << "Error: File is empty or could not be read." << std::endl;
+        return {};
+    }
+    return complexArray(std::move(iq_sample));
+}
+
+NDArray<std::complex<double>> Analyzer::getIQSamplesArray(const std::string& input_file_path, IQDataType data_type, const std::vector<std::string>& csv_columns) {
+    return complexArray(readIQSamples(input_file_path, data_type, csv_columns));
+}
+
+// ============================================================================
+// Single-precision NumPy interface implementations
+// ============================================================================
+std::vector<std::complex<float>> Analyzer::readIQSamplesFloat32(const std::string& input_file_path, std::size_t start_sample, std::size_t end_sample, IQDataType data_type) {
+    std::string ext = std::filesystem::path(input_file_path).extension().string();
+    if (isBinaryIQExtension(ext)) {
+        StageTimer timer(&stats_, AnalyzerStage::READ);
+        std::vector<std::complex<float>> iq_sample = readBinaryIQSamples<float>(input_file_path, start_sample, end_sample, data_type);
+        stats_.addBytesRead(iq_sample.size() * 2 * dataTypeSize(data_type));
+        return iq_sample;
+    }
+    std::vector<std::complex<double>> iq_sample = readIQSamples(input_file_path, data_type);
+    if (iq_sample.empty()) {
+        return {};
+    }
+    if (start_sample >= iq_sample.size()) {
+        std::cerr << "Error: Invalid sample range." << std::endl;
+        return {};
+    }
+    end_sample = std::min(end_sample, iq_sample.size());
+    std::vector<std::complex<float>> narrowed(end_sample - start_sample);
+    widenIQSamples(reinterpret_cast<const double*>(iq_sample.data() + start_sample), narrowed.size(), narrowed.data());
+    return narrowed;
+}
+
+static constexpr std::size_t kWholeFile = std::numeric_limits<std::size_t>::max();
+
+static bool validSampleRange(int start_sample, int end_sample) {
+    if (start_sample < 0 || end_sample <= start_sample) {
+        std::cerr << "Error: Invalid sample range." << std::endl;
+        return false;
+    }
+    return true;
+}
+
+NDArray<std::complex<float>> Analyzer::fastFourierTransformFloat32(const std::string& input_file_path, IQDataType data_type) {
+    BasicIQSampleView<float> view = viewIQSamples(readIQSamplesFloat32(input_file_path, 0, kWholeFile, data_type));
+    if (view.size == 0) {
+        std::cerr << "Error: File is empty or not valid." << std::endl;
+        return {};
+    }
+    return fftArray(plan_cache_float32_, view);
+}
+
+NDArray<std::complex<float>> Analyzer::fastFourierTransformFloat32(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type) {
+    BasicIQSampleView<float> view = viewIQBuffer<float>(iq_buffer, buffer_size, data_type, &stats_);
+    if (view.size == 0) {
+        std::cerr << "Error: Provided IQ samples are empty or invalid." << std::endl;
+        return {};
+    }
+    return fftArray(plan_cache_float32_, view);
+}
+
+NDArray<std::complex<float>> Analyzer::fastFourierTransformFloat32(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type) {
+    if (!validSampleRange(start_sample, end_sample)) {
+        return {};
+    }
+    BasicIQSampleView<float> view = viewIQSamples(readIQSamplesFloat32(input_file_path, start_sample, end_sample, data_type));
+    if (view.size == 0) {
+        std::cerr << "Error: Could not extract IQ samples from the specified range." << std::endl;
+        return {};
+    }
+    return fftArray(plan_cache_float32_, view);
+}
+
+NDArray<float> Analyzer::calculatePSDFloat32(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type) {
+    if (!validSampleRange(start_sample, end_sample)) {
+        return {};
+    }
+    BasicIQSampleView<float> view = viewIQSamples(readIQSamplesFloat32(input_file_path, start_sample, end_sample, data_type));
+    if (view.size == 0) {
+        std::cerr << "Error: Could not extract IQ samples from the specified range." << std::endl;
+        return {};
+    }
+    return psdArray(plan_cache_float32_, view, static_cast<double>(view.size));
+}
+
+NDArray<float> Analyzer::calculatePSDFloat32(const std::string& input_file_path, double sampleRate, IQDataType data_type) {
+    BasicIQSampleView<float> view = viewIQSamples(readIQSamplesFloat32(input_file_path, 0, kWholeFile, data_type));
+    if (view.size == 0) {
+        std::cerr << "Error: File is empty or could not be read." << std::endl;
+        return {};
+    }
+    return psdArray(plan_cache_float32_, view, view.size * sampleRate);
+}
+
+NDArray<float> Analyzer::calculatePSDFloat32(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, double sampleRate) {
+    BasicIQSampleView<float> view = viewIQBuffer<float>(iq_buffer, buffer_size, data_type, &stats_);
+    if (view.size == 0) {
+        std::cerr << "Error: Provided IQ samples are empty or invalid." << std::endl;
+        return {};
+    }
+    return psdArray(plan_cache_float32_, view, view.size * sampleRate);
+}
+
+NDArray<float> Analyzer::generateIQSpectrogramFloat32(const std::string& input_file_path, int overlap, int window_size, double sample_rate, IQDataType data_type) {
+    BasicIQSampleView<float> view = viewIQSamples(readIQSamplesFloat32(input_file_path, 0, kWholeFile, data_type));
+    if (view.size == 0) {
+        std::cerr << "Error: File is empty or could not be read." << std::endl;
+        return {};
+    }
+    return spectrogramArray(plan_cache_float32_, view, overlap, window_size, sample_rate);
+}
+
+NDArray<float> Analyzer::generateIQSpectrogramFloat32(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, int overlap, int window_size, double sample_rate) {
+    BasicIQSampleView<float> view = viewIQBuffer<float>(iq_buffer, buffer_size, data_type, &stats_);
+    if (view.size == 0) {
+        std::cerr << "Error: Provided IQ samples are empty or invalid." << std::endl;
+        return {};
+    }
+    return spectrogramArray(plan_cache_float32_, view, overlap, window_size, sample_rate);
+}
+
+// ============================================================================
+// FFTW planning configuration
+// ============================================================================
+void Analyzer::setFFTPlanRigor(FFTPlanRigor rigor) {
+    plan_cache_.setRigor(rigor);
+    plan_cache_float32_.setRigor(rigor);
+}
+
+FFTPlanRigor Analyzer::getFFTPlanRigor() const {
+    return plan_cache_.rigor();
+}
+
+bool Analyzer::importFFTWisdom(const std::string& wisdom_file_path) {
+    if (!std::filesystem::exists(wisdom_file_path)) {
+        std::cerr << "Error: File does not exist: " << wisdom_file_path << std::endl;
+        return false;
+    }
+    if (precision_ == IQPrecision::FLOAT32) {
+        return FFTPlanCacheFloat32::importWisdom(wisdom_file_path);
+    }
+    return FFTPlanCache::importWisdom(wisdom_file_path);
+}
+
+bool Analyzer::exportFFTWisdom(const std::string& wisdom_file_path) {
+    if (precision_ == IQPrecision::FLOAT32) {
+        return FFTPlanCacheFloat32::exportWisdom(wisdom_file_path);
+    }
+    return FFTPlanCache::exportWisdom(wisdom_file_path);
+}
+
+void Analyzer::setNumThreads(int num_threads) {
+    plan_cache_.setNumThreads(num_threads);
+    plan_cache_float32_.setNumThreads(num_threads);
+}
+
+int Analyzer::getNumThreads() const {
+    return plan_cache_.numThreads();
+}
+
+void Analyzer::setPrecision(IQPrecision precision) {
+    if (precision != IQPrecision::FLOAT64 && precision != IQPrecision::FLOAT32) {
+        std::cerr << "Error: Invalid precision specified." << std::endl;
+        throw std::invalid_argument("Invalid precision specified.");
+    }
+    precision_ = precision;
+}
+
+IQPrecision Analyzer::getPrecision() const {
+    return precision_;
+}
+
+void Analyzer::clearFFTPlanCache() {
+    plan_cache_.clear();
+    plan_cache_float32_.clear();
+}
+
+void Analyzer::setStatsEnabled(bool enabled) {
+    stats_.setEnabled(enabled);
+}
+
+bool Analyzer::getStatsEnabled() const {
+    return stats_.enabled();
+}
+
+std::map<std::string, unsigned long long> Analyzer::getStats() const {
+    return stats_.snapshot();
+}
+
+void Analyzer::resetStats() {
+    stats_.reset();
+}
+
+// ============================================================================
+// StreamingSpectrogram implementation
+// ============================================================================
+StreamingSpectrogram::StreamingSpectrogram(int window_size, int overlap, double sample_rate, std::size_t scale_samples)
+    : window_size_(window_size), overlap_(overlap), sample_rate_(sample_rate) {
+    if (window_size <= 0) {
+        std::cerr << "Error: window_size must be > 0." << std::endl;
+        throw std::invalid_argument("window_size must be > 0.");
+    }
+    if (overlap < 0 || overlap >= window_size) {
+        std::cerr << "Error: overlap must be >= 0 and < window_size." << std::endl;
+        throw std::invalid_argument("overlap must be >= 0 and < window_size.");
+    }
+    if (sample_rate <= 0.0) {
+        std::cerr << "Error: sample_rate must be > 0." << std::endl;
+        throw std::invalid_argument("sample_rate must be > 0.");
+    }
+    scale_samples_ = scale_samples == 0 ? static_cast<std::size_t>(window_size) : scale_samples;
+    buffer_.reserve(2 * static_cast<std::size_t>(window_size));
+}
+
+void StreamingSpectrogram::push(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type) {
+    if (buffer_size == 0) {
+        return;
+    }
+    IQSampleView view = viewIQBuffer(iq_buffer, buffer_size, data_type);
+    std::lock_guard<std::mutex> lock(mutex_);
+    buffer_.insert(buffer_.end(), view.data, view.data + view.size);
+}
+
+void StreamingSpectrogram::push(const std::vector<std::vector<double>>& iq_samples) {
+    std::vector<std::complex<double>> iq_sample = convertToComplex(iq_samples);
+    std::lock_guard<std::mutex> lock(mutex_);
+    buffer_.insert(buffer_.end(), iq_sample.begin(), iq_sample.end());
+}
+
+std::size_t StreamingSpectrogram::windowCount() const {
+    if (buffer_.size() < static_cast<std::size_t>(window_size_)) {
+        return 0;
+    }
+    return 1 + (buffer_.size() - window_size_) / static_cast<std::size_t>(window_size_ - overlap_);
+}
+
+std::size_t StreamingSpectrogram::pendingRows() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return windowCount();
+}
+
+std::size_t StreamingSpectrogram::bufferedSamples() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return buffer_.size();
+}
+
+NDArray<double> StreamingSpectrogram::popRows() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    NDArray<double> result;
+    std::size_t num_windows = windowCount();
+    if (num_windows == 0) {
+        result.cols = static_cast<std::size_t>(window_size_);
+        return result;
+    }
+    result.data.resize(num_windows * window_size_);
+    computeSpectrogram(plans_, buffer_.data(), static_cast<int>(num_windows), overlap_, window_size_,
+                       spectrogramDbOffset(scale_samples_, sample_rate_), result.data.data());
+    result.rows = num_windows;
+    result.cols = static_cast<std::size_t>(window_size_);
+
+    // Keep the samples still needed by the next window; the capacity is reused
+    std::size_t consumed = num_windows * static_cast<std::size_t>(window_size_ - overlap_);
+    buffer_.erase(buffer_.begin(), buffer_.begin() + consumed);
+    return result;
+}
+
+void StreamingSpectrogram::reset() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    buffer_.clear();
+}
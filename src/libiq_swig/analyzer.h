@@ -11,9 +11,18 @@
 #include <cmath>
 #include <complex>
 #include <fftw3.h>
+#include "fft_plan_cache.h"
+#include "analyzer_stats.h"
 #include <stdexcept>
 #include <iomanip>
 #include <algorithm>
+#include <limits>
+#include <atomic>
+#include <mutex>
+#include <memory>
+#include <map>
+#include <cstddef>
+#include <cstdint>
 
 // ============================================================================
 // Enum to specify the data type of IQ samples
@@ -24,9 +33,216 @@ enum class IQDataType {
     INT16
 };
 
+// ============================================================================
+// Enum to specify the window applied to each segment of a Welch PSD estimate
+// (periodic definitions, as used for spectral analysis)
+// ============================================================================
+enum class WindowFunction {
+    RECTANGULAR,
+    HANN,
+    HAMMING,
+    BLACKMAN
+};
+
+// ============================================================================
+// Enum to specify the floating-point precision of the FFT/PSD/spectrogram path
+// ============================================================================
+enum class IQPrecision {
+    FLOAT64,
+    FLOAT32
+};
+
+// ============================================================================
+// Contiguous row-major array returned to Python as a NumPy array.
+// Complex elements are exposed as an (rows, 2) array of [real, imaginary].
+// ============================================================================
+template <typename T>
+struct NDArray {
+    std::vector<T> data;
+    std::size_t rows = 0;
+    std::size_t cols = 0; // 0 for one-dimensional arrays
+};
+
+// ============================================================================
+// Read-only memory mapping of a binary IQ capture (.iq or .bin).
+// Pages are loaded lazily by the kernel and shared through the page cache by
+// every process mapping the same file, so opening a capture costs no heap
+// memory regardless of its size.
+// ============================================================================
+class MappedFile;
+
+class IQCapture {
+public:
+    /**
+     * @brief Maps a binary IQ capture into memory.
+     *
+     * @param input_file_path The path to the .iq or .bin file.
+     * @param data_type The data type of the IQ samples.
+     * @throws std::invalid_argument If the file does not exist, has an unsupported extension
+     *         or its size is not aligned with the data type.
+     * @throws std::runtime_error If the file cannot be mapped.
+     */
+    IQCapture(const std::string& input_file_path, IQDataType data_type);
+
+    /**
+     * @brief Returns the path of the mapped file.
+     */
+    const std::string& path() const { return path_; }
+
+    /**
+     * @brief Returns the data type of the IQ samples.
+     */
+    IQDataType dataType() const { return data_type_; }
+
+    /**
+     * @brief Returns the number of complex IQ samples in the capture.
+     */
+    std::size_t numSamples() const;
+
+    /**
+     * @brief Returns the size of the mapped data in bytes.
+     */
+    std::size_t sizeBytes() const;
+
+    /**
+     * @brief Returns a pointer to the interleaved [real, imaginary] values of the capture.
+     */
+    const void* data() const;
+
+    /**
+     * @brief Returns the mapping, which stays valid for as long as a copy of the pointer is held.
+     */
+    std::shared_ptr<const MappedFile> mapping() const { return mapping_; }
+
+    /**
+     * @brief Widens the samples in [start_sample, end_sample) to std::complex<double>.
+     *        Only the pages backing the requested range are read from disk.
+     *
+     * @param start_sample The starting sample index.
+     * @param end_sample The ending sample index (exclusive), clipped to the capture length.
+     * @return A vector of std::complex<double> (empty if the range is invalid).
+     */
+    std::vector<std::complex<double>> readSamples(std::size_t start_sample, std::size_t end_sample) const;
+
+private:
+    std::string path_;
+    IQDataType data_type_;
+    std::shared_ptr<const MappedFile> mapping_;
+};
+
+// ============================================================================
+// IQ sample analysis. An Analyzer is thread-safe: its methods may be called
+// concurrently from several threads, and the Python wrapper releases the GIL
+// while they run.
+// ============================================================================
 class Analyzer {
 public:
-    Analyzer() {}
+    Analyzer() {
+        plan_cache_.setStats(&stats_);
+        plan_cache_float32_.setStats(&stats_);
+    }
+
+    Analyzer(const Analyzer&) = delete;
+    Analyzer& operator=(const Analyzer&) = delete;
+
+    /**
+     * @brief Sets how thoroughly FFTW plans new transform sizes and drops the cached plans.
+     *        MEASURE and PATIENT plan slower but execute faster; combine them with
+     *        importFFTWisdom/exportFFTWisdom to pay the planning cost once per host.
+     *
+     * @param rigor The FFTW planning rigor (default: ESTIMATE).
+     */
+    void setFFTPlanRigor(FFTPlanRigor rigor);
+
+    /**
+     * @brief Returns the FFTW planning rigor used for new plans.
+     *
+     * @return The FFTW planning rigor.
+     */
+    FFTPlanRigor getFFTPlanRigor() const;
+
+    /**
+     * @brief Imports FFTW wisdom of the selected precision from a file.
+     *
+     * @param wisdom_file_path The path to a wisdom file written by exportFFTWisdom.
+     * @return true if the wisdom was imported.
+     */
+    bool importFFTWisdom(const std::string& wisdom_file_path);
+
+    /**
+     * @brief Exports the FFTW wisdom of the selected precision accumulated by this process to a file.
+     *
+     * @param wisdom_file_path The path of the wisdom file to write.
+     * @return true if the wisdom was exported.
+     */
+    bool exportFFTWisdom(const std::string& wisdom_file_path);
+
+    /**
+     * @brief Sets the number of threads used by the spectrogram (one batch of windows per
+     *        thread) and by FFT/PSD transforms of at least 32768 samples.
+     *
+     * @param num_threads The number of threads (>= 1). The default is read from
+     *        LIBIQ_NUM_THREADS, then OMP_NUM_THREADS, and is 1 if neither is set.
+     * @throws std::invalid_argument If num_threads is smaller than 1.
+     */
+    void setNumThreads(int num_threads);
+
+    /**
+     * @brief Returns the number of threads used by the analysis methods.
+     *
+     * @return The number of threads.
+     */
+    int getNumThreads() const;
+
+    /**
+     * @brief Selects the precision of the NumPy FFT, PSD and spectrogram methods.
+     *        With FLOAT32 the samples are kept as std::complex<float>, transformed with
+     *        single-precision FFTW plans and returned as float32 arrays.
+     *
+     * @param precision The precision (default: FLOAT64).
+     */
+    void setPrecision(IQPrecision precision);
+
+    /**
+     * @brief Returns the precision of the NumPy FFT, PSD and spectrogram methods.
+     *
+     * @return The precision.
+     */
+    IQPrecision getPrecision() const;
+
+    /**
+     * @brief Destroys all cached FFTW plans.
+     */
+    void clearFFTPlanCache();
+
+    /**
+     * @brief Enables or disables the per-stage instrumentation (disabled by default).
+     *        While enabled, every call accumulates the time spent reading, converting,
+     *        planning, executing, post-processing and building list outputs, together
+     *        with the bytes read from captures and the FFTW plans created.
+     *
+     * @param enabled Whether to collect statistics.
+     */
+    void setStatsEnabled(bool enabled);
+
+    /**
+     * @brief Returns whether the per-stage instrumentation is enabled.
+     */
+    bool getStatsEnabled() const;
+
+    /**
+     * @brief Returns the collected statistics: "<stage>_ns" (cumulative nanoseconds, summed
+     *        over threads) and "<stage>_calls" for the stages read, convert, plan, execute,
+     *        postprocess and output, plus "bytes_read" and "plans_created".
+     *
+     * @return A map from counter name to value.
+     */
+    std::map<std::string, unsigned long long> getStats() const;
+
+    /**
+     * @brief Resets all statistics to zero.
+     */
+    void resetStats();
 
     /**
      * @brief Performs a Fast Fourier Transform (FFT) on IQ data read from a file.
@@ -86,6 +302,34 @@ public:
      */
     std::vector<double> calculatePSD(const std::vector<std::vector<double>>& iq_samples, double sampleRate);
 
+    /**
+     * @brief Estimates the PSD of IQ data read from a file with Welch's method: the capture
+     *        is split into overlapping windowed segments whose periodograms are averaged.
+     *        Binary files are streamed from a memory mapping segment by segment, so memory
+     *        stays O(segment_size) regardless of the capture length.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param segment_size The number of samples per segment (FFT size).
+     * @param overlap The number of overlapping samples between consecutive segments.
+     * @param window The window applied to each segment.
+     * @param sampleRate The sampling rate of the IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return A vector of segment_size two-sided PSD values in FFT order (empty on error).
+     */
+    std::vector<double> calculateWelchPSD(const std::string& input_file_path, int segment_size, int overlap, WindowFunction window, double sampleRate, IQDataType data_type);
+
+    /**
+     * @brief Estimates the PSD of provided IQ data with Welch's method.
+     *
+     * @param iq_samples A 2D vector containing IQ samples [real, imaginary].
+     * @param segment_size The number of samples per segment (FFT size).
+     * @param overlap The number of overlapping samples between consecutive segments.
+     * @param window The window applied to each segment.
+     * @param sampleRate The sampling rate of the IQ data.
+     * @return A vector of segment_size two-sided PSD values in FFT order (empty on error).
+     */
+    std::vector<double> calculateWelchPSD(const std::vector<std::vector<double>>& iq_samples, int segment_size, int overlap, WindowFunction window, double sampleRate);
+
     /**
      * @brief Generates an IQ spectrogram from a file.
      *
@@ -178,6 +422,333 @@ public:
      */
     std::vector<std::vector<double>> getIQSamples(const std::string& input_file_path, IQDataType data_type, const std::vector<std::string>& csv_columns);
 
+    // ------------------------------------------------------------------------
+    // NumPy interface: inputs are read in place from contiguous buffers of
+    // interleaved [real, imaginary] values (complex64/complex128 or (N, 2)
+    // arrays) and results are returned as contiguous NumPy arrays.
+    // ------------------------------------------------------------------------
+
+    /**
+     * @brief Performs an FFT on IQ data read from a file.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return An (N, 2) array containing the real and imaginary parts of the FFT output.
+     */
+    NDArray<std::complex<double>> fastFourierTransformArray(const std::string& input_file_path, IQDataType data_type);
+
+    /**
+     * @brief Performs an FFT on IQ samples stored in a contiguous buffer.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @return An (N, 2) array containing the real and imaginary parts of the FFT output.
+     */
+    NDArray<std::complex<double>> fastFourierTransformArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type);
+
+    /**
+     * @brief Performs an FFT on IQ data read from a file within a specified sample range.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param start_sample The starting sample index.
+     * @param end_sample The ending sample index (exclusive).
+     * @param data_type The data type of the IQ samples.
+     * @return An (N, 2) array containing the real and imaginary parts of the FFT output.
+     */
+    NDArray<std::complex<double>> fastFourierTransformArray(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type);
+
+    /**
+     * @brief Calculates the PSD of IQ data read from a file within a specified range.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param start_sample The starting sample index.
+     * @param end_sample The ending sample index (exclusive).
+     * @param data_type The data type of the IQ samples.
+     * @return A one-dimensional array containing the PSD data.
+     */
+    NDArray<double> calculatePSDArray(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type);
+
+    /**
+     * @brief Calculates the PSD of IQ data read from a file.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param sampleRate The sampling rate of the IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return A one-dimensional array containing the PSD data.
+     */
+    NDArray<double> calculatePSDArray(const std::string& input_file_path, double sampleRate, IQDataType data_type);
+
+    /**
+     * @brief Calculates the PSD of IQ samples stored in a contiguous buffer.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @param sampleRate The sampling rate of the IQ data.
+     * @return A one-dimensional array containing the PSD data.
+     */
+    NDArray<double> calculatePSDArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, double sampleRate);
+
+    /**
+     * @brief Estimates the PSD of IQ data read from a file with Welch's method.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param segment_size The number of samples per segment (FFT size).
+     * @param overlap The number of overlapping samples between consecutive segments.
+     * @param window The window applied to each segment.
+     * @param sampleRate The sampling rate of the IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return A one-dimensional array of segment_size two-sided PSD values in FFT order.
+     */
+    NDArray<double> calculateWelchPSDArray(const std::string& input_file_path, int segment_size, int overlap, WindowFunction window, double sampleRate, IQDataType data_type);
+
+    /**
+     * @brief Estimates the PSD of IQ samples stored in a contiguous buffer with Welch's method.
+     *        Segments are converted from the buffer one at a time, so int16/float32 buffers
+     *        are never widened as a whole.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @param segment_size The number of samples per segment (FFT size).
+     * @param overlap The number of overlapping samples between consecutive segments.
+     * @param window The window applied to each segment.
+     * @param sampleRate The sampling rate of the IQ data.
+     * @return A one-dimensional array of segment_size two-sided PSD values in FFT order.
+     */
+    NDArray<double> calculateWelchPSDArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, int segment_size, int overlap, WindowFunction window, double sampleRate);
+
+    /**
+     * @brief Extracts the CNN input features of IQ data read from a file.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @param magnitude_floor The smallest magnitude converted to dB (non-zero magnitudes below it are clamped).
+     * @return A (num_samples, 4) float32 array of [real, imaginary, phase, magnitude in dB] rows.
+     */
+    NDArray<float> extractFeaturesArray(const std::string& input_file_path, IQDataType data_type, double magnitude_floor);
+
+    /**
+     * @brief Extracts the CNN input features of IQ samples stored in a contiguous buffer in a
+     *        single pass: each sample yields [real, imaginary, atan2(imaginary, real),
+     *        20 * log10(max(|x|, magnitude_floor))], with 0 dB for samples of zero magnitude.
+     *        Values are computed in double precision and stored as float32.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @param magnitude_floor The smallest magnitude converted to dB (non-zero magnitudes below it are clamped).
+     * @return A (num_samples, 4) float32 array of [real, imaginary, phase, magnitude in dB] rows.
+     */
+    NDArray<float> extractFeaturesArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, double magnitude_floor);
+
+    /**
+     * @brief Extracts the CNN input features of IQ samples stored in a contiguous buffer into a
+     *        caller-provided float32 buffer, so repeated calls allocate nothing. The rows are
+     *        the same as those of extractFeaturesArray.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @param magnitude_floor The smallest magnitude converted to dB (non-zero magnitudes below it are clamped).
+     * @param features_buffer Pointer to the writable float32 output, at least num_samples * 4 values.
+     * @param features_size The size of the output buffer in bytes.
+     * @return The number of rows written (0 if the IQ buffer is empty or misaligned).
+     */
+    std::size_t extractFeaturesInto(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, double magnitude_floor,
+                                    void* features_buffer, std::size_t features_size);
+
+    /**
+     * @brief Generates an IQ spectrogram from a file.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param overlap The number of overlapping samples between consecutive windows.
+     * @param window_size The window size for the FFT.
+     * @param sample_rate The sampling rate of the IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return A (num_windows, window_size) array representing the spectrogram in dB.
+     */
+    NDArray<double> generateIQSpectrogramArray(const std::string& input_file_path, int overlap, int window_size, double sample_rate, IQDataType data_type);
+
+    /**
+     * @brief Generates an IQ spectrogram from IQ samples stored in a contiguous buffer.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @param overlap The number of overlapping samples between consecutive windows.
+     * @param window_size The window size for the FFT.
+     * @param sample_rate The sampling rate of the IQ data.
+     * @return A (num_windows, window_size) array representing the spectrogram in dB.
+     */
+    NDArray<double> generateIQSpectrogramArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, int overlap, int window_size, double sample_rate);
+
+    /**
+     * @brief Extracts the real part of IQ samples from a file.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return A one-dimensional array containing the real part.
+     */
+    NDArray<double> realPartIQSamplesArray(const std::string& input_file_path, IQDataType data_type);
+
+    /**
+     * @brief Extracts the real part from a contiguous IQ buffer within a specified range.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @param start_sample The starting sample index.
+     * @param end_sample The ending sample index (exclusive).
+     * @return A one-dimensional array containing the real part.
+     */
+    NDArray<double> realPartIQSamplesArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, int start_sample, int end_sample);
+
+    /**
+     * @brief Extracts the imaginary part of IQ samples from a file.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return A one-dimensional array containing the imaginary part.
+     */
+    NDArray<double> imaginaryPartIQSamplesArray(const std::string& input_file_path, IQDataType data_type);
+
+    /**
+     * @brief Extracts the imaginary part from a contiguous IQ buffer within a specified range.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @param start_sample The starting sample index.
+     * @param end_sample The ending sample index (exclusive).
+     * @return A one-dimensional array containing the imaginary part.
+     */
+    NDArray<double> imaginaryPartIQSamplesArray(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, int start_sample, int end_sample);
+
+    /**
+     * @brief Extracts IQ samples from a file.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return An (N, 2) array with [real, imaginary].
+     */
+    NDArray<std::complex<double>> getIQSamplesArray(const std::string& input_file_path, IQDataType data_type);
+
+    /**
+     * @brief Extracts IQ samples from a file within a specified range.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param start_sample The starting sample index.
+     * @param end_sample The ending sample index (exclusive).
+     * @param data_type The data type of the IQ samples.
+     * @return An (N, 2) array with [real, imaginary].
+     */
+    NDArray<std::complex<double>> getIQSamplesArray(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type);
+
+    /**
+     * @brief Extracts IQ samples from a file (supports both .bin and .csv) using the given CSV columns.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @param csv_columns A vector of strings with the column names to use.
+     * @return An (N, 2) array with [real, imaginary].
+     */
+    NDArray<std::complex<double>> getIQSamplesArray(const std::string& input_file_path, IQDataType data_type, const std::vector<std::string>& csv_columns);
+
+    // ------------------------------------------------------------------------
+    // Single-precision NumPy interface: samples are converted to
+    // std::complex<float> (float32/complex64 inputs are read in place),
+    // transformed with fftwf plans and returned as float32 arrays.
+    // ------------------------------------------------------------------------
+
+    /**
+     * @brief Performs a single-precision FFT on IQ data read from a file.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return An (N, 2) float32 array containing the real and imaginary parts of the FFT output.
+     */
+    NDArray<std::complex<float>> fastFourierTransformFloat32(const std::string& input_file_path, IQDataType data_type);
+
+    /**
+     * @brief Performs a single-precision FFT on IQ samples stored in a contiguous buffer.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @return An (N, 2) float32 array containing the real and imaginary parts of the FFT output.
+     */
+    NDArray<std::complex<float>> fastFourierTransformFloat32(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type);
+
+    /**
+     * @brief Performs a single-precision FFT on IQ data read from a file within a specified sample range.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param start_sample The starting sample index.
+     * @param end_sample The ending sample index (exclusive).
+     * @param data_type The data type of the IQ samples.
+     * @return An (N, 2) float32 array containing the real and imaginary parts of the FFT output.
+     */
+    NDArray<std::complex<float>> fastFourierTransformFloat32(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type);
+
+    /**
+     * @brief Calculates the single-precision PSD of IQ data read from a file within a specified range.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param start_sample The starting sample index.
+     * @param end_sample The ending sample index (exclusive).
+     * @param data_type The data type of the IQ samples.
+     * @return A one-dimensional float32 array containing the PSD data.
+     */
+    NDArray<float> calculatePSDFloat32(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type);
+
+    /**
+     * @brief Calculates the single-precision PSD of IQ data read from a file.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param sampleRate The sampling rate of the IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return A one-dimensional float32 array containing the PSD data.
+     */
+    NDArray<float> calculatePSDFloat32(const std::string& input_file_path, double sampleRate, IQDataType data_type);
+
+    /**
+     * @brief Calculates the single-precision PSD of IQ samples stored in a contiguous buffer.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @param sampleRate The sampling rate of the IQ data.
+     * @return A one-dimensional float32 array containing the PSD data.
+     */
+    NDArray<float> calculatePSDFloat32(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, double sampleRate);
+
+    /**
+     * @brief Generates a single-precision IQ spectrogram from a file.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param overlap The number of overlapping samples between consecutive windows.
+     * @param window_size The window size for the FFT.
+     * @param sample_rate The sampling rate of the IQ data.
+     * @param data_type The data type of the IQ samples.
+     * @return A (num_windows, window_size) float32 array representing the spectrogram in dB.
+     */
+    NDArray<float> generateIQSpectrogramFloat32(const std::string& input_file_path, int overlap, int window_size, double sample_rate, IQDataType data_type);
+
+    /**
+     * @brief Generates a single-precision IQ spectrogram from IQ samples stored in a contiguous buffer.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     * @param overlap The number of overlapping samples between consecutive windows.
+     * @param window_size The window size for the FFT.
+     * @param sample_rate The sampling rate of the IQ data.
+     * @return A (num_windows, window_size) float32 array representing the spectrogram in dB.
+     */
+    NDArray<float> generateIQSpectrogramFloat32(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type, int overlap, int window_size, double sample_rate);
+
 private:
     /**
      * @brief Reads IQ samples from a file based on the specified data type.
@@ -201,6 +772,112 @@ private:
      */
     std::vector<std::complex<double>> readIQSamples(const std::string& input_file_path, IQDataType data_type, const std::vector<std::string>& csv_columns);
 
+    /**
+     * @brief Reads the IQ samples in [start_sample, end_sample) from a file.
+     *        Binary files (.iq or .bin) are memory-mapped and only the requested span is
+     *        read; other formats are read whole and sliced.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param start_sample The starting sample index.
+     * @param end_sample The ending sample index (exclusive), clipped to the file length.
+     * @param data_type The data type of the IQ samples.
+     * @return A vector of std::complex<double> containing the IQ samples (empty on error).
+     */
+    std::vector<std::complex<double>> readIQSamples(const std::string& input_file_path, int start_sample, int end_sample, IQDataType data_type);
+
+    /**
+     * @brief Reads the IQ samples in [start_sample, end_sample) from a file as std::complex<float>.
+     *        Binary files are converted straight from the mapping; other formats are read
+     *        with readIQSamples and narrowed.
+     *
+     * @param input_file_path The path to the file containing IQ data.
+     * @param start_sample The starting sample index.
+     * @param end_sample The ending sample index (exclusive), clipped to the file length.
+     * @param data_type The data type of the IQ samples.
+     * @return A vector of std::complex<float> containing the IQ samples (empty on error).
+     */
+    std::vector<std::complex<float>> readIQSamplesFloat32(const std::string& input_file_path, std::size_t start_sample, std::size_t end_sample, IQDataType data_type);
+
+    AnalyzerStats stats_;
+    FFTPlanCache plan_cache_;
+    FFTPlanCacheFloat32 plan_cache_float32_;
+    std::atomic<IQPrecision> precision_{IQPrecision::FLOAT64};
+};
+
+// ============================================================================
+// Incremental spectrogram for live IQ feeds. Samples are pushed in chunks of
+// any size and every complete window is returned by popRows() as a dB row,
+// scaled like generateIQSpectrogram. Only the samples that later windows still
+// need are kept, and the FFTW plans are cached, so each chunk costs O(chunk).
+// push and popRows may be called from different threads.
+// ============================================================================
+class StreamingSpectrogram {
+public:
+    /**
+     * @brief Creates a streaming spectrogram.
+     *
+     * @param window_size The window size for the FFT.
+     * @param overlap The number of overlapping samples between consecutive windows.
+     * @param sample_rate The sampling rate of the IQ data.
+     * @param scale_samples The number of samples the power is normalised by. Passing the
+     *        length of a capture reproduces generateIQSpectrogram on that capture
+     *        (default: 0, which normalises by window_size).
+     * @throws std::invalid_argument If the window, overlap or sample rate are invalid.
+     */
+    StreamingSpectrogram(int window_size, int overlap, double sample_rate, std::size_t scale_samples = 0);
+
+    StreamingSpectrogram(const StreamingSpectrogram&) = delete;
+    StreamingSpectrogram& operator=(const StreamingSpectrogram&) = delete;
+
+    /**
+     * @brief Appends IQ samples stored in a contiguous buffer.
+     *
+     * @param iq_buffer Pointer to the interleaved IQ samples.
+     * @param buffer_size The size of the buffer in bytes.
+     * @param data_type The data type of each real/imaginary value in the buffer.
+     */
+    void push(const void* iq_buffer, std::size_t buffer_size, IQDataType data_type);
+
+    /**
+     * @brief Appends IQ samples given as [real, imaginary] pairs.
+     *
+     * @param iq_samples A 2D vector of IQ samples.
+     */
+    void push(const std::vector<std::vector<double>>& iq_samples);
+
+    /**
+     * @brief Computes every complete window pushed so far and drops the samples no
+     *        later window needs.
+     *
+     * @return A (num_windows, window_size) array of dB rows (num_windows may be 0).
+     */
+    NDArray<double> popRows();
+
+    /**
+     * @brief Returns the number of complete windows that popRows would return.
+     */
+    std::size_t pendingRows() const;
+
+    /**
+     * @brief Returns the number of buffered samples.
+     */
+    std::size_t bufferedSamples() const;
+
+    /**
+     * @brief Drops the buffered samples.
+     */
+    void reset();
+
+private:
+    std::size_t windowCount() const;
+
+    int window_size_;
+    int overlap_;
+    double sample_rate_;
+    std::size_t scale_samples_;
+    std::vector<std::complex<double>> buffer_;
+    FFTPlanCache plans_;
+    mutable std::mutex mutex_;
 };
 
 #endif // ANALYZER_H
\ No newline at end of file
@@ -0,0 +1,123 @@
+#ifndef ANALYZER_STATS_H
+#define ANALYZER_STATS_H
+
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <map>
+#include <string>
+
+// ============================================================================
+// Stages of an analysis call, timed separately by AnalyzerStats
+// ============================================================================
+enum class AnalyzerStage {
+    READ,        // reading captures (mmap page faults, CSV parsing) and widening them to complex samples
+    CONVERT,     // converting caller buffers or lists to the working precision, windowing
+    PLAN,        // creating FFTW plans (cache misses only)
+    EXECUTE,     // executing FFTW plans
+    POSTPROCESS, // power, dB, averaging and feature computations on the transformed data
+    OUTPUT,      // building the nested std::vector results of the list-based methods
+    COUNT
+};
+
+// ============================================================================
+// Opt-in per-stage instrumentation: cumulative nanoseconds and call counts per
+// stage, bytes read from captures and FFTW plans created. Counters are relaxed
+// atomics, so stages running on several threads add up their thread time.
+// When disabled, each instrumentation point costs one relaxed atomic load.
+// ============================================================================
+class AnalyzerStats {
+public:
+    AnalyzerStats() { reset(); }
+
+    AnalyzerStats(const AnalyzerStats&) = delete;
+    AnalyzerStats& operator=(const AnalyzerStats&) = delete;
+
+    void setEnabled(bool enabled) { enabled_.store(enabled, std::memory_order_relaxed); }
+
+    bool enabled() const { return enabled_.load(std::memory_order_relaxed); }
+
+    void addStage(AnalyzerStage stage, std::uint64_t nanoseconds) {
+        std::size_t index = static_cast<std::size_t>(stage);
+        stage_ns_[index].fetch_add(nanoseconds, std::memory_order_relaxed);
+        stage_calls_[index].fetch_add(1, std::memory_order_relaxed);
+    }
+
+    void addBytesRead(std::uint64_t bytes) {
+        if (enabled()) {
+            bytes_read_.fetch_add(bytes, std::memory_order_relaxed);
+        }
+    }
+
+    void addPlanCreated() {
+        if (enabled()) {
+            plans_created_.fetch_add(1, std::memory_order_relaxed);
+        }
+    }
+
+    void reset() {
+        for (std::size_t i = 0; i < kNumStages; ++i) {
+            stage_ns_[i].store(0, std::memory_order_relaxed);
+            stage_calls_[i].store(0, std::memory_order_relaxed);
+        }
+        bytes_read_.store(0, std::memory_order_relaxed);
+        plans_created_.store(0, std::memory_order_relaxed);
+    }
+
+    /**
+     * @brief Returns the counters as "<stage>_ns" and "<stage>_calls" for every stage,
+     *        plus "bytes_read" and "plans_created".
+     */
+    std::map<std::string, unsigned long long> snapshot() const {
+        static const char* const names[kNumStages] = {"read", "convert", "plan", "execute", "postprocess", "output"};
+        std::map<std::string, unsigned long long> counters;
+        for (std::size_t i = 0; i < kNumStages; ++i) {
+            counters[std::string(names[i]) + "_ns"] = stage_ns_[i].load(std::memory_order_relaxed);
+            counters[std::string(names[i]) + "_calls"] = stage_calls_[i].load(std::memory_order_relaxed);
+        }
+        counters["bytes_read"] = bytes_read_.load(std::memory_order_relaxed);
+        counters["plans_created"] = plans_created_.load(std::memory_order_relaxed);
+        return counters;
+    }
+
+private:
+    static constexpr std::size_t kNumStages = static_cast<std::size_t>(AnalyzerStage::COUNT);
+
+    std::atomic<bool> enabled_{false};
+    std::array<std::atomic<std::uint64_t>, kNumStages> stage_ns_;
+    std::array<std::atomic<std::uint64_t>, kNumStages> stage_calls_;
+    std::atomic<std::uint64_t> bytes_read_;
+    std::atomic<std::uint64_t> plans_created_;
+};
+
+// ============================================================================
+// Times the enclosing scope as one call of a stage (no-op if stats is null or disabled)
+// ============================================================================
+class StageTimer {
+public:
+    StageTimer(AnalyzerStats* stats, AnalyzerStage stage)
+        : stats_(stats != nullptr && stats->enabled() ? stats : nullptr), stage_(stage) {
+        if (stats_ != nullptr) {
+            start_ = std::chrono::steady_clock::now();
+        }
+    }
+
+    ~StageTimer() {
+        if (stats_ != nullptr) {
+            auto elapsed = std::chrono::steady_clock::now() - start_;
+            stats_->addStage(stage_, static_cast<std::uint64_t>(std::chrono::duration_cast<std::chrono::nanoseconds>(elapsed).count()));
+        }
+    }
+
+    StageTimer(const StageTimer&) = delete;
+    StageTimer& operator=(const StageTimer&) = delete;
+
+private:
+    AnalyzerStats* stats_;
+    AnalyzerStage stage_;
+    std::chrono::steady_clock::time_point start_;
+};
+
+#endif // ANALYZER_STATS_H
@@ -0,0 +1,295 @@
+#include "fft_plan_cache.h"
+
+#include <algorithm>
+#include <cstdlib>
+#include <iostream>
+#include <mutex>
+#include <stdexcept>
+
+// ============================================================================
+// Maps the planning rigor to the corresponding FFTW planner flag
+// ============================================================================
+static unsigned planFlags(FFTPlanRigor rigor) {
+    switch (rigor) {
+        case FFTPlanRigor::ESTIMATE:
+            return FFTW_ESTIMATE;
+        case FFTPlanRigor::MEASURE:
+            return FFTW_MEASURE;
+        case FFTPlanRigor::PATIENT:
+            return FFTW_PATIENT;
+    }
+    std::cerr << "Error: Invalid FFT plan rigor specified." << std::endl;
+    throw std::invalid_argument("Invalid FFT plan rigor specified.");
+}
+
+// ============================================================================
+// Thin wrappers over the precision-specific FFTW functions
+// ============================================================================
+template <typename Real>
+struct FFTW;
+
+template <>
+struct FFTW<double> {
+    static fftw_complex* alloc(std::size_t n) { return fftw_alloc_complex(n); }
+    static void free(void* p) { fftw_free(p); }
+    static int alignmentOf(double* p) { return fftw_alignment_of(p); }
+    static int initThreads() { return fftw_init_threads(); }
+    static void planWithNthreads(int n) { fftw_plan_with_nthreads(n); }
+    static fftw_plan planMany(int* size, int howmany, fftw_complex* in, int idist, fftw_complex* out, int odist, unsigned flags) {
+        return fftw_plan_many_dft(1, size, howmany, in, nullptr, 1, idist, out, nullptr, 1, odist, FFTW_FORWARD, flags);
+    }
+    static void execute(fftw_plan p, fftw_complex* in, fftw_complex* out) { fftw_execute_dft(p, in, out); }
+    static void destroy(fftw_plan p) { fftw_destroy_plan(p); }
+    static int importWisdom(const char* path) { return fftw_import_wisdom_from_filename(path); }
+    static int exportWisdom(const char* path) { return fftw_export_wisdom_to_filename(path); }
+};
+
+template <>
+struct FFTW<float> {
+    static fftwf_complex* alloc(std::size_t n) { return fftwf_alloc_complex(n); }
+    static void free(void* p) { fftwf_free(p); }
+    static int alignmentOf(float* p) { return fftwf_alignment_of(p); }
+    static int initThreads() { return fftwf_init_threads(); }
+    static void planWithNthreads(int n) { fftwf_plan_with_nthreads(n); }
+    static fftwf_plan planMany(int* size, int howmany, fftwf_complex* in, int idist, fftwf_complex* out, int odist, unsigned flags) {
+        return fftwf_plan_many_dft(1, size, howmany, in, nullptr, 1, idist, out, nullptr, 1, odist, FFTW_FORWARD, flags);
+    }
+    static void execute(fftwf_plan p, fftwf_complex* in, fftwf_complex* out) { fftwf_execute_dft(p, in, out); }
+    static void destroy(fftwf_plan p) { fftwf_destroy_plan(p); }
+    static int importWisdom(const char* path) { return fftwf_import_wisdom_from_filename(path); }
+    static int exportWisdom(const char* path) { return fftwf_export_wisdom_to_filename(path); }
+};
+
+// ============================================================================
+// The FFTW planner is not thread-safe: only fftw_execute* may run concurrently,
+// so every other FFTW call that touches planner state goes through this lock
+// ============================================================================
+static std::mutex& plannerMutex() {
+    static std::mutex mutex;
+    return mutex;
+}
+
+// ============================================================================
+// Initialises the FFTW threads backend of a precision once per process
+// ============================================================================
+template <typename Real>
+static void initFFTWThreads() {
+    static std::once_flag initialised;
+    std::call_once(initialised, []() {
+        if (FFTW<Real>::initThreads() == 0) {
+            std::cerr << "Error: FFTW threads could not be initialised." << std::endl;
+        }
+    });
+}
+
+// ============================================================================
+// Parses a positive thread count from an environment variable (0 if unset or invalid)
+// ============================================================================
+static int threadsFromEnvironment(const char* name) {
+    const char* value = std::getenv(name);
+    if (value == nullptr) {
+        return 0;
+    }
+    char* end = nullptr;
+    long num_threads = std::strtol(value, &end, 10);
+    if (end == value || num_threads <= 0) {
+        return 0;
+    }
+    return static_cast<int>(std::min<long>(num_threads, 1024));
+}
+
+template <typename Real>
+int BasicFFTPlanCache<Real>::defaultNumThreads() {
+    for (const char* name : {"LIBIQ_NUM_THREADS", "OMP_NUM_THREADS"}) {
+        int num_threads = threadsFromEnvironment(name);
+        if (num_threads > 0) {
+            return num_threads;
+        }
+    }
+    return 1;
+}
+
+template <typename Real>
+BasicFFTPlanCache<Real>::~BasicFFTPlanCache() {
+    clear();
+}
+
+template <typename Real>
+void BasicFFTPlanCache<Real>::setRigor(FFTPlanRigor rigor) {
+    planFlags(rigor);
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (rigor != rigor_) {
+        plans_.clear();
+        rigor_ = rigor;
+    }
+}
+
+template <typename Real>
+void BasicFFTPlanCache<Real>::setNumThreads(int num_threads) {
+    if (num_threads < 1) {
+        std::cerr << "Error: num_threads must be >= 1." << std::endl;
+        throw std::invalid_argument("num_threads must be >= 1.");
+    }
+    num_threads_ = num_threads;
+}
+
+template <typename Real>
+void BasicFFTPlanCache<Real>::clear() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    plans_.clear();
+}
+
+template <typename Real>
+std::size_t BasicFFTPlanCache<Real>::size() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return plans_.size();
+}
+
+template <typename Real>
+std::complex<Real>* BasicFFTPlanCache<Real>::allocate(std::size_t count) {
+    auto* data = FFTW<Real>::alloc(count);
+    if (data == nullptr) {
+        throw std::bad_alloc();
+    }
+    return reinterpret_cast<std::complex<Real>*>(data);
+}
+
+template <typename Real>
+void BasicFFTPlanCache<Real>::deallocate(std::complex<Real>* data) {
+    FFTW<Real>::free(data);
+}
+
+template <typename Real>
+typename BasicFFTPlanCache<Real>::PlanHandle BasicFFTPlanCache<Real>::plan(int size, int howmany, int input_distance, int num_threads) {
+    using Complex = typename FFTWTraits<Real>::Complex;
+    PlanKey key(size, howmany, input_distance, num_threads);
+    FFTPlanRigor rigor;
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        auto it = plans_.find(key);
+        if (it != plans_.end()) {
+            return it->second;
+        }
+        rigor = rigor_;
+    }
+    // Planning (seconds with MEASURE/PATIENT) runs without the cache mutex, so lookups of
+    // sizes that are already planned are not blocked behind it
+    StageTimer timer(stats_, AnalyzerStage::PLAN);
+    std::size_t input_span = static_cast<std::size_t>(howmany - 1) * input_distance + size;
+    Complex* in = FFTW<Real>::alloc(input_span);
+    Complex* out = FFTW<Real>::alloc(static_cast<std::size_t>(howmany) * size);
+    if (in == nullptr || out == nullptr) {
+        FFTW<Real>::free(in);
+        FFTW<Real>::free(out);
+        throw std::bad_alloc();
+    }
+    Plan p = nullptr;
+    {
+        std::lock_guard<std::mutex> planner_lock(plannerMutex());
+        if (num_threads > 1) {
+            initFFTWThreads<Real>();
+        }
+        FFTW<Real>::planWithNthreads(num_threads);
+        p = FFTW<Real>::planMany(&size, howmany, in, input_distance, out, size, planFlags(rigor));
+    }
+    FFTW<Real>::free(in);
+    FFTW<Real>::free(out);
+    if (p == nullptr) {
+        std::cerr << "Error: FFTW could not create a plan of size " << size << "." << std::endl;
+        throw std::runtime_error("FFTW planning failed.");
+    }
+    PlanHandle handle(p, [](Plan plan) {
+        std::lock_guard<std::mutex> planner_lock(plannerMutex());
+        FFTW<Real>::destroy(plan);
+    });
+    if (stats_ != nullptr) {
+        stats_->addPlanCreated();
+    }
+    std::lock_guard<std::mutex> lock(mutex_);
+    if (rigor != rigor_) {
+        // setRigor() cleared the cache meanwhile: use the plan for this call without caching it
+        return handle;
+    }
+    // Another thread may have planned the same key meanwhile; its plan is kept and shared
+    return plans_.emplace(key, handle).first->second;
+}
+
+template <typename Real>
+void BasicFFTPlanCache<Real>::executeForward(const std::complex<Real>* input, std::complex<Real>* output, std::size_t size) {
+    if (size == 0) {
+        return;
+    }
+    int num_threads = size >= kThreadedFFTMinSize ? num_threads_.load() : 1;
+    PlanHandle p = plan(static_cast<int>(size), 1, static_cast<int>(size), num_threads);
+    execute(p.get(), input, output, size, 1, size);
+}
+
+template <typename Real>
+void BasicFFTPlanCache<Real>::planForwardBatch(std::size_t size, std::size_t howmany, std::size_t input_distance) {
+    if (size == 0 || howmany == 0) {
+        return;
+    }
+    plan(static_cast<int>(size), static_cast<int>(howmany), static_cast<int>(input_distance), 1);
+}
+
+template <typename Real>
+void BasicFFTPlanCache<Real>::executeForwardBatch(const std::complex<Real>* input, std::complex<Real>* output,
+                                                  std::size_t size, std::size_t howmany, std::size_t input_distance) {
+    if (size == 0 || howmany == 0) {
+        return;
+    }
+    PlanHandle p = plan(static_cast<int>(size), static_cast<int>(howmany), static_cast<int>(input_distance), 1);
+    execute(p.get(), input, output, size, howmany, input_distance);
+}
+
+template <typename Real>
+void BasicFFTPlanCache<Real>::execute(Plan p, const std::complex<Real>* input, std::complex<Real>* output,
+                                      std::size_t size, std::size_t howmany, std::size_t input_distance) {
+    using Complex = typename FFTWTraits<Real>::Complex;
+    StageTimer timer(stats_, AnalyzerStage::EXECUTE);
+    Complex* in = reinterpret_cast<Complex*>(const_cast<std::complex<Real>*>(input));
+    Complex* out = reinterpret_cast<Complex*>(output);
+    if (FFTW<Real>::alignmentOf(reinterpret_cast<Real*>(in)) == 0 && FFTW<Real>::alignmentOf(reinterpret_cast<Real*>(out)) == 0) {
+        FFTW<Real>::execute(p, in, out);
+        return;
+    }
+
+    // The plan was made on SIMD-aligned buffers, so unaligned data goes through aligned copies
+    std::size_t input_span = (howmany - 1) * input_distance + size;
+    std::size_t output_span = howmany * size;
+    Complex* aligned_in = FFTW<Real>::alloc(input_span);
+    Complex* aligned_out = FFTW<Real>::alloc(output_span);
+    if (aligned_in == nullptr || aligned_out == nullptr) {
+        FFTW<Real>::free(aligned_in);
+        FFTW<Real>::free(aligned_out);
+        throw std::bad_alloc();
+    }
+    std::copy(input, input + input_span, reinterpret_cast<std::complex<Real>*>(aligned_in));
+    FFTW<Real>::execute(p, aligned_in, aligned_out);
+    std::copy(reinterpret_cast<std::complex<Real>*>(aligned_out), reinterpret_cast<std::complex<Real>*>(aligned_out) + output_span, output);
+    FFTW<Real>::free(aligned_in);
+    FFTW<Real>::free(aligned_out);
+}
+
+template <typename Real>
+bool BasicFFTPlanCache<Real>::importWisdom(const std::string& wisdom_file_path) {
+    std::lock_guard<std::mutex> planner_lock(plannerMutex());
+    if (FFTW<Real>::importWisdom(wisdom_file_path.c_str()) == 0) {
+        std::cerr << "Error: Cannot import FFTW wisdom from: " << wisdom_file_path << std::endl;
+        return false;
+    }
+    return true;
+}
+
+template <typename Real>
+bool BasicFFTPlanCache<Real>::exportWisdom(const std::string& wisdom_file_path) {
+    std::lock_guard<std::mutex> planner_lock(plannerMutex());
+    if (FFTW<Real>::exportWisdom(wisdom_file_path.c_str()) == 0) {
+        std::cerr << "Error: Cannot export FFTW wisdom to: " << wisdom_file_path << std::endl;
+        return false;
+    }
+    return true;
+}
+
+template class BasicFFTPlanCache<double>;
+template class BasicFFTPlanCache<float>;
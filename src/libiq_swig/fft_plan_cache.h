@@ -0,0 +1,208 @@
+#ifndef FFT_PLAN_CACHE_H
+#define FFT_PLAN_CACHE_H
+
+#include <atomic>
+#include <complex>
+#include <cstddef>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <tuple>
+#include <type_traits>
+#include <fftw3.h>
+#include "analyzer_stats.h"
+
+// ============================================================================
+// Enum to specify how thoroughly FFTW searches for a fast plan
+// ============================================================================
+enum class FFTPlanRigor {
+    ESTIMATE,
+    MEASURE,
+    PATIENT
+};
+
+// ============================================================================
+// FFTW API for each precision: fftw_* for double, fftwf_* for float
+// ============================================================================
+template <typename Real>
+struct FFTWTraits;
+
+template <>
+struct FFTWTraits<double> {
+    using Complex = fftw_complex;
+    using Plan = fftw_plan;
+};
+
+template <>
+struct FFTWTraits<float> {
+    using Complex = fftwf_complex;
+    using Plan = fftwf_plan;
+};
+
+// ============================================================================
+// Cache of forward complex-to-complex FFTW plans, one per transform layout
+// (size, number of transforms, input distance, threads). Plans are created on
+// scratch buffers and executed with the new-array interface, so planning with
+// MEASURE/PATIENT never overwrites caller data. Single transforms of at least
+// kThreadedFFTMinSize points are planned with the FFTW threads backend.
+// Real selects the precision: double (fftw_*) or float (fftwf_*).
+//
+// The cache is thread-safe: lookups are guarded by a per-cache mutex that is
+// released while a missing plan is created, every call into the FFTW planner
+// (plan creation and destruction, thread setup, wisdom) is serialised by a
+// process-wide mutex, and plans are reference counted so clear() or setRigor()
+// never destroys a plan that is executing. When two threads plan the same key
+// at once, the first plan inserted is kept.
+// ============================================================================
+template <typename Real>
+class BasicFFTPlanCache {
+public:
+    using Plan = typename FFTWTraits<Real>::Plan;
+
+    BasicFFTPlanCache() {}
+    ~BasicFFTPlanCache();
+
+    BasicFFTPlanCache(const BasicFFTPlanCache&) = delete;
+    BasicFFTPlanCache& operator=(const BasicFFTPlanCache&) = delete;
+
+    /**
+     * @brief Sets the planning rigor used for new plans and drops the cached ones.
+     *
+     * @param rigor The FFTW planning rigor.
+     */
+    void setRigor(FFTPlanRigor rigor);
+
+    /**
+     * @brief Returns the planning rigor used for new plans.
+     */
+    FFTPlanRigor rigor() const { return rigor_.load(); }
+
+    /**
+     * @brief Sets the number of threads used by large transforms and by callers
+     *        that parallelise over batches.
+     *
+     * @param num_threads The number of threads (>= 1).
+     * @throws std::invalid_argument If num_threads is smaller than 1.
+     */
+    void setNumThreads(int num_threads);
+
+    /**
+     * @brief Returns the number of threads used by large transforms.
+     */
+    int numThreads() const { return num_threads_; }
+
+    /**
+     * @brief Returns the default number of threads, read from LIBIQ_NUM_THREADS,
+     *        then OMP_NUM_THREADS, and 1 if neither is set to a positive integer.
+     */
+    static int defaultNumThreads();
+
+    /**
+     * @brief Executes a forward FFT of the given size, planning it on first use.
+     *        Transforms of at least kThreadedFFTMinSize points use numThreads() threads.
+     *
+     * @param input Pointer to size complex input samples.
+     * @param output Pointer to size complex output bins (must not alias input).
+     * @param size The transform size.
+     */
+    void executeForward(const std::complex<Real>* input, std::complex<Real>* output, std::size_t size);
+
+    /**
+     * @brief Creates the single-threaded plan used by executeForwardBatch for this layout.
+     *        Once planned, concurrent executeForwardBatch calls with the same layout only
+     *        read the cache and are safe to run from several threads.
+     *
+     * @param size The transform size.
+     * @param howmany The number of transforms.
+     * @param input_distance The distance in samples between the starts of consecutive transforms.
+     */
+    void planForwardBatch(std::size_t size, std::size_t howmany, std::size_t input_distance);
+
+    /**
+     * @brief Executes howmany forward FFTs of the same size with a single-threaded FFTW plan.
+     *        Transform i reads size samples starting at input + i * input_distance, so
+     *        overlapping windows of one contiguous buffer are transformed without copying,
+     *        and writes its bins to output + i * size.
+     *
+     * @param input Pointer to the first input sample.
+     * @param output Pointer to howmany * size complex output bins (must not alias input).
+     * @param size The transform size.
+     * @param howmany The number of transforms.
+     * @param input_distance The distance in samples between the starts of consecutive transforms.
+     */
+    void executeForwardBatch(const std::complex<Real>* input, std::complex<Real>* output,
+                             std::size_t size, std::size_t howmany, std::size_t input_distance);
+
+    /**
+     * @brief Allocates SIMD-aligned storage for count complex values (throws std::bad_alloc).
+     */
+    static std::complex<Real>* allocate(std::size_t count);
+
+    /**
+     * @brief Releases storage obtained from allocate.
+     */
+    static void deallocate(std::complex<Real>* data);
+
+    /**
+     * @brief Reports plan creation (PLAN stage, plans_created) and plan execution (EXECUTE stage)
+     *        to stats, which must outlive the cache (nullptr disables reporting).
+     */
+    void setStats(AnalyzerStats* stats) { stats_ = stats; }
+
+    /**
+     * @brief Returns the stats the cache reports to (may be nullptr).
+     */
+    AnalyzerStats* stats() const { return stats_; }
+
+    /**
+     * @brief Number of plans currently cached.
+     */
+    std::size_t size() const;
+
+    /**
+     * @brief Destroys all cached plans.
+     */
+    void clear();
+
+    /**
+     * @brief Imports FFTW wisdom of this precision from a file, so later plans reuse earlier measurements.
+     *
+     * @param wisdom_file_path The path to the wisdom file.
+     * @return true if the wisdom was imported.
+     */
+    static bool importWisdom(const std::string& wisdom_file_path);
+
+    /**
+     * @brief Exports the accumulated FFTW wisdom of this precision to a file.
+     *
+     * @param wisdom_file_path The path to the wisdom file.
+     * @return true if the wisdom was exported.
+     */
+    static bool exportWisdom(const std::string& wisdom_file_path);
+
+    /**
+     * @brief Minimum size of a single transform planned with several threads;
+     *        smaller transforms do not amortise the thread synchronisation.
+     */
+    static constexpr std::size_t kThreadedFFTMinSize = 1 << 15;
+
+private:
+    using PlanKey = std::tuple<int, int, int, int>;
+    using PlanHandle = std::shared_ptr<std::remove_pointer_t<Plan>>;
+
+    PlanHandle plan(int size, int howmany, int input_distance, int num_threads);
+    void execute(Plan p, const std::complex<Real>* input, std::complex<Real>* output,
+                 std::size_t size, std::size_t howmany, std::size_t input_distance);
+
+    mutable std::mutex mutex_;
+    std::map<PlanKey, PlanHandle> plans_;
+    std::atomic<FFTPlanRigor> rigor_{FFTPlanRigor::ESTIMATE};
+    std::atomic<int> num_threads_{defaultNumThreads()};
+    AnalyzerStats* stats_ = nullptr;
+};
+
+using FFTPlanCache = BasicFFTPlanCache<double>;
+using FFTPlanCacheFloat32 = BasicFFTPlanCache<float>;
+
+#endif // FFT_PLAN_CACHE_H
@@ -1,22 +1,371 @@
-%module libiqwrapped
+%module(threads="1") libiqwrapped
 
 %{
+#define SWIG_FILE_WITH_INIT
 #include "analyzer.h"
 #include <vector>
 #include <array>
 #include <complex>
+#include <numpy/arrayobject.h>
 %}
 
+// ============================================================================
+// GIL release: the analysis methods run without the GIL so Python threads can
+// use one or several Analyzers concurrently. Everything else (STL container
+// wrappers, IQCapture::array, ...) keeps the GIL because it touches Python objects.
+// ============================================================================
+%nothread;
+%thread Analyzer::fastFourierTransform;
+%thread Analyzer::calculatePSD;
+%thread Analyzer::generateIQSpectrogram;
+%thread Analyzer::realPartIQSamples;
+%thread Analyzer::imaginaryPartIQSamples;
+%thread Analyzer::getIQSamples;
+%thread Analyzer::fastFourierTransformArray;
+%thread Analyzer::calculatePSDArray;
+%thread Analyzer::calculateWelchPSD;
+%thread Analyzer::calculateWelchPSDArray;
+%thread Analyzer::generateIQSpectrogramArray;
+%thread Analyzer::extractFeaturesArray;
+%thread Analyzer::extractFeaturesInto;
+// Wrapped by Analyzer.extractFeaturesInto below, which also accepts NumPy arrays
+%rename(_extractFeaturesInto) Analyzer::extractFeaturesInto;
+%thread Analyzer::realPartIQSamplesArray;
+%thread Analyzer::imaginaryPartIQSamplesArray;
+%thread Analyzer::getIQSamplesArray;
+%thread Analyzer::fastFourierTransformFloat32;
+%thread Analyzer::calculatePSDFloat32;
+%thread Analyzer::generateIQSpectrogramFloat32;
+%thread Analyzer::importFFTWisdom;
+%thread Analyzer::exportFFTWisdom;
+%thread IQCapture::IQCapture;
+%thread StreamingSpectrogram::push;
+%thread StreamingSpectrogram::popRows;
+
 %include "std_string.i"
 %include "std_vector.i"
+%include "std_map.i"
 %include "stdint.i"
 %include "std_array.i"
 %include "std_complex.i"
+%include "exception.i"
+
+%init %{
+import_array();
+%}
+
+// C++ exceptions are raised as Python exceptions instead of aborting the interpreter
+%exception {
+    try {
+        $action
+    } catch (const std::invalid_argument& e) {
+        SWIG_exception(SWIG_ValueError, e.what());
+    } catch (const std::exception& e) {
+        SWIG_exception(SWIG_RuntimeError, e.what());
+    }
+}
 
 %template(StringVector) std::vector<std::string>;
 %template(DoubleVector) std::vector<double>;
 %template(VectorOfDoubleVector) std::vector<std::vector<double>>;
 %template(DoubleArray) std::array<double, 2>;
 %template(ComplexVector) std::vector<std::array<double, 2>>;
+%template(StatsMap) std::map<std::string, unsigned long long>;
+
+// ============================================================================
+// NumPy interface
+// ============================================================================
+%{
+// Holds a Py_buffer acquired from a Python object for the duration of a call
+struct PyBufferGuard {
+    Py_buffer view;
+    bool acquired = false;
+    ~PyBufferGuard() {
+        if (acquired) {
+            PyBuffer_Release(&view);
+        }
+    }
+};
+
+template <typename T>
+static void releaseNDArrayStorage(PyObject* capsule) {
+    delete static_cast<std::vector<T>*>(PyCapsule_GetPointer(capsule, NULL));
+}
+
+// Hands the storage of data over to a new NumPy array without copying it
+template <typename T>
+static PyObject* ndarrayFromVector(std::vector<T>&& data, int nd, npy_intp* dims, int typenum) {
+    if (data.empty()) {
+        return PyArray_ZEROS(nd, dims, typenum, 0);
+    }
+    std::vector<T>* storage = new std::vector<T>(std::move(data));
+    PyObject* array = PyArray_SimpleNewFromData(nd, dims, typenum, static_cast<void*>(storage->data()));
+    if (array == NULL) {
+        delete storage;
+        return NULL;
+    }
+    PyObject* capsule = PyCapsule_New(storage, NULL, releaseNDArrayStorage<T>);
+    if (capsule == NULL) {
+        Py_DECREF(array);
+        delete storage;
+        return NULL;
+    }
+    if (PyArray_SetBaseObject(reinterpret_cast<PyArrayObject*>(array), capsule) < 0) {
+        Py_DECREF(array);
+        return NULL;
+    }
+    return array;
+}
+%}
+
+// Contiguous buffers (NumPy arrays, memoryviews, ...) are read in place
+%typemap(in) (const void* iq_buffer, std::size_t buffer_size) (PyBufferGuard guard) {
+    if (PyObject_GetBuffer($input, &guard.view, PyBUF_C_CONTIGUOUS) != 0) {
+        SWIG_fail;
+    }
+    guard.acquired = true;
+    $1 = guard.view.buf;
+    $2 = static_cast<std::size_t>(guard.view.len);
+}
+
+%typemap(typecheck, precedence=SWIG_TYPECHECK_POINTER) (const void* iq_buffer, std::size_t buffer_size) {
+    $1 = PyObject_CheckBuffer($input) ? 1 : 0;
+}
+
+// Writable contiguous buffers (e.g. a preallocated float32 NumPy array) receive results in place
+%typemap(in) (void* features_buffer, std::size_t features_size) (PyBufferGuard guard) {
+    if (PyObject_GetBuffer($input, &guard.view, PyBUF_C_CONTIGUOUS | PyBUF_WRITABLE) != 0) {
+        SWIG_fail;
+    }
+    guard.acquired = true;
+    $1 = guard.view.buf;
+    $2 = static_cast<std::size_t>(guard.view.len);
+}
+
+%typemap(typecheck, precedence=SWIG_TYPECHECK_POINTER) (void* features_buffer, std::size_t features_size) {
+    $1 = PyObject_CheckBuffer($input) ? 1 : 0;
+}
+
+%typemap(out) NDArray<double> {
+    npy_intp dims[2] = { static_cast<npy_intp>((&$1)->rows), static_cast<npy_intp>((&$1)->cols) };
+    $result = ndarrayFromVector(std::move((&$1)->data), (&$1)->cols == 0 ? 1 : 2, dims, NPY_DOUBLE);
+    if ($result == NULL) SWIG_fail;
+}
+
+%typemap(out) NDArray<std::complex<double>> {
+    npy_intp dims[2] = { static_cast<npy_intp>((&$1)->rows), 2 };
+    $result = ndarrayFromVector(std::move((&$1)->data), 2, dims, NPY_DOUBLE);
+    if ($result == NULL) SWIG_fail;
+}
+
+%typemap(out) NDArray<float> {
+    npy_intp dims[2] = { static_cast<npy_intp>((&$1)->rows), static_cast<npy_intp>((&$1)->cols) };
+    $result = ndarrayFromVector(std::move((&$1)->data), (&$1)->cols == 0 ? 1 : 2, dims, NPY_FLOAT);
+    if ($result == NULL) SWIG_fail;
+}
+
+%typemap(out) NDArray<std::complex<float>> {
+    npy_intp dims[2] = { static_cast<npy_intp>((&$1)->rows), 2 };
+    $result = ndarrayFromVector(std::move((&$1)->data), 2, dims, NPY_FLOAT);
+    if ($result == NULL) SWIG_fail;
+}
+
+%pythonbegin %{
+import numpy as np
+
+from libiq._batch import AnalyzerBatchMixin
+%}
+
+// NumPy arrays passed to the list-based methods are routed to the array overloads
+%pythonprepend Analyzer::fastFourierTransform %{
+    if args and isinstance(args[0], np.ndarray):
+        return self.fastFourierTransformArray(*_iq_buffer(args[0]), *args[1:])
+%}
+
+%pythonprepend Analyzer::calculatePSD %{
+    if args and isinstance(args[0], np.ndarray):
+        return self.calculatePSDArray(*_iq_buffer(args[0]), *args[1:])
+%}
+
+%pythonprepend Analyzer::calculateWelchPSD %{
+    if args and isinstance(args[0], np.ndarray):
+        return self.calculateWelchPSDArray(*_iq_buffer(args[0]), *args[1:])
+%}
+
+%pythonprepend Analyzer::generateIQSpectrogram %{
+    if args and isinstance(args[0], np.ndarray):
+        return self.generateIQSpectrogramArray(*_iq_buffer(args[0]), *args[1:])
+%}
+
+// Analyzers set to IQPrecision::FLOAT32 route the array methods to the single-precision path
+%pythonprepend Analyzer::fastFourierTransformArray %{
+    if self.getPrecision() == IQPrecision_FLOAT32:
+        return self.fastFourierTransformFloat32(*args)
+%}
+
+%pythonprepend Analyzer::calculatePSDArray %{
+    if self.getPrecision() == IQPrecision_FLOAT32:
+        return self.calculatePSDFloat32(*args)
+%}
+
+%pythonprepend Analyzer::generateIQSpectrogramArray %{
+    if self.getPrecision() == IQPrecision_FLOAT32:
+        return self.generateIQSpectrogramFloat32(*args)
+%}
+
+%pythonprepend Analyzer::extractFeaturesArray %{
+    if len(args) == 2 and isinstance(args[0], np.ndarray):
+        return self.extractFeaturesArray(*_iq_buffer(args[0]), args[1])
+%}
+
+%pythonprepend Analyzer::realPartIQSamples %{
+    if args and isinstance(args[0], np.ndarray):
+        return self.realPartIQSamplesArray(*_iq_buffer(args[0]), *args[1:])
+%}
+
+%pythonprepend Analyzer::imaginaryPartIQSamples %{
+    if args and isinstance(args[0], np.ndarray):
+        return self.imaginaryPartIQSamplesArray(*_iq_buffer(args[0]), *args[1:])
+%}
+
+%extend Analyzer {
+%pythoncode %{
+    def extractFeaturesInto(self, iq_samples, *args):
+        """
+        Write the CNN input features into a preallocated float32 (N, 4) array.
+
+        Called as (iq_array, magnitude_floor, out) or (iq_buffer, data_type, magnitude_floor, out).
+
+        Returns: the number of rows written.
+        """
+        if len(args) == 2 and isinstance(iq_samples, np.ndarray):
+            return self._extractFeaturesInto(*_iq_buffer(iq_samples), args[0], _features_out(args[1]))
+        data_type, magnitude_floor, out = args
+        return self._extractFeaturesInto(iq_samples, data_type, magnitude_floor, _features_out(out))
+%}
+}
+
+// ============================================================================
+// Batch analysis of many files and per-stage statistics as a nested dict. The
+// analysis methods release the GIL and the Analyzer is thread-safe, so a pool of
+// worker threads reads and transforms several captures at once while Python only
+// hands out paths and collects results.
+// ============================================================================
+%extend Analyzer {
+%pythoncode %{
+    # Shared with the NumPy backend (libiq._batch)
+    process_files = AnalyzerBatchMixin.process_files
+    stats = AnalyzerBatchMixin.stats
+    reset_stats = AnalyzerBatchMixin.reset_stats
+%}
+}
 
+// ============================================================================
+// Memory-mapped captures
+// ============================================================================
+%{
+static void releaseMappedFile(PyObject* capsule) {
+    delete static_cast<std::shared_ptr<const MappedFile>*>(PyCapsule_GetPointer(capsule, NULL));
+}
+%}
+
+%ignore MappedFile;
+%ignore IQCapture::data;
+%ignore IQCapture::mapping;
+%ignore IQCapture::readSamples;
+
+%extend IQCapture {
+    /**
+     * @brief Returns a read-only (N, 2) NumPy array of [real, imaginary] values backed by
+     *        the mapping, in the capture data type (int16, float32 or float64).
+     *        The mapping stays alive for as long as the array does.
+     */
+    PyObject* array() {
+        int typenum = NPY_DOUBLE;
+        if ($self->dataType() == IQDataType::FLOAT32) {
+            typenum = NPY_FLOAT;
+        } else if ($self->dataType() == IQDataType::INT16) {
+            typenum = NPY_INT16;
+        }
+        npy_intp dims[2] = { static_cast<npy_intp>($self->numSamples()), 2 };
+        if (dims[0] == 0) {
+            return PyArray_ZEROS(2, dims, typenum, 0);
+        }
+        PyObject* array = PyArray_New(&PyArray_Type, 2, dims, typenum, NULL,
+                                      const_cast<void*>($self->data()), 0, NPY_ARRAY_C_CONTIGUOUS | NPY_ARRAY_ALIGNED, NULL);
+        if (array == NULL) {
+            return NULL;
+        }
+        auto* owner = new std::shared_ptr<const MappedFile>($self->mapping());
+        PyObject* capsule = PyCapsule_New(owner, NULL, releaseMappedFile);
+        if (capsule == NULL) {
+            Py_DECREF(array);
+            delete owner;
+            return NULL;
+        }
+        if (PyArray_SetBaseObject(reinterpret_cast<PyArrayObject*>(array), capsule) < 0) {
+            Py_DECREF(array);
+            return NULL;
+        }
+        return array;
+    }
+}
+
+%pythonprepend StreamingSpectrogram::push %{
+    if len(args) == 1 and isinstance(args[0], np.ndarray):
+        return self.push(*_iq_buffer(args[0]))
+%}
+
+%extend StreamingSpectrogram {
+%pythoncode %{
+    pop_rows = popRows
+%}
+}
+
+%ignore FFTWTraits;
+%ignore BasicFFTPlanCache;
+%ignore FFTPlanCache;
+%ignore FFTPlanCacheFloat32;
+%include "fft_plan_cache.h"
 %include "analyzer.h"
+
+%pythoncode %{
+_IQ_ARRAY_TYPES = {
+    np.dtype(np.complex64): IQDataType_FLOAT32,
+    np.dtype(np.complex128): IQDataType_FLOAT64,
+    np.dtype(np.float32): IQDataType_FLOAT32,
+    np.dtype(np.float64): IQDataType_FLOAT64,
+    np.dtype(np.int16): IQDataType_INT16,
+}
+
+
+def _iq_buffer(iq_samples):
+    """
+    Return a C-contiguous view of an IQ array and the IQDataType of its values.
+
+    Accepts complex64/complex128 arrays and (N, 2) float32/float64/int16 arrays of
+    [real, imaginary] pairs. Contiguous inputs are passed through without copying.
+    """
+    array = np.asarray(iq_samples)
+    data_type = _IQ_ARRAY_TYPES.get(array.dtype)
+    if data_type is None or (
+        not np.iscomplexobj(array) and (array.ndim != 2 or array.shape[1] != 2)
+    ):
+        raise ValueError(
+            "Expected a complex64/complex128 array or an (N, 2) float32/float64/int16 array, "
+            f"received dtype {array.dtype} with shape {array.shape}."
+        )
+    return np.ascontiguousarray(array), data_type
+
+
+def _features_out(out):
+    """
+    Check that out can receive feature rows in place: a C-contiguous float32 (N, 4) array.
+    """
+    if not (
+        isinstance(out, np.ndarray) and out.dtype == np.float32 and out.ndim == 2
+        and out.shape[1] == 4 and out.flags.c_contiguous and out.flags.writeable
+    ):
+        raise ValueError("Expected a writable C-contiguous float32 array of shape (N, 4) for the features.")
+    return out
+%}